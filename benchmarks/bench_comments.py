@@ -0,0 +1,26 @@
+'''
+Parse time of a heavily commented schema compared with the same schema
+without comments.
+
+    python -m benchmarks.bench_comments [tables]
+'''
+import sys
+from time import perf_counter
+
+from benchmarks.schema import generate_schema
+
+from pydbml import PyDBML
+
+
+def main() -> None:
+    tables = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    for name, comments in (('plain', False), ('commented', True)):
+        source = generate_schema(tables, comments=comments)
+        start = perf_counter()
+        PyDBML.parse(source)
+        elapsed = perf_counter() - start
+        print(f'{name:<10} {len(source) / 1024:>8.1f} KiB {elapsed * 1000:>9.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+'''
+Measure memory taken by a parsed Database, parse peak in the default and
+low-memory modes and how many distinct string objects hold the repeated
+values (schema names, column types, reference options).
+
+    python -m benchmarks.bench_memory [tables]
+'''
+import gc
+import sys
+import tracemalloc
+from typing import Iterable
+from typing import Tuple
+
+from benchmarks.schema import generate_schema
+
+from pydbml import PyDBML
+
+
+def distinct(values: Iterable[object]) -> str:
+    values = [v for v in values if isinstance(v, str)]
+    return f'{len(values):>7} values, {len({id(v) for v in values}):>6} objects'
+
+
+def measure(source: str, low_memory: bool) -> Tuple[int, int]:
+    '''Return memory held by the parsed database and parse peak in bytes.'''
+    gc.collect()
+    tracemalloc.start()
+    db = PyDBML.parse(source, low_memory=low_memory)  # noqa: F841
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, peak
+
+
+def main() -> None:
+    tables = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    source = generate_schema(tables)
+
+    current, peak = measure(source, low_memory=False)
+    _, low_memory_peak = measure(source, low_memory=True)
+    db = PyDBML.parse(source)
+
+    columns = [c for t in db.tables for c in t.columns]
+    print(f'{tables} tables, {len(columns)} columns, {len(db.refs)} refs')
+    print(f'database size: {current / 2 ** 20:>8.2f} MiB')
+    print(f'parse peak:    {peak / 2 ** 20:>8.2f} MiB')
+    print(f'low-memory:    {low_memory_peak / 2 ** 20:>8.2f} MiB')
+    print(f'table schemas: {distinct(t.schema for t in db.tables)}')
+    print(f'column types:  {distinct(c.type for c in columns)}')
+    print(f'ref types:     {distinct(r.type for r in db.refs)}')
+    print(f'ref on_delete: {distinct(r.on_delete for r in db.refs)}')
+
+
+if __name__ == '__main__':
+    main()
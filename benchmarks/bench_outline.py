@@ -0,0 +1,39 @@
+'''
+Compare the outline scan with reading the file and with a full parse.
+
+    python -m benchmarks.bench_outline [tables]
+'''
+import sys
+from time import perf_counter
+
+from benchmarks.schema import generate_schema
+
+from pydbml import PyDBML
+
+
+def best_of(func, repeat: int = 5) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    tables = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    source = generate_schema(tables)
+    data = source.encode('utf8')
+    print(f'{tables} tables, {len(data) / 1024:.1f} KiB')
+    decode = best_of(lambda: data.decode('utf8'))
+    scan = best_of(lambda: PyDBML.outline(source))
+    print(f'decode:  {decode * 1000:>9.1f} ms')
+    print(f'outline: {scan * 1000:>9.1f} ms   {len(data) / scan / 2 ** 20:.1f} MiB/s')
+    scan = best_of(lambda: PyDBML.outline(data))
+    print(f'bytes:   {scan * 1000:>9.1f} ms   {len(data) / scan / 2 ** 20:.1f} MiB/s')
+    parse = best_of(lambda: PyDBML.parse(source), repeat=1)
+    print(f'parse:   {parse * 1000:>9.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+'''
+Parse time with and without packrat memoization on schemas of different
+shape.
+
+    python -m benchmarks.bench_packrat [tables]
+'''
+import sys
+from time import perf_counter
+
+from benchmarks.schema import generate_schema
+
+from pydbml import PyDBML
+
+
+def settings_heavy(tables: int) -> str:
+    '''Columns and indexes with long settings lists.'''
+    result = ['Table t0 {\n  id integer [pk]\n}']
+    for t in range(1, tables):
+        columns = '\n'.join(
+            f"  c{c} varchar(10) [not null, unique, default: 'x', note: 'n', ref: > t0.id]"
+            for c in range(10)
+        )
+        indexes = '\n'.join(
+            f"    (c{c}, c{c + 1}) [unique, name: 'i{t}_{c}', type: btree, note: 'x']"
+            for c in range(9)
+        )
+        result.append(f'Table t{t} {{\n{columns}\n  indexes {{\n{indexes}\n  }}\n}}')
+    return '\n'.join(result)
+
+
+def refs_heavy(tables: int) -> str:
+    '''Many standalone composite references with settings.'''
+    result = [f'Table t{t} {{\n  id integer [pk]\n  a integer\n}}' for t in range(tables)]
+    result += [
+        f'Ref r{t}: t{t}.(id, a) > t{t - 1}.(id, a) [delete: cascade, update: no action]'
+        for t in range(1, tables)
+    ]
+    return '\n'.join(result)
+
+
+def index_notes(tables: int) -> str:
+    '''
+    Indexes with long notes. Single and composite index syntaxes are both
+    tried to find the longest match, so without memoization each note is
+    lexed twice.
+    '''
+    note = 'lorem ipsum dolor sit amet ' * 200
+    result = []
+    for t in range(tables // 5 or 1):
+        columns = '\n'.join(f'  c{c} integer' for c in range(9))
+        indexes = '\n'.join(
+            f"    (c{c}, id) [name: 'i{t}_{c}', note: '{note}']"
+            for c in range(9)
+        )
+        result.append(f'Table t{t} {{\n  id integer [pk]\n{columns}\n  indexes {{\n{indexes}\n  }}\n}}')
+    return '\n'.join(result)
+
+
+def main() -> None:
+    tables = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    cases = {
+        'generated': generate_schema(tables),
+        'commented': generate_schema(tables, comments=True),
+        'settings': settings_heavy(tables),
+        'refs': refs_heavy(tables * 3),
+        'notes': index_notes(tables),
+    }
+    modes = (('off', False), ('128', 128), ('4096', 4096))
+    print(f'{"schema":<10}' + ''.join(f'{"packrat " + name:>16}' for name, _ in modes))
+    for case, source in cases.items():
+        row = f'{case:<10}'
+        for _, packrat in modes:
+            start = perf_counter()
+            PyDBML.parse(source, packrat=packrat)
+            row += f'{(perf_counter() - start) * 1000:>13.1f} ms'
+        print(row)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+'''
+Compare pickling a Database through its flat record representation with
+pickling the raw object graph (the behaviour before Database.__reduce__).
+
+    python -m benchmarks.bench_pickle [tables]
+'''
+import copyreg
+import io
+import pickle
+import sys
+from time import perf_counter
+
+from benchmarks.schema import generate_schema
+
+from pydbml import Database
+from pydbml import PyDBML
+from pydbml import classes
+from pydbml._classes.base import DBMLObject
+
+# model classes pickle themselves as paths in their database, the graph
+# pickle stores their attributes instead
+MODELS = [
+    cls for cls in vars(classes).values()
+    if isinstance(cls, type) and issubclass(cls, DBMLObject)
+]
+
+
+def reduce_object(obj: object):
+    return object.__reduce_ex__(obj, pickle.HIGHEST_PROTOCOL)
+
+
+def dumps_graph(db: Database) -> bytes:
+    buf = io.BytesIO()
+    pickler = pickle.Pickler(buf, protocol=pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = copyreg.dispatch_table.copy()
+    pickler.dispatch_table[Database] = lambda obj: (copyreg.__newobj__, (Database,), obj.__dict__)  # type: ignore
+    for cls in MODELS:
+        pickler.dispatch_table[cls] = reduce_object  # type: ignore
+    pickler.dump(db)
+    return buf.getvalue()
+
+
+def dumps_records(db: Database) -> bytes:
+    return pickle.dumps(db, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def measure(name: str, dumps, db: Database, repeat: int = 5) -> None:
+    best_dump = best_load = float('inf')
+    for _ in range(repeat):
+        start = perf_counter()
+        data = dumps(db)
+        best_dump = min(best_dump, perf_counter() - start)
+        start = perf_counter()
+        pickle.loads(data)
+        best_load = min(best_load, perf_counter() - start)
+    print(
+        f'{name:<8} size: {len(data) / 1024:>9.1f} KiB'
+        f'   dump: {best_dump * 1000:>8.1f} ms   load: {best_load * 1000:>8.1f} ms'
+    )
+
+
+def main() -> None:
+    tables = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    sys.setrecursionlimit(100000)
+    db = PyDBML.parse(generate_schema(tables))
+    print(f'{tables} tables, {sum(len(t.columns) for t in db.tables)} columns, {len(db.refs)} refs')
+    measure('graph', dumps_graph, db)
+    measure('records', dumps_records, db)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+'''
+Compare parsing a few tables out of a large schema with a full parse.
+
+    python -m benchmarks.bench_selective [tables]
+'''
+import sys
+from time import perf_counter
+
+from benchmarks.schema import generate_schema
+
+from pydbml import PyDBML
+
+
+def timed(name: str, source: str, **kwargs) -> None:
+    start = perf_counter()
+    db = PyDBML.parse(source, **kwargs)
+    elapsed = perf_counter() - start
+    print(f'{name:<20} {elapsed * 1000:>9.1f} ms   {len(db.tables)} tables')
+
+
+def main() -> None:
+    tables = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    source = generate_schema(tables)
+    print(f'{tables} tables')
+    timed('filter', source, table_filter='*.table1?')
+    timed('filter + referenced', source, table_filter='*.table1?', include_referenced=True)
+    timed('full parse', source)
+
+
+if __name__ == '__main__':
+    main()
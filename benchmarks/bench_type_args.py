@@ -0,0 +1,60 @@
+'''
+Compare the balanced-parenthesis scanner for column type arguments with the
+recursive grammar it replaced, on pathological inputs.
+
+    python -m benchmarks.bench_type_args
+'''
+from time import perf_counter
+
+import pyparsing as pp
+
+from pydbml.definitions.column import column_type
+
+pp.ParserElement.set_default_whitespace_chars(' \t\r')
+
+# the grammar before the scanner
+expr_chars = pp.Word(pp.alphanums + "\"'`,._+- \n\t")
+expr_chars_no_comma_space = pp.Word(pp.alphanums + "\"'`._+-")
+expression = pp.Forward()
+factor = (
+    pp.Word(pp.alphanums + '_')[0, 1] + '(' + expression + ')'
+    | expr_chars_no_comma_space + (pp.Literal(",") | ");" | (pp.LineEnd() + ");"))
+    | expr_chars
+)
+expression << factor[...]
+name = pp.Word(pp.alphanums + '_') | pp.QuotedString('"')
+recursive_column_type = pp.Combine(
+    (name + pp.Literal('[]')) | (name + '.' + name) | (name + ('(' + pp.original_text_for(expression) + ')')[0, 1])
+)
+
+CASES = {
+    'long numeric': 'numeric(' + ', '.join(str(i) for i in range(2000)) + ')',
+    'long enum': 'enum(' + ', '.join(f"'value{i}'" for i in range(2000)) + ')',
+    'deep nesting': 't(' + 'f(' * 200 + 'x' + ')' * 200 + ')',
+    'nested lists': 't(' + ', '.join('(1, (2, 3))' for _ in range(500)) + ')',
+    'unclosed': 't(' + 'f(' * 200 + 'x',
+}
+
+
+def best_of(func, repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = perf_counter()
+        try:
+            func()
+        except (pp.ParseBaseException, RecursionError):
+            pass
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    print(f'{"input":<14} {"length":>7} {"scanner":>12} {"recursive":>12}')
+    for case, source in CASES.items():
+        scanner = best_of(lambda: column_type.parse_string(source, parse_all=True))
+        recursive = best_of(lambda: recursive_column_type.parse_string(source, parse_all=True))
+        print(f'{case:<14} {len(source):>7} {scanner * 1000:>9.2f} ms {recursive * 1000:>9.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
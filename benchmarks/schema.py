@@ -0,0 +1,35 @@
+'''Synthetic DBML schemas for benchmarks.'''
+from typing import List
+
+
+def generate_schema(tables: int = 1000, columns: int = 10, comments: bool = False) -> str:
+    '''
+    Generate a DBML document with `tables` tables. Every table has a primary key,
+    `columns` regular columns of different types, an index, a note and an inline
+    reference to the previous table. With `comments` every column gets a line
+    comment and a block comment before it and a comment after it.
+    '''
+    types = ('integer', 'varchar(255)', 'timestamp', 'numeric(10,2)', 'boolean', 'text')
+    result: List[str] = ['enum status {\n  active\n  deleted\n}\n']
+    for t in range(tables):
+        lines = [f'// table number {t}', f'Table schema{t % 10}.table{t} {{']
+        lines.append('  id integer [pk, increment]')
+        if t:
+            lines.append(f'  parent_id integer [ref: > schema{(t - 1) % 10}.table{t - 1}.id]')
+        lines.append('  status status [default: "active"]')
+        for c in range(columns):
+            column = f'  col{c} {types[c % len(types)]} [not null, note: \'column {c}\']'
+            if comments:
+                lines.append(f'  // column {c} of table {t}')
+                lines.append('  /* block comment\n     on two lines */')
+                column += ' // trailing comment'
+            lines.append(column)
+        lines.append('  Note: \'Table note\'')
+        lines.append('  indexes {\n    (col0, col1) [unique]\n  }')
+        lines.append('}\n')
+        result.append('\n'.join(lines))
+        if t > 1 and t % 5 == 0:
+            result.append(
+                f'Ref: schema{t % 10}.table{t}.col0 - schema{(t - 2) % 10}.table{t - 2}.id [delete: cascade]\n'
+            )
+    return '\n'.join(result)
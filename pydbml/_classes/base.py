@@ -1,5 +1,6 @@
 from typing import Any
 from typing import Tuple
+from typing import TYPE_CHECKING
 
 from pydbml.exceptions import AttributeMissingError
 
@@ -31,11 +32,13 @@ class SQLObject:
 
         return renderer.render(self)
 
-    def __setattr__(self, name: str, value: Any):
-        """
-        Required for type testing with MyPy.
-        """
-        super().__setattr__(name, value)
+    if TYPE_CHECKING:  # pragma: no cover
+        def __setattr__(self, name: str, value: Any):
+            """
+            Required for type testing with MyPy. Not defined at runtime, because
+            a Python-level __setattr__ slows down every attribute assignment.
+            """
+            super().__setattr__(name, value)
 
     def __eq__(self, other: object) -> bool:
         """
@@ -59,6 +62,24 @@ class SQLObject:
 
 class DBMLObject:
     '''Base class for all DBML objects.'''
+
+    def __reduce_ex__(self, protocol):
+        '''
+        An object in a database is pickled and deep-copied as its path in the
+        database, which is pickled as a whole. The copy is the object inside
+        the copied database, and objects, pickled together, keep sharing it.
+        '''
+        from pydbml.database import get_path, resolve_path
+        found = get_path(self)
+        if found is None:
+            return super().__reduce_ex__(protocol)
+        return resolve_path, found
+
+    def __copy__(self):
+        '''Shallow copy, sharing the attribute values with this object.'''
+        result = self.__class__.__new__(self.__class__)
+        result.__dict__.update(self.__dict__)
+        return result
     @property
     def dbml(self) -> str:
         if hasattr(self, 'database') and self.database is not None:
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 from typing import Union
 
 from pydbml.exceptions import TableNotFoundError
+from pydbml.tools import intern_str
 from .base import SQLObject, DBMLObject
 from .enum import Enum
 from .expression import Expression
@@ -33,7 +34,7 @@ class Column(SQLObject, DBMLObject):
                  properties: Union[Dict[str, str], None] = None
                  ):
         self.name = name
-        self.type = type
+        self.type = intern_str(type)
         self.unique = unique
         self.not_null = not_null
         self.pk = pk
@@ -3,6 +3,7 @@ from typing import List
 from typing import Optional
 from typing import Union
 
+from pydbml.tools import intern_str
 from .base import SQLObject, DBMLObject
 from .note import Note
 
@@ -48,7 +49,7 @@ class Enum(SQLObject, DBMLObject):
                  comment: Optional[str] = None):
         self.database = None
         self.name = name
-        self.schema = schema
+        self.schema = intern_str(schema)
         self.comment = comment
         self.items: List[EnumItem] = []
         for item in items:
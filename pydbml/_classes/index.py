@@ -1,9 +1,11 @@
+from typing import Dict
 from typing import List
 from typing import Literal
 from typing import Optional
 from typing import TYPE_CHECKING
 from typing import Union
 
+from pydbml.exceptions import AttributeMissingError
 from .base import SQLObject, DBMLObject
 from .column import Column
 from .expression import Expression
@@ -13,13 +15,57 @@ if TYPE_CHECKING:  # pragma: no cover
     from .table import Table
 
 
+class IndexSubject(SQLObject, DBMLObject):
+    '''
+    Index subject (column, expression or name) with ordering, collation or
+    operator class.
+    '''
+    required_attributes = ('subject',)
+
+    def __init__(self,
+                 subject: Union[str, Column, Expression],
+                 order: Optional[Literal['asc', 'desc']] = None,
+                 nulls: Optional[Literal['first', 'last']] = None,
+                 collation: Optional[str] = None,
+                 opclass: Optional[str] = None):
+        self.subject = subject
+        self.order = order
+        self.nulls = nulls
+        self.collation = collation
+        self.opclass = opclass
+
+    @property
+    def name(self) -> str:
+        '''Name of the column or text of the expression.'''
+        return self.subject.name if isinstance(self.subject, Column) else str(self.subject)
+
+    def __repr__(self):
+        '''
+        >>> IndexSubject('name', order='desc')
+        <IndexSubject 'name' desc>
+        '''
+
+        options = (
+            self.collation and f'collate {self.collation}',
+            self.opclass,
+            self.order,
+            self.nulls and f'nulls {self.nulls}'
+        )
+        return ' '.join((f'<IndexSubject {self.name!r}', *(o for o in options if o))) + '>'
+
+
+def unwrap_subject(subject: Union[str, Column, Expression, IndexSubject]) -> Union[str, Column, Expression]:
+    '''Column, expression or name of the index subject without options.'''
+    return subject.subject if isinstance(subject, IndexSubject) else subject
+
+
 class Index(SQLObject, DBMLObject):
     '''Class representing index.'''
     required_attributes = ('subjects', 'table')
     dont_compare_fields = ('table',)
 
     def __init__(self,
-                 subjects: List[Union[str, Column, Expression]],
+                 subjects: List[Union[str, Column, Expression, IndexSubject]],
                  name: Optional[str] = None,
                  unique: bool = False,
                  type: Optional[
@@ -35,7 +81,13 @@ class Index(SQLObject, DBMLObject):
                  ] = None,
                  pk: bool = False,
                  note: Optional[Union[Note, str]] = None,
-                 comment: Optional[str] = None):
+                 comment: Optional[str] = None,
+                 where: Optional[Union[Expression, str]] = None,
+                 include: Optional[List[Union[str, Column]]] = None,
+                 concurrently: bool = False,
+                 if_not_exists: bool = False,
+                 storage_params: Optional[Dict[str, str]] = None,
+                 tablespace: Optional[str] = None):
         self.subjects = subjects
         self.table: Optional[Table] = None
 
@@ -45,6 +97,24 @@ class Index(SQLObject, DBMLObject):
         self.pk = pk
         self.note = Note(note)
         self.comment = comment
+        self.where = where
+        self.include = include or []
+        self.concurrently = concurrently
+        self.if_not_exists = if_not_exists
+        self.storage_params = storage_params or {}
+        self.tablespace = tablespace
+
+    def check_attributes_for_sql(self):
+        '''
+        Besides required attributes, check that an index with the
+        `if not exists` setting has a name: CREATE INDEX IF NOT EXISTS
+        requires one.
+        '''
+        super().check_attributes_for_sql()
+        if self.if_not_exists and not self.name and not self.pk:
+            raise AttributeMissingError(
+                'Cannot render SQL. Index with "if not exists" requires a name.'
+            )
 
     @property
     def note(self):
@@ -60,7 +130,18 @@ class Index(SQLObject, DBMLObject):
         '''
         Returns updated list of subject names.
         '''
-        return [s.name if isinstance(s, Column) else str(s) for s in self.subjects]
+        result = []
+        for s in self.subjects:
+            s = unwrap_subject(s)
+            result.append(s.name if isinstance(s, Column) else str(s))
+        return result
+
+    @property
+    def include_names(self):
+        '''
+        Returns updated list of included column names.
+        '''
+        return [c.name if isinstance(c, Column) else c for c in self.include]
 
     def __repr__(self):
         '''
@@ -0,0 +1,75 @@
+from typing import List
+from typing import Literal
+from typing import Optional
+from typing import TYPE_CHECKING
+from typing import Union
+
+from pydbml.tools import intern_str
+from .base import SQLObject, DBMLObject
+from .column import Column
+from .expression import Expression
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .table import Table
+
+
+class PartitionKey(SQLObject, DBMLObject):
+    '''Partitioning method and key of a partitioned table.'''
+    required_attributes = ('method', 'subjects')
+
+    def __init__(self,
+                 method: Literal['range', 'list', 'hash'],
+                 subjects: List[Union[str, Column, Expression]]):
+        self.method = method
+        self.subjects = subjects
+
+    @property
+    def subject_names(self) -> List[str]:
+        '''
+        Returns updated list of subject names.
+        '''
+        return [s.name if isinstance(s, Column) else str(s) for s in self.subjects]
+
+    def __repr__(self):
+        '''
+        >>> PartitionKey('range', ['created_at'])
+        <PartitionKey range ['created_at']>
+        '''
+
+        return f'<PartitionKey {self.method} {self.subject_names!r}>'
+
+
+class Partition(SQLObject, DBMLObject):
+    '''
+    Partition of a partitioned table. `values` is the partition bound, like
+    `FROM ('2024-01-01') TO ('2025-01-01')`, or None for the default partition.
+    '''
+    required_attributes = ('name', 'schema', 'table')
+    dont_compare_fields = ('table',)
+
+    def __init__(self,
+                 name: str,
+                 schema: str = 'public',
+                 values: Optional[Union[Expression, str]] = None,
+                 comment: Optional[str] = None):
+        self.table: Optional[Table] = None
+        self.name = name
+        self.schema = intern_str(schema)
+        self.values = values
+        self.comment = comment
+
+    @property
+    def full_name(self) -> str:
+        return f'{self.schema}.{self.name}'
+
+    @property
+    def default(self) -> bool:
+        return self.values is None
+
+    def __repr__(self):
+        '''
+        >>> Partition('bookings_2024')
+        <Partition 'public' 'bookings_2024'>
+        '''
+
+        return f'<Partition {self.schema!r} {self.name!r}>'
@@ -7,6 +7,7 @@ from typing import Union
 from pydbml.constants import MANY_TO_MANY
 from pydbml.exceptions import DBMLError
 from pydbml.exceptions import TableNotFoundError
+from pydbml.tools import intern_str
 from .base import SQLObject, DBMLObject
 from .column import Column
 from .table import Table
@@ -31,13 +32,13 @@ class Reference(SQLObject, DBMLObject):
                  on_delete: Optional[str] = None,
                  inline: bool = False):
         self.database = None
-        self.type = type
+        self.type = intern_str(type)
         self.col1 = [col1] if isinstance(col1, Column) else list(col1)
         self.col2 = [col2] if isinstance(col2, Column) else list(col2)
         self.name = name if name else None
         self.comment = comment
-        self.on_update = on_update
-        self.on_delete = on_delete
+        self.on_update = intern_str(on_update)
+        self.on_delete = intern_str(on_delete)
         self._inline = inline
 
     @property
@@ -5,12 +5,20 @@ from typing import TYPE_CHECKING
 from typing import Union
 
 from pydbml.exceptions import ColumnNotFoundError
+from pydbml.exceptions import DatabaseValidationError
 from pydbml.exceptions import IndexNotFoundError
+from pydbml.exceptions import PartitionNotFoundError
 from pydbml.exceptions import UnknownDatabaseError
+from pydbml.exceptions import ValidationError
+from pydbml.tools import intern_str
 from .base import SQLObject, DBMLObject
 from .column import Column
+from .expression import Expression
 from .index import Index
+from .index import unwrap_subject
 from .note import Note
+from .partition import Partition
+from .partition import PartitionKey
 
 if TYPE_CHECKING:  # pragma: no cover
     from pydbml.database import Database
@@ -33,11 +41,13 @@ class Table(SQLObject, DBMLObject):
                  header_color: Optional[str] = None,
                  comment: Optional[str] = None,
                  abstract: bool = False,
-                 properties: Union[Dict[str, str], None] = None
+                 properties: Union[Dict[str, str], None] = None,
+                 partition_by: Optional[PartitionKey] = None,
+                 partitions: Optional[Iterable[Partition]] = None
                  ):
         self.database: Optional[Database] = None
         self.name = name
-        self.schema = schema
+        self.schema = intern_str(schema)
         self.columns: List[Column] = []
         for column in columns or []:
             self.add_column(column)
@@ -50,6 +60,10 @@ class Table(SQLObject, DBMLObject):
         self.comment = comment
         self.abstract = abstract
         self.properties = properties if properties else {}
+        self.partition_by = partition_by
+        self.partitions: List[Partition] = []
+        for partition in partitions or []:
+            self.add_partition(partition)
 
     @property
     def note(self):
@@ -60,10 +74,72 @@ class Table(SQLObject, DBMLObject):
         self._note = val
         val.parent = self
 
+    @property
+    def partition_by(self) -> Optional[PartitionKey]:
+        return self._partition_by
+
+    @partition_by.setter
+    def partition_by(self, val: Optional[PartitionKey]) -> None:
+        if val is not None:
+            for subject in val.subjects:
+                if isinstance(subject, Column) and subject.table is not self:
+                    raise ColumnNotFoundError(f'Column {subject} not in the table')
+        self._partition_by = val
+
     @property
     def full_name(self) -> str:
         return f'{self.schema}.{self.name}'
 
+    def check_attributes_for_sql(self):
+        '''
+        Besides required attributes, check partitioning: primary key and
+        unique constraints of a partitioned table must include all columns of
+        the partition key, and partitions can't be named as other tables or
+        partitions of the database.
+        '''
+        super().check_attributes_for_sql()
+        if self.partition_by:
+            self._check_partition_key()
+        for partition in self.partitions:
+            self._check_partition_name(partition)
+
+    def _get_unique_keys(self) -> List[List[Union[str, Column, Expression]]]:
+        '''Subjects of the primary key and unique constraints.'''
+        result: List[List[Union[str, Column, Expression]]] = []
+        pk = [c for c in self.columns if c.pk]
+        if pk:
+            result.append(list(pk))
+        result.extend([c] for c in self.columns if c.unique)
+        result.extend(
+            [unwrap_subject(s) for s in i.subjects]
+            for i in self.indexes if i.pk or i.unique
+        )
+        return result
+
+    def _check_partition_key(self) -> None:
+        key = self.partition_by.subject_names  # type: ignore
+        # constraints can't include expressions, so with an expression in the
+        # partition key the table can't have them at all
+        has_expressions = any(isinstance(s, Expression) for s in self.partition_by.subjects)  # type: ignore
+        for subjects in self._get_unique_keys():
+            names = [s.name if isinstance(s, Column) else str(s) for s in subjects]
+            if has_expressions or not set(key) <= set(names):
+                raise ValidationError(
+                    f'Cannot render SQL. Primary key and unique constraints of the partitioned'
+                    f' table {self.full_name} must include all partition key columns:'
+                    f' ({", ".join(names)}) doesn\'t include ({", ".join(key)}).'
+                )
+
+    def _check_partition_name(self, p: Partition) -> None:
+        if not self.database:
+            return
+        if p.full_name in self.database.table_dict:
+            raise DatabaseValidationError(f'Partition {p.full_name} has the same name as a table in the database.')
+        for table in self.database.tables:
+            for partition in table.partitions:
+                if partition is not p and partition.full_name == p.full_name:
+                    raise DatabaseValidationError(f'Partition {p.full_name} is already in the database.')
+
     def _has_composite_pk(self) -> bool:
         return sum(c.pk for c in self.columns) > 1
 
@@ -95,7 +171,7 @@ class Table(SQLObject, DBMLObject):
         '''
         if not isinstance(i, Index):
             raise TypeError('Indexes must be of type Index')
-        for subject in i.subjects:
+        for subject in (*map(unwrap_subject, i.subjects), *i.include):
             if isinstance(subject, Column) and subject.table is not self:
                 raise ColumnNotFoundError(f'Column {subject} not in the table')
         i.table = self
@@ -112,6 +188,28 @@ class Table(SQLObject, DBMLObject):
             self.indexes[i].table = None
             return self.indexes.pop(i)
 
+    def add_partition(self, p: Partition) -> None:
+        '''
+        Adds partition to self.partitions attribute and sets in this partition
+        the `table` attribute.
+        '''
+        if not isinstance(p, Partition):
+            raise TypeError('Partitions must be of type Partition')
+        self._check_partition_name(p)
+        p.table = self
+        self.partitions.append(p)
+
+    def delete_partition(self, p: Union[Partition, int]) -> Partition:
+        if isinstance(p, Partition):
+            if p in self.partitions:
+                p.table = None
+                return self.partitions.pop(self.partitions.index(p))
+            else:
+                raise PartitionNotFoundError(f'Partition {p} is missing in the table')
+        elif isinstance(p, int):
+            self.partitions[p].table = None
+            return self.partitions.pop(p)
+
     def get_refs(self) -> List['Reference']:
         if not self.database:
             raise UnknownDatabaseError('Database for the table is not set')
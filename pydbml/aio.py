@@ -0,0 +1,71 @@
+'''
+Asyncio support. Parsing and rendering are CPU-bound, so the async API runs
+them in an executor to keep the event loop responsive. The number of jobs,
+running at the same time, is limited for each event loop, so that a few large
+schemas don't occupy all executor workers.
+'''
+import asyncio
+
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any
+from typing import Callable
+from typing import MutableMapping
+from typing import Optional
+from typing import TypeVar
+from weakref import WeakKeyDictionary
+
+T = TypeVar('T')
+
+DEFAULT_CONCURRENCY_LIMIT = 4
+
+_limit = DEFAULT_CONCURRENCY_LIMIT
+_semaphores: MutableMapping[asyncio.AbstractEventLoop, asyncio.Semaphore] = WeakKeyDictionary()
+
+
+def get_concurrency_limit() -> int:
+    return _limit
+
+
+def set_concurrency_limit(limit: int) -> None:
+    '''
+    Set the maximum number of parse and render jobs, running in the executor
+    at the same time, per event loop. Jobs, which are already waiting, keep
+    the previous limit.
+    '''
+    global _limit
+    if limit < 1:
+        raise ValueError('Concurrency limit must be positive')
+    _limit = limit
+    _semaphores.clear()
+
+
+def _get_semaphore(loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _semaphores[loop] = asyncio.Semaphore(_limit)
+    return semaphore
+
+
+async def run_in_executor(
+    func: Callable[..., T],
+    *args: Any,
+    executor: Optional[Executor] = None,
+    **kwargs: Any
+) -> T:
+    '''
+    Call `func` in the executor (the loop default executor if None), waiting
+    for a free slot first. With a process pool `func` and its arguments must
+    be picklable.
+    '''
+    loop = asyncio.get_running_loop()
+    async with _get_semaphore(loop):
+        return await loop.run_in_executor(executor, partial(func, *args, **kwargs))
+
+
+def render_sql(database: Any) -> str:
+    return database.sql
+
+
+def render_dbml(database: Any) -> str:
+    return database.dbml
@@ -0,0 +1,33 @@
+from .column_order import ColumnOrder
+from .column_order import find_column_orders
+from .column_order import optimize_column_order
+from .column_order import propose_column_order
+from .fk_indexes import MissingFKIndex
+from .fk_indexes import add_missing_fk_indexes
+from .fk_indexes import find_missing_fk_indexes
+from .redundant_indexes import RedundantIndex
+from .redundant_indexes import check_redundant_indexes
+from .redundant_indexes import find_redundant_indexes
+from .sizes import IndexSize
+from .sizes import SchemaSize
+from .sizes import TableSize
+from .sizes import estimate_sizes
+from .sizes import estimate_table_size
+
+__all__ = [
+    "ColumnOrder",
+    "IndexSize",
+    "MissingFKIndex",
+    "RedundantIndex",
+    "SchemaSize",
+    "TableSize",
+    "add_missing_fk_indexes",
+    "check_redundant_indexes",
+    "estimate_sizes",
+    "estimate_table_size",
+    "find_column_orders",
+    "find_missing_fk_indexes",
+    "find_redundant_indexes",
+    "optimize_column_order",
+    "propose_column_order",
+]
@@ -0,0 +1,191 @@
+'''
+Column order with the least alignment padding. PostgreSQL stores column
+values in the column order, aligning each value as its type requires, so an
+`int4` column between two `int8` columns wastes 4 bytes in every row. Fixed
+length columns, ordered from the largest alignment to the smallest, followed
+by variable-length columns, waste nothing.
+'''
+from copy import deepcopy
+from dataclasses import dataclass
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+from pydbml.classes import Column, Table
+from .types import MAX_ALIGN
+from .types import TypeInfo
+from .types import get_type_info
+from .utils import get_leading_columns
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pydbml.database import Database
+
+# offset of the next value in the row: (remainder, modulus), the offset is
+# known up to the multiple of the modulus. The modulus is 1 after a
+# variable-length value and MAX_ALIGN if the offset is known exactly,
+# larger alignments never matter.
+Offset = Tuple[int, int]
+
+START: Offset = (0, MAX_ALIGN)
+
+# values of unknown types are treated as variable-length
+UNKNOWN_TYPE = TypeInfo(-1, 1)
+
+
+def get_column_type_info(column: Column) -> TypeInfo:
+    return get_type_info(column.type) or UNKNOWN_TYPE
+
+
+def place(offset: Offset, info: TypeInfo) -> Tuple[int, Offset]:
+    '''
+    Padding before the value and the offset after it. If the offset is not
+    known exactly, the padding is the largest possible. Short variable-length
+    values are not aligned, so they add no padding.
+    '''
+    remainder, modulus = offset
+    if info.variable:
+        return 0, (0, 1)
+    if info.align <= modulus:
+        padding = -remainder % info.align
+        return padding, ((remainder + padding + info.length) % modulus, modulus)
+    padding = info.align - modulus + (-remainder % modulus)
+    return padding, (info.length % info.align, info.align)
+
+
+def get_padding(columns: Iterable[Column], offset: Offset = START) -> int:
+    '''
+    Alignment padding in a row with the columns in the given order and all
+    values not null. After a variable-length value the largest possible
+    padding is counted.
+    '''
+    result = 0
+    for column in columns:
+        padding, offset = place(offset, get_column_type_info(column))
+        result += padding
+    return result
+
+
+def get_pk_columns(table: Table) -> List[Column]:
+    '''Primary key columns in the table order, column-level or of a pk index.'''
+    pk_ids = {id(c) for c in table.columns if c.pk}
+    for index in table.indexes:
+        if index.pk:
+            pk_ids.update(id(c) for c in get_leading_columns(index))
+    return [c for c in table.columns if id(c) in pk_ids]
+
+
+def order_by_alignment(columns: List[Column]) -> List[Column]:
+    return sorted(
+        columns,
+        key=lambda c: (-get_column_type_info(c).align, -get_column_type_info(c).length)
+    )
+
+
+def order_greedy(columns: List[Column], offset: Offset) -> List[Column]:
+    '''
+    Order, where each next column is the one with the least padding at the
+    current offset, the one with the largest alignment of those.
+    '''
+    remaining = list(columns)
+    result = []
+    while remaining:
+        best_column = remaining[0]
+        best: Optional[Tuple[int, int]] = None
+        for column in remaining:
+            info = get_column_type_info(column)
+            padding, _ = place(offset, info)
+            if best is None or (padding, -info.align) < best:
+                best = (padding, -info.align)
+                best_column = column
+        remaining.remove(best_column)
+        result.append(best_column)
+        _, offset = place(offset, get_column_type_info(best_column))
+    return result
+
+
+def _end_offset(columns: List[Column]) -> Offset:
+    offset = START
+    for column in columns:
+        _, offset = place(offset, get_column_type_info(column))
+    return offset
+
+
+@dataclass
+class ColumnOrder:
+    '''
+    Current and proposed column order of the table. The proposed order keeps
+    the primary key columns first, in their current order.
+    '''
+    table: Table
+    current: List[Column]
+    proposed: List[Column]
+
+    @property
+    def padding(self) -> int:
+        '''Padding per row in the current order.'''
+        return get_padding(self.current)
+
+    @property
+    def proposed_padding(self) -> int:
+        return get_padding(self.proposed)
+
+    @property
+    def saving(self) -> int:
+        '''Bytes per row, saved by the proposed order.'''
+        return self.padding - self.proposed_padding
+
+    @property
+    def changed(self) -> bool:
+        return any(c1 is not c2 for c1, c2 in zip(self.current, self.proposed))
+
+    def __str__(self) -> str:
+        names = ', '.join(c.name for c in self.proposed)
+        return (
+            f'{self.table.full_name}: {self.padding} bytes of padding per row, '
+            f'{self.proposed_padding} in the order ({names})'
+        )
+
+
+def propose_column_order(table: Table) -> ColumnOrder:
+    '''
+    Primary key columns, then fixed-length columns, ordered so that the
+    padding is the least, then variable-length and unknown types in the
+    current order. If no order is better, the current one is proposed.
+    '''
+    pk = get_pk_columns(table)
+    pk_ids = {id(c) for c in pk}
+    rest = [c for c in table.columns if id(c) not in pk_ids]
+    fixed = [c for c in rest if not get_column_type_info(c).variable]
+    variable = [c for c in rest if get_column_type_info(c).variable]
+    offset = _end_offset(pk)
+    candidates = [
+        [*pk, *order_by_alignment(fixed), *variable],
+        [*pk, *order_greedy(fixed, offset), *variable],
+    ]
+    best = min(candidates, key=get_padding)
+    if get_padding(best) >= get_padding(table.columns):
+        best = list(table.columns)
+    return ColumnOrder(table=table, current=list(table.columns), proposed=best)
+
+
+def find_column_orders(db: 'Database') -> List[ColumnOrder]:
+    '''Proposed column orders of the tables, where they save padding.'''
+    result = []
+    for table in db.tables:
+        order = propose_column_order(table)
+        if order.saving > 0:
+            result.append(order)
+    return result
+
+
+def optimize_column_order(db: 'Database') -> 'Database':
+    '''
+    Copy of the database with the proposed column order in every table. Use
+    its `dbml` or `sql` property to get the new schema.
+    '''
+    result = deepcopy(db)
+    for table in result.tables:
+        table.columns = propose_column_order(table).proposed
+    return result
@@ -0,0 +1,130 @@
+'''
+Foreign keys without indexes. Deleting or updating a referenced row makes the
+database look up the referencing rows, without an index on the foreign key
+columns it is a full scan of the referencing table. The same index serves
+joins on the foreign key.
+'''
+from dataclasses import dataclass
+from typing import Dict
+from typing import FrozenSet
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import TYPE_CHECKING
+
+from pydbml.classes import Column, Index, Reference, Table
+from pydbml.constants import MANY_TO_MANY, ONE_TO_MANY
+from .utils import get_lookup_keys
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pydbml.database import Database
+
+
+@dataclass
+class MissingFKIndex:
+    '''
+    Foreign key of the reference, whose columns are not the leading columns of
+    any index of the referencing table.
+    '''
+    reference: Reference
+    columns: List[Column]
+
+    @property
+    def table(self) -> Table:
+        return self.columns[0].table  # type: ignore
+
+    def to_index(self) -> Index:
+        '''Index on the foreign key columns. It is not added to the table.'''
+        result = Index(subjects=list(self.columns))
+        result.table = self.table
+        return result
+
+    @property
+    def sql(self) -> str:
+        '''CREATE INDEX statement, fixing the problem.'''
+        return self.to_index().sql
+
+    def __str__(self) -> str:
+        ref_cols = self.reference.col1 if self.reference.type == ONE_TO_MANY else self.reference.col2
+        ref_table = ref_cols[0].table
+        names = ', '.join(c.name for c in self.columns)
+        ref_names = ', '.join(c.name for c in ref_cols)
+        return (
+            f'Foreign key {self.table.full_name} ({names}) -> '
+            f'{ref_table.full_name} ({ref_names}) is not indexed'  # type: ignore
+        )
+
+
+def get_referencing_columns(ref: Reference) -> Optional[List[Column]]:
+    '''
+    Columns of the foreign key, defined by the reference. None for
+    many-to-many references, their join tables are not part of the schema.
+    '''
+    if ref.type == MANY_TO_MANY:
+        return None
+    if ref.type == ONE_TO_MANY:
+        return ref.col2
+    return ref.col1
+
+
+def get_covered_column_sets(table: Table) -> Set[FrozenSet[int]]:
+    '''
+    Sets of column ids, which are leading columns of a table key. A foreign
+    key is covered if its columns, in any order, are one of these sets.
+    '''
+    result: Set[FrozenSet[int]] = set()
+    for key in get_lookup_keys(table):
+        prefix: Set[int] = set()
+        for column in key:
+            prefix.add(id(column))
+            result.add(frozenset(prefix))
+    return result
+
+
+class _Coverage:
+    '''Covered column sets, computed once per table.'''
+
+    def __init__(self) -> None:
+        self._tables: Dict[int, Set[FrozenSet[int]]] = {}
+
+    def get(self, table: Table) -> Set[FrozenSet[int]]:
+        result = self._tables.get(id(table))
+        if result is None:
+            result = self._tables[id(table)] = get_covered_column_sets(table)
+        return result
+
+
+def find_missing_fk_indexes(db: 'Database') -> List[MissingFKIndex]:
+    '''
+    Foreign keys of the database, which are not covered by the primary key,
+    a unique column or leading columns of a btree index. Runs in linear time
+    of the schema size.
+    '''
+    coverage = _Coverage()
+    result = []
+    for ref in db.refs:
+        columns = get_referencing_columns(ref)
+        if not columns or columns[0].table is None:
+            continue
+        if frozenset(id(c) for c in columns) not in coverage.get(columns[0].table):
+            result.append(MissingFKIndex(reference=ref, columns=columns))
+    return result
+
+
+def add_missing_fk_indexes(db: 'Database') -> List[Index]:
+    '''
+    Add indexes on unindexed foreign keys to their tables. Foreign keys on
+    the same columns get one index. Returns the added indexes.
+    '''
+    coverage = _Coverage()
+    result = []
+    for missing in find_missing_fk_indexes(db):
+        covered = coverage.get(missing.table)
+        column_set = frozenset(id(c) for c in missing.columns)
+        if column_set in covered:
+            continue
+        index = missing.to_index()
+        missing.table.add_index(index)
+        covered.add(column_set)
+        result.append(index)
+    return result
@@ -0,0 +1,243 @@
+'''
+Redundant indexes. Every index slows down writes and takes memory, an index,
+which duplicates another one or is a prefix of it, gives nothing in return.
+A unique constraint on the primary key columns is enforced twice. A unique
+index, which includes the primary key columns after others, is not redundant,
+but it doesn't need to be unique.
+'''
+from dataclasses import dataclass
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import TYPE_CHECKING
+from typing import Union
+
+from pydbml.classes import Column, Expression, Index, IndexSubject, Table
+from pydbml.exceptions import RedundantIndexError
+from pydbml._classes.index import unwrap_subject
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pydbml.database import Database
+
+DUPLICATE = 'duplicate'
+PREFIX = 'prefix'
+IMPLIED_UNIQUE = 'implied_unique'
+UNIQUE_NOT_NEEDED = 'unique_not_needed'
+
+SubjectKey = Tuple[object, ...]
+
+
+@dataclass
+class _Key:
+    '''
+    Index, primary key or unique column of a table, reduced to the fields,
+    which matter for comparison. `source` is the Index or the list of columns
+    of a column-level primary key or unique constraint.
+    '''
+    source: Union[Index, List[Column]]
+    subjects: Tuple[SubjectKey, ...]
+    names: Tuple[str, ...]
+    type: str
+    where: Optional[str]
+    include: Tuple[str, ...]
+    unique: bool
+    pk: bool
+
+    @property
+    def column_ids(self) -> Optional[frozenset]:
+        '''Ids of the key columns, None if the key has expressions.'''
+        if any(s[0] != 'column' for s in self.subjects):
+            return None
+        return frozenset(s[1] for s in self.subjects)
+
+
+@dataclass
+class RedundantIndex:
+    '''
+    Index or unique column, which is not needed because of `covered_by`.
+    `kind` is one of:
+
+    - `duplicate`: same key as `covered_by`;
+    - `prefix`: key is a strict prefix of the `covered_by` key;
+    - `implied_unique`: unique constraint on the primary key columns or
+      starting with them;
+    - `unique_not_needed`: unique index, which includes the primary key
+      columns after others. The index is not redundant, but its uniqueness
+      is implied, so it could be non-unique.
+
+    `covered_by` is an Index or the list of columns of a column-level
+    primary key or unique constraint.
+    '''
+    kind: str
+    table: Table
+    redundant: Union[Index, Column]
+    covered_by: Union[Index, List[Column]]
+
+    @property
+    def removable(self) -> bool:
+        '''True if the index can be dropped, False if it could be non-unique.'''
+        return self.kind != UNIQUE_NOT_NEEDED
+
+    def __str__(self) -> str:
+        redundant = describe(self.redundant)
+        covered_by = describe(self.covered_by)
+        if self.kind == DUPLICATE:
+            text = f'{redundant} duplicates {covered_by}'
+        elif self.kind == PREFIX:
+            text = f'{redundant} is a prefix of {covered_by}'
+        elif self.kind == UNIQUE_NOT_NEEDED:
+            text = f'uniqueness of {redundant} is implied by {covered_by}; the index could be non-unique'
+        else:
+            text = f'{redundant} is implied by {covered_by}'
+        return f'{self.table.full_name}: {text}'
+
+
+def describe(obj: Union[Index, Column, List[Column]]) -> str:
+    '''
+    >>> describe(Index(['a', 'b'], name='ix_ab'))
+    'index ix_ab'
+    >>> describe(Index(['a', 'b'], pk=True))
+    'primary key (a, b)'
+    >>> describe(Column('email', 'varchar', unique=True))
+    'unique column email'
+    '''
+    if isinstance(obj, Column):
+        return f'unique column {obj.name}'
+    if isinstance(obj, list):
+        names = ', '.join(c.name for c in obj)
+        return f'primary key ({names})' if obj[0].pk else f'unique column {names}'
+    if obj.name:
+        return f'index {obj.name}'
+    names = ', '.join(obj.subject_names)
+    return f'primary key ({names})' if obj.pk else f'index ({names})'
+
+
+def get_subject_key(subject: Union[str, Column, Expression, IndexSubject]) -> SubjectKey:
+    '''Identity of the subject with its options. Columns are compared by id.'''
+    options: Tuple[Optional[str], ...] = (None, None, None, None)
+    if isinstance(subject, IndexSubject):
+        options = (subject.order, subject.nulls, subject.collation, subject.opclass)
+    value = unwrap_subject(subject)
+    if isinstance(value, Column):
+        return ('column', id(value), *options)
+    if isinstance(value, Expression):
+        return ('expression', ' '.join(value.text.split()), *options)
+    return ('name', value, *options)
+
+
+def get_index_key(index: Index) -> _Key:
+    where = index.where.text if isinstance(index.where, Expression) else index.where
+    return _Key(
+        source=index,
+        subjects=tuple(get_subject_key(s) for s in index.subjects),
+        names=tuple(index.subject_names),
+        type=index.type or 'btree',
+        where=' '.join(where.split()) if where else None,
+        include=tuple(sorted(index.include_names)),
+        unique=index.unique or index.pk,
+        pk=index.pk,
+    )
+
+
+def get_column_key(columns: List[Column], pk: bool) -> _Key:
+    return _Key(
+        source=columns,
+        subjects=tuple(get_subject_key(c) for c in columns),
+        names=tuple(c.name for c in columns),
+        type='btree',
+        where=None,
+        include=(),
+        unique=True,
+        pk=pk,
+    )
+
+
+def get_table_keys(table: Table) -> List[_Key]:
+    '''Keys of the table: primary key, unique columns, then indexes.'''
+    result = []
+    pk = [c for c in table.columns if c.pk]
+    if pk:
+        result.append(get_column_key(pk, pk=True))
+    result.extend(get_column_key([c], pk=False) for c in table.columns if c.unique)
+    result.extend(get_index_key(i) for i in table.indexes)
+    return result
+
+
+def _redundant_object(key: _Key) -> Union[Index, Column]:
+    return key.source if isinstance(key.source, Index) else key.source[0]
+
+
+def _is_prefix(key: _Key, other: _Key) -> bool:
+    '''
+    The key is a strict prefix of the other btree key and can be dropped:
+    it doesn't enforce uniqueness and its included columns are in the other.
+    '''
+    if key.type != 'btree' or other.type != 'btree' or key.unique or key.where != other.where:
+        return False
+    if len(key.subjects) >= len(other.subjects) or other.subjects[:len(key.subjects)] != key.subjects:
+        return False
+    return set(key.include) <= {*other.names, *other.include}
+
+
+def _is_implied_unique(key: _Key, pk_ids: frozenset) -> bool:
+    '''The key columns are the primary key columns or start with them.'''
+    leading = frozenset(s[1] for s in key.subjects[:len(pk_ids)] if s[0] == 'column')
+    return key.column_ids == pk_ids or leading == pk_ids
+
+
+def find_table_redundant_indexes(table: Table) -> List[RedundantIndex]:
+    keys = get_table_keys(table)
+    pk_key = next((k for k in keys if k.pk), None)
+    pk_ids = pk_key.column_ids if pk_key else None
+    result = []
+    kept = []
+    # of the keys with the same definition the first is kept,
+    # primary key goes first, then unique keys
+    seen: Dict[Tuple[object, ...], _Key] = {}
+    for key in sorted(keys, key=lambda k: (not k.pk, not k.unique)):
+        column_ids = key.column_ids
+        if key is not pk_key and key.unique and pk_ids and column_ids is not None and pk_ids <= column_ids:
+            if _is_implied_unique(key, pk_ids):
+                result.append(RedundantIndex(IMPLIED_UNIQUE, table, _redundant_object(key), pk_key.source))  # type: ignore
+                continue
+            result.append(RedundantIndex(UNIQUE_NOT_NEEDED, table, _redundant_object(key), pk_key.source))  # type: ignore
+        definition = (key.subjects, key.type, key.where, key.include)
+        original = seen.get(definition)
+        if original is not None:
+            result.append(RedundantIndex(DUPLICATE, table, _redundant_object(key), original.source))
+            continue
+        seen[definition] = key
+        kept.append(key)
+    for key in kept:
+        longer = [k for k in kept if _is_prefix(key, k)]
+        if longer:
+            covered_by = max(longer, key=lambda k: len(k.subjects))
+            result.append(RedundantIndex(PREFIX, table, _redundant_object(key), covered_by.source))
+    order = {id(_redundant_object(k)): i for i, k in enumerate(keys)}
+    result.sort(key=lambda r: order[id(r.redundant)])
+    return result
+
+
+def find_redundant_indexes(db: 'Database') -> List[RedundantIndex]:
+    '''
+    Duplicate indexes, indexes, which are a strict prefix of another btree
+    index, unique constraints, implied by the primary key, and unique
+    indexes, which could be non-unique. The report is empty if the schema is
+    clean.
+    '''
+    result = []
+    for table in db.tables:
+        result.extend(find_table_redundant_indexes(table))
+    return result
+
+
+def check_redundant_indexes(db: 'Database') -> None:
+    '''
+    Raise RedundantIndexError, listing all redundant indexes, if there are
+    any. Unique indexes, which could be non-unique, are not redundant.
+    '''
+    redundant = [r for r in find_redundant_indexes(db) if r.removable]
+    if redundant:
+        lines = '\n'.join(str(r) for r in redundant)
+        raise RedundantIndexError(f'Found {len(redundant)} redundant indexes:\n{lines}')
@@ -0,0 +1,292 @@
+'''
+Row width and table size estimates for capacity planning. Rows are laid out
+as in PostgreSQL heap pages: tuple header, null bitmap, aligned column values
+and a line pointer per row. Index sizes are estimated for btree and hash
+indexes by their leaf entries. The number of rows is taken from the `rows`
+table property. TOAST and free space left by updates are not counted.
+'''
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import TYPE_CHECKING
+from typing import Union
+
+from pydbml.classes import Column, Expression, Index, IndexSubject, Table
+from pydbml._classes.index import unwrap_subject
+from .types import DEFAULT_WIDTH
+from .types import MAX_ALIGN
+from .types import get_type_info
+from .types import get_type_width
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pydbml.database import Database
+
+ROWS_PROPERTY = 'rows'
+
+PAGE_SIZE = 8192
+PAGE_HEADER = 24
+LINE_POINTER = 4
+TUPLE_HEADER = 23
+INDEX_TUPLE_HEADER = 8
+BTREE_SPECIAL = 16
+MAX_HEAP_TUPLES_PER_PAGE = 291
+
+# default fillfactor of the index leaf pages
+FILLFACTORS = {'btree': 90, 'hash': 75}
+
+# hash indexes store the 4-byte hash code of the key
+HASH_CODE_WIDTH = 4
+
+# variable-length values up to this width have 1-byte headers and are not aligned
+SHORT_VARLENA_MAX = 126
+
+_UNITS = ('bytes', 'kB', 'MB', 'GB', 'TB')
+
+
+def align(offset: int, alignment: int = MAX_ALIGN) -> int:
+    return -(-offset // alignment) * alignment
+
+
+def format_bytes(size: int) -> str:
+    '''
+    Size with units, rounded as by pg_size_pretty.
+
+    >>> format_bytes(8191)
+    '8191 bytes'
+    >>> format_bytes(1536000)
+    '1500 kB'
+    >>> format_bytes(16106127360)
+    '15 GB'
+    '''
+    for unit in _UNITS[:-1]:
+        if abs(size) < 10 * 1024:
+            return f'{size} {unit}'
+        size = (size + 512) // 1024
+    return f'{size} {_UNITS[-1]}'
+
+
+def check_rows(rows: int) -> None:
+    if not isinstance(rows, int) or rows < 0:
+        raise ValueError(f'Number of rows must be a non-negative integer, got {rows!r}')
+
+
+def get_rows(table: Table) -> Optional[int]:
+    '''
+    Number of rows from the table properties, None if not set. The value is
+    a non-negative integer, `5_000_000` and `5e6` are allowed.
+    '''
+    value = table.properties.get(ROWS_PROPERTY)
+    if value is None:
+        return None
+    try:
+        rows = float(value.replace('_', ''))
+        if rows < 0 or not rows.is_integer():
+            raise ValueError
+        return int(rows)
+    except ValueError:
+        raise ValueError(
+            f'Table {table.full_name}: "{ROWS_PROPERTY}" property must be a non-negative integer, got {value!r}'
+        )
+
+
+def get_data_width(widths: List[int], alignments: List[int]) -> int:
+    '''Width of the values with alignment padding, starting at an aligned offset.'''
+    offset = 0
+    for width, alignment in zip(widths, alignments):
+        offset = align(offset, alignment) + width
+    return offset
+
+
+def _get_alignment(column: Column, width: int) -> int:
+    info = get_type_info(column.type)
+    if info is None or (info.variable and width <= SHORT_VARLENA_MAX):
+        return 1
+    return info.align
+
+
+def get_columns_width(columns: List[Column]) -> int:
+    widths = [get_type_width(c.type) for c in columns]
+    return get_data_width(widths, [_get_alignment(c, w) for c, w in zip(columns, widths)])
+
+
+def get_pages(rows: int, per_page: int) -> int:
+    return -(-rows // per_page)
+
+
+@dataclass
+class IndexSize:
+    '''
+    Estimated size of the index. `index` is None for the implicit indexes of
+    column-level primary keys and unique constraints. `entry_bytes` is the
+    leaf entry with its line pointer. `total_bytes` is None if the number of
+    rows is unknown.
+    '''
+    name: str
+    index: Optional[Index]
+    entry_bytes: int
+    total_bytes: Optional[int] = None
+
+    def __str__(self) -> str:
+        total = format_bytes(self.total_bytes) if self.total_bytes is not None else 'unknown'
+        return f'{self.name}: {self.entry_bytes} bytes per entry, {total}'
+
+
+@dataclass
+class TableSize:
+    '''
+    Estimated row width and size of the table. `row_bytes` is the tuple
+    header, null bitmap and data, aligned, with the line pointer. Sizes are
+    None if the number of rows is unknown.
+    '''
+    table: Table
+    rows: Optional[int]
+    header_bytes: int
+    data_bytes: int
+    row_bytes: int
+    table_bytes: Optional[int] = None
+    indexes: List[IndexSize] = field(default_factory=list)
+
+    @property
+    def index_bytes(self) -> Optional[int]:
+        if self.rows is None:
+            return None
+        return sum(i.total_bytes for i in self.indexes if i.total_bytes is not None)
+
+    @property
+    def total_bytes(self) -> Optional[int]:
+        if self.table_bytes is None:
+            return None
+        return self.table_bytes + self.index_bytes  # type: ignore
+
+    def __str__(self) -> str:
+        result = f'{self.table.full_name}: {self.row_bytes} bytes per row'
+        if self.rows is None:
+            return result
+        return (
+            f'{result}, {self.rows} rows, table {format_bytes(self.table_bytes)}, '  # type: ignore
+            f'indexes {format_bytes(self.index_bytes)}, total {format_bytes(self.total_bytes)}'  # type: ignore
+        )
+
+
+@dataclass
+class SchemaSize:
+    '''Sizes of the schema tables. Tables with unknown number of rows are not counted in totals.'''
+    schema: str
+    tables: List[TableSize] = field(default_factory=list)
+
+    @property
+    def rows(self) -> int:
+        return sum(t.rows for t in self.tables if t.rows is not None)
+
+    @property
+    def table_bytes(self) -> int:
+        return sum(t.table_bytes for t in self.tables if t.table_bytes is not None)
+
+    @property
+    def index_bytes(self) -> int:
+        return sum(t.index_bytes for t in self.tables if t.index_bytes is not None)
+
+    @property
+    def total_bytes(self) -> int:
+        return self.table_bytes + self.index_bytes
+
+    def __str__(self) -> str:
+        return (
+            f'{self.schema}: {len(self.tables)} tables, {self.rows} rows, '
+            f'tables {format_bytes(self.table_bytes)}, indexes {format_bytes(self.index_bytes)}, '
+            f'total {format_bytes(self.total_bytes)}'
+        )
+
+
+def estimate_index_entry(subjects: List[Union[str, Column, Expression, IndexSubject]],
+                         include: List[Union[str, Column]],
+                         type_: Optional[str] = None) -> int:
+    '''Leaf entry of the index: tuple header, aligned key data and line pointer.'''
+    if type_ == 'hash':
+        data = HASH_CODE_WIDTH
+    else:
+        values = [unwrap_subject(s) for s in (*subjects, *include)]
+        columns = [v for v in values if isinstance(v, Column)]
+        data = get_columns_width(columns) + DEFAULT_WIDTH * (len(values) - len(columns))
+    return align(INDEX_TUPLE_HEADER + data) + LINE_POINTER
+
+
+def estimate_index_bytes(entry_bytes: int, rows: int, type_: str = 'btree') -> int:
+    '''Leaf pages, upper levels of the tree and the metapage.'''
+    check_rows(rows)
+    usable = (PAGE_SIZE - PAGE_HEADER - BTREE_SPECIAL) * FILLFACTORS[type_] // 100
+    per_page = max(usable // entry_bytes, 2)
+    pages = level = get_pages(rows, per_page)
+    while type_ == 'btree' and level > 1:
+        level = get_pages(level, per_page)
+        pages += level
+    return (pages + 1) * PAGE_SIZE
+
+
+def _index_name(index: Index) -> str:
+    return index.name or f'({", ".join(index.subject_names)})'
+
+
+def estimate_indexes(table: Table, rows: Optional[int]) -> List[IndexSize]:
+    '''Sizes of btree and hash indexes of the table, including implicit ones.'''
+    keys: List[tuple] = []
+    pk = [c for c in table.columns if c.pk]
+    if pk:
+        keys.append((f'primary key ({", ".join(c.name for c in pk)})', None, pk, [], None))
+    keys.extend((f'unique ({c.name})', None, [c], [], None) for c in table.columns if c.unique)
+    keys.extend((_index_name(i), i, i.subjects, i.include, i.type) for i in table.indexes)
+    result = []
+    for name, index, subjects, include, type_ in keys:
+        type_ = type_ or 'btree'
+        if type_ not in FILLFACTORS:
+            continue
+        entry = estimate_index_entry(subjects, include, type_)
+        total = estimate_index_bytes(entry, rows, type_) if rows is not None else None
+        result.append(IndexSize(name=name, index=index, entry_bytes=entry, total_bytes=total))
+    return result
+
+
+def estimate_table_size(table: Table, rows: Optional[int] = None) -> TableSize:
+    '''
+    Estimate row width and size of the table. `rows` overrides the number of
+    rows from the table properties.
+    '''
+    if rows is None:
+        rows = get_rows(table)
+    else:
+        check_rows(rows)
+    nullable = any(not (c.not_null or c.pk) for c in table.columns)
+    bitmap = -(-len(table.columns) // 8) if nullable else 0
+    header = align(TUPLE_HEADER + bitmap)
+    data = get_columns_width(table.columns)
+    row = align(header + data) + LINE_POINTER
+    table_bytes = None
+    if rows is not None:
+        per_page = min(max((PAGE_SIZE - PAGE_HEADER) // row, 1), MAX_HEAP_TUPLES_PER_PAGE)
+        table_bytes = get_pages(rows, per_page) * PAGE_SIZE
+    return TableSize(
+        table=table,
+        rows=rows,
+        header_bytes=header,
+        data_bytes=data,
+        row_bytes=row,
+        table_bytes=table_bytes,
+        indexes=estimate_indexes(table, rows),
+    )
+
+
+def estimate_sizes(db: 'Database', rows: Optional[Dict[str, int]] = None) -> List[SchemaSize]:
+    '''
+    Estimate sizes of all tables, grouped by schema. `rows` maps full table
+    names (`public.users`) to numbers of rows, overriding the properties.
+    '''
+    rows = rows or {}
+    schemas: Dict[str, SchemaSize] = {}
+    for table in db.tables:
+        schema = schemas.get(table.schema)
+        if schema is None:
+            schema = schemas[table.schema] = SchemaSize(table.schema)
+        schema.tables.append(estimate_table_size(table, rows.get(table.full_name)))
+    return list(schemas.values())
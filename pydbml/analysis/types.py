@@ -0,0 +1,193 @@
+'''
+Storage of PostgreSQL types: length and alignment of values. Lengths and
+alignments are those of pg_type on 64-bit platforms.
+'''
+import re
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from pydbml.classes import Enum
+
+# length of variable-length types, like typlen in pg_type
+VARIABLE_LENGTH = -1
+
+# the largest alignment, row data starts at a multiple of it
+MAX_ALIGN = 8
+
+
+@dataclass(frozen=True)
+class TypeInfo:
+    '''Length of the type values in bytes and their alignment.'''
+    length: int
+    align: int
+
+    @property
+    def variable(self) -> bool:
+        return self.length == VARIABLE_LENGTH
+
+
+@dataclass(frozen=True)
+class ParsedType:
+    '''
+    Type string, split into the lowercase name, arguments and the number of
+    array dimensions: `numeric(10, 2)[]` is ('numeric', ('10', '2'), 1).
+    '''
+    name: str
+    args: Tuple[str, ...] = ()
+    array_dims: int = 0
+
+
+def _info(length: int, align: int, *names: str) -> Dict[str, TypeInfo]:
+    return {name: TypeInfo(length, align) for name in names}
+
+
+TYPES: Dict[str, TypeInfo] = {
+    **_info(1, 1, 'bool', 'boolean', '"char"'),
+    **_info(2, 2, 'int2', 'smallint', 'smallserial', 'serial2'),
+    **_info(4, 4, 'int4', 'int', 'integer', 'serial', 'serial4', 'float4', 'real', 'date', 'oid', 'xid', 'cid'),
+    **_info(
+        8, 8,
+        'int8', 'bigint', 'bigserial', 'serial8', 'float8', 'double precision', 'float', 'money',
+        'time', 'time without time zone', 'timestamp', 'timestamp without time zone',
+        'timestamptz', 'timestamp with time zone', 'datetime', 'pg_lsn'
+    ),
+    **_info(12, 8, 'timetz', 'time with time zone'),
+    **_info(16, 8, 'interval', 'point'),
+    **_info(16, 1, 'uuid'),
+    **_info(6, 2, 'tid'),
+    **_info(6, 4, 'macaddr'),
+    **_info(8, 4, 'macaddr8'),
+    **_info(24, 8, 'line', 'circle'),
+    **_info(32, 8, 'lseg', 'box'),
+    **_info(
+        VARIABLE_LENGTH, 4,
+        'text', 'varchar', 'character varying', 'char', 'character', 'bpchar', 'name',
+        'numeric', 'decimal', 'bytea', 'json', 'jsonb', 'xml', 'inet', 'cidr',
+        'bit', 'varbit', 'bit varying', 'tsvector', 'tsquery', 'citext'
+    ),
+    **_info(VARIABLE_LENGTH, 8, 'path', 'polygon'),
+}
+
+# enum values are stored as oids
+ENUM_TYPE = TYPES['oid']
+
+# average width of variable-length values without a length limit, the
+# PostgreSQL planner assumes the same
+DEFAULT_WIDTH = 32
+
+VARHDRSZ = 4
+
+# types, whose argument is the maximum length in characters, one byte each
+CHAR_TYPES = ('varchar', 'character varying', 'char', 'character', 'bpchar')
+
+# decimal digits per numeric digit and bytes in numeric header
+NUMERIC_DEC_DIGITS = 4
+NUMERIC_HEADER = 8
+
+# array header without dimensions and the number of elements, assumed
+ARRAY_HEADER = 16
+ARRAY_ELEMENTS = 4
+
+_type_re = re.compile(
+    r'^(?P<name>[^(\[]+?)\s*'
+    r'(?:\((?P<args>[^)]*)\)\s*(?P<suffix>[^\[]*?)\s*)?'
+    r'(?P<array>(?:\[\s*\d*\s*\]\s*)*)$'
+)
+
+
+@lru_cache(maxsize=None)
+def parse_type(type_: str) -> ParsedType:
+    '''
+    >>> parse_type('Character Varying(255)')
+    ParsedType(name='character varying', args=('255',), array_dims=0)
+    >>> parse_type('timestamp(3) with time zone')
+    ParsedType(name='timestamp with time zone', args=('3',), array_dims=0)
+    >>> parse_type('numeric(10, 2)[][]')
+    ParsedType(name='numeric', args=('10', '2'), array_dims=2)
+    '''
+    normalized = ' '.join(type_.lower().split())
+    match = _type_re.match(normalized)
+    if not match:
+        return ParsedType(normalized)
+    name = match['name'].strip('"') if match['name'] != '"char"' else match['name']
+    if match['suffix']:
+        name = f'{name} {match["suffix"]}'
+    args = tuple(a.strip() for a in match['args'].split(',')) if match['args'] else ()
+    return ParsedType(name, args, match['array'].count('['))
+
+
+def get_type_info(type_: Union[str, Enum]) -> Optional[TypeInfo]:
+    '''
+    Length and alignment of the column type, None if the type is unknown.
+    Arrays are variable-length, aligned as their elements, but at least to
+    4 bytes.
+    '''
+    if isinstance(type_, Enum):
+        return ENUM_TYPE
+    parsed = parse_type(type_)
+    info = TYPES.get(parsed.name)
+    if info is None or not parsed.array_dims:
+        return info
+    return TypeInfo(VARIABLE_LENGTH, max(info.align, 4))
+
+
+def get_max_width(parsed: ParsedType) -> Optional[int]:
+    '''Maximum width of variable-length values with a length limit.'''
+    if not parsed.args or not parsed.args[0].isdigit():
+        return None
+    if parsed.name in CHAR_TYPES:
+        return int(parsed.args[0]) + VARHDRSZ
+    if parsed.name in ('numeric', 'decimal'):
+        digits = (int(parsed.args[0]) + 2 * (NUMERIC_DEC_DIGITS - 1)) // NUMERIC_DEC_DIGITS
+        return NUMERIC_HEADER + digits * 2
+    return None
+
+
+def get_type_width(type_: Union[str, Enum]) -> int:
+    '''
+    Average width of the values in bytes. Variable-length values are
+    estimated as by the PostgreSQL planner: the maximum width if it is small,
+    otherwise 32 bytes and half of the rest. Arrays are assumed to hold 4
+    elements.
+
+    >>> get_type_width('bigint')
+    8
+    >>> get_type_width('varchar(255)')
+    145
+    >>> get_type_width('numeric(10, 2)')
+    16
+    >>> get_type_width('int[]')
+    40
+    '''
+    if isinstance(type_, Enum):
+        return ENUM_TYPE.length
+    return _get_width(type_)
+
+
+@lru_cache(maxsize=None)
+def _get_width(type_: str) -> int:
+    parsed = parse_type(type_)
+    info = TYPES.get(parsed.name)
+    if parsed.array_dims:
+        element = ParsedType(parsed.name, parsed.args)
+        element_width = _get_element_width(element, info)
+        return ARRAY_HEADER + 8 * parsed.array_dims + ARRAY_ELEMENTS * element_width
+    if info is not None and not info.variable:
+        return info.length
+    max_width = get_max_width(parsed)
+    if max_width is None:
+        return DEFAULT_WIDTH
+    if parsed.name in ('char', 'character', 'bpchar') or max_width <= DEFAULT_WIDTH:
+        return max_width
+    return (max_width - DEFAULT_WIDTH) // 2 + DEFAULT_WIDTH
+
+
+def _get_element_width(element: ParsedType, info: Optional[TypeInfo]) -> int:
+    if info is not None and not info.variable:
+        return info.length
+    return get_max_width(element) or DEFAULT_WIDTH
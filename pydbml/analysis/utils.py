@@ -0,0 +1,36 @@
+from typing import List
+
+from pydbml.classes import Column, Index, Table
+from pydbml._classes.index import unwrap_subject
+
+# index types, which serve lookups by the leading key columns
+LOOKUP_INDEX_TYPES = (None, 'btree')
+
+
+def get_leading_columns(index: Index) -> List[Column]:
+    '''Columns at the start of the index key, up to the first expression.'''
+    result = []
+    for subject in index.subjects:
+        subject = unwrap_subject(subject)
+        if not isinstance(subject, Column):
+            break
+        result.append(subject)
+    return result
+
+
+def get_lookup_keys(table: Table) -> List[List[Column]]:
+    '''
+    Column lists of the table keys, which serve lookups by their leading
+    columns: the primary key, unique columns and btree indexes. Partial
+    indexes are skipped, they don't cover all rows.
+    '''
+    pk = [c for c in table.columns if c.pk]
+    result = [pk] if pk else []
+    result.extend([c] for c in table.columns if c.unique)
+    for index in table.indexes:
+        if index.where or index.type not in LOOKUP_INDEX_TYPES:
+            continue
+        columns = get_leading_columns(index)
+        if columns:
+            result.append(columns)
+    return result
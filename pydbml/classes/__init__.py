@@ -3,7 +3,10 @@ from .._classes.enum import Enum
 from .._classes.enum import EnumItem
 from .._classes.expression import Expression
 from .._classes.index import Index
+from .._classes.index import IndexSubject
 from .._classes.note import Note
+from .._classes.partition import Partition
+from .._classes.partition import PartitionKey
 from .._classes.project import Project
 from .._classes.reference import Reference
 from .._classes.sticky_note import StickyNote
@@ -16,7 +19,10 @@ __all__ = [
     "EnumItem",
     "Expression",
     "Index",
+    "IndexSubject",
     "Note",
+    "Partition",
+    "PartitionKey",
     "Project",
     "Reference",
     "StickyNote",
@@ -1,11 +1,18 @@
 from typing import Any, Type
+from typing import IO
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
+from typing import TYPE_CHECKING
 
 from ._classes.sticky_note import StickyNote
+from .classes import Column
 from .classes import Enum
+from .classes import Index
+from .classes import Note
+from .classes import Partition
 from .classes import Project
 from .classes import Reference
 from .classes import Table
@@ -15,6 +22,63 @@ from .renderer.base import BaseRenderer
 from .renderer.dbml.default.renderer import DefaultDBMLRenderer
 from .renderer.sql.default import DefaultSQLRenderer
 
+if TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Executor
+
+# path of an object from its database: attribute names and list positions
+Path = Tuple[Union[str, int], ...]
+
+# database lists of top-level objects and table lists of their parts
+_DATABASE_LISTS = (
+    (Table, 'tables'),
+    (Reference, 'refs'),
+    (Enum, 'enums'),
+    (TableGroup, 'table_groups'),
+    (StickyNote, 'sticky_notes'),
+)
+_TABLE_LISTS = ((Column, 'columns'), (Index, 'indexes'), (Partition, 'partitions'))
+
+
+def _position(items: List[Any], obj: Any) -> Optional[int]:
+    return next((i for i, item in enumerate(items) if item is obj), None)
+
+
+def get_path(obj: Any) -> Optional[Tuple['Database', Path]]:
+    '''
+    Database of the object and the path to the object from it, like
+    `('tables', 2, 'columns', 0)`. None if the object is not in a database.
+    '''
+    if isinstance(obj, Note):
+        found = get_path(obj.parent) if obj.parent is not None else None
+        if found is None or getattr(obj.parent, 'note', None) is not obj:
+            return None
+        return found[0], (*found[1], 'note')
+    for cls, name in _TABLE_LISTS:
+        if isinstance(obj, cls):
+            found = get_path(obj.table) if obj.table is not None else None
+            position = _position(getattr(obj.table, name), obj) if found else None
+            if found is None or position is None:
+                return None
+            return found[0], (*found[1], name, position)
+    db = getattr(obj, 'database', None)
+    if not isinstance(db, Database):
+        return None
+    if isinstance(obj, Project):
+        return (db, ('project',)) if db.project is obj else None
+    for model, attr in _DATABASE_LISTS:
+        if isinstance(obj, model):
+            position = _position(getattr(db, attr), obj)
+            return (db, (attr, position)) if position is not None else None
+    return None
+
+
+def resolve_path(db: 'Database', path: Path) -> Any:
+    '''Object of the database at the path, returned by `get_path`.'''
+    result: Any = db
+    for step in path:
+        result = result[step] if isinstance(step, int) else getattr(result, step)
+    return result
+
 
 class Database:
     def __init__(
@@ -33,10 +97,26 @@ class Database:
         self.sticky_notes: List['StickyNote'] = []
         self.project: Optional['Project'] = None
         self.allow_properties = allow_properties
+        # peak of memory, allocated by the parse, if it was traced
+        self.peak_memory: Optional[int] = None
 
     def __repr__(self) -> str:
         return f"<Database>"
 
+    def __reduce__(self):
+        '''
+        Pickle the database as a flat list of records without back-references.
+        They are rebuilt when the database is unpickled.
+        '''
+        from .interchange import from_document, to_document
+        return (from_document, (to_document(self), self.sql_renderer, self.dbml_renderer))
+
+    def __copy__(self) -> 'Database':
+        '''Shallow copy, sharing the objects and their lists with this database.'''
+        result = self.__class__.__new__(self.__class__)
+        result.__dict__.update(self.__dict__)
+        return result
+
     def __getitem__(self, k: Union[int, str]) -> Table:
         if isinstance(k, int):
             return self.tables[k]
@@ -77,6 +157,11 @@ class Database:
             raise DatabaseValidationError(f'Table {obj.full_name} is already in the database.')
         if obj.alias and obj.alias in self.table_dict:
             raise DatabaseValidationError(f'Table {obj.alias} is already in the database.')
+        for partition in obj.partitions:
+            if partition.full_name in self.table_dict:
+                raise DatabaseValidationError(
+                    f'Partition {partition.full_name} has the same name as a table in the database.'
+                )
 
         self._set_database(obj)
 
@@ -201,7 +286,41 @@ class Database:
         '''Returs SQL of the parsed results'''
         return self.sql_renderer.render_db(self)
 
+    @property
+    def phased_sql(self):
+        '''
+        Returns SQL split into pre-data, post-data indexes and post-data
+        constraints scripts for bulk loads
+        '''
+        return self.sql_renderer.render_db_phased(self)
+
     @property
     def dbml(self):
         '''Generates DBML code out of parsed results'''
         return self.dbml_renderer.render_db(self)
+
+    async def asql(self, executor: Optional['Executor'] = None) -> str:
+        '''Render SQL in an executor without blocking the event loop'''
+        from .aio import render_sql, run_in_executor
+        return await run_in_executor(render_sql, self, executor=executor)
+
+    async def adbml(self, executor: Optional['Executor'] = None) -> str:
+        '''Render DBML in an executor without blocking the event loop'''
+        from .aio import render_dbml, run_in_executor
+        return await run_in_executor(render_dbml, self, executor=executor)
+
+    def to_json(self, fp: IO[str]) -> None:
+        '''Write the database to a text stream in PyDBML JSON format'''
+        from .interchange import dump
+        dump(self, fp)
+
+    @classmethod
+    def from_json(
+        cls,
+        fp: IO[str],
+        sql_renderer: Type[BaseRenderer] = DefaultSQLRenderer,
+        dbml_renderer: Type[BaseRenderer] = DefaultDBMLRenderer,
+    ) -> 'Database':
+        '''Read a database from a text stream in PyDBML JSON format'''
+        from .interchange import load
+        return load(fp, sql_renderer=sql_renderer, dbml_renderer=dbml_renderer)
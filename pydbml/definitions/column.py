@@ -19,7 +19,7 @@ from pydbml.parser.blueprints import ColumnBlueprint
 
 pp.ParserElement.set_default_whitespace_chars(' \t\r')
 
-type_args = ("(" + pp.original_text_for(expression) + ")")
+type_args = "(" + expression + ")"
 
 # column type is parsed as a single string, it will be split by blueprint
 column_type = pp.Combine((name + pp.Literal('[]')) | (name + '.' + name) | ((name) + type_args[0, 1]))
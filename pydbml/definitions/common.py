@@ -1,3 +1,5 @@
+import re
+
 import pyparsing as pp
 
 from .generic import string_literal
@@ -5,16 +7,77 @@ from pydbml.parser.blueprints import NoteBlueprint
 
 pp.ParserElement.set_default_whitespace_chars(' \t\r')
 
-comment = (
-    pp.Suppress("//") + pp.SkipTo(pp.LineEnd())
-    | pp.Suppress('/*') + ... + pp.Suppress('*/')
-)
+_line_comment = r'//[ \t\r]*([^\n]*)'
+_block_comment = r'/\*[ \t\r]*(.*?)\*/'
+
+
+class Comment(pp.Token):
+    '''`// text` or `/* text */`, the result is the comment text.'''
+
+    _pattern = re.compile(f'{_line_comment}|{_block_comment}', re.DOTALL)
+
+    def __init__(self) -> None:
+        super().__init__()
+        # named results hold a list, like for compound expressions
+        self.saveAsList = True
+        self.mayIndexError = False
+        self.errmsg = 'Expected comment'
+
+    def parseImpl(self, instring, loc, do_actions=True):
+        match = self._pattern.match(instring, loc)
+        if match is None:
+            raise pp.ParseException(instring, loc, self.errmsg, self)
+        return match.end(), [match[match.lastindex]]
+
+
+class Blank(pp.Token):
+    '''Newlines and comments, skipped in one pass.'''
+
+    _pattern = re.compile(rf'[ \t\r\n]+|{_line_comment}|{_block_comment}', re.DOTALL)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.mayReturnEmpty = True
+        self.mayIndexError = False
+        self.errmsg = 'Expected comment'
+
+    def parseImpl(self, instring, loc, do_actions=True):
+        match = self._pattern.match
+        while True:
+            token = match(instring, loc)
+            if token is None:
+                return loc, []
+            loc = token.end()
+
+
+class CommentsBefore(Blank):
+    '''
+    Newlines and comments, lexed in one pass. Comment texts are returned as
+    tokens and collected under the `comment_before` results name, one list
+    item per comment.
+    '''
+
+    def parseImpl(self, instring, loc, do_actions=True):
+        match = self._pattern.match
+        result = pp.ParseResults([])
+        while True:
+            token = match(instring, loc)
+            if token is None:
+                return loc, result
+            loc = token.end()
+            if token.lastindex:
+                result += pp.ParseResults(
+                    [token[token.lastindex]], name='comment_before', asList=True, modal=False
+                )
+
+
+comment = Comment()
 
 # optional comment or newline
-_ = ('\n' | comment)[...].suppress()
+_ = Blank()
 
 # optional comment or newline, but comments are captured
-_c = (pp.Suppress('\n') | comment('comment_before*'))[...]
+_c = CommentsBefore()
 
 # optional captured comment
 c = comment('comment')[0, 1]
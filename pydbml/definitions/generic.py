@@ -1,3 +1,5 @@
+import re
+
 import pyparsing as pp
 
 from pydbml.parser.blueprints import ExpressionBlueprint
@@ -33,12 +35,48 @@ number_literal = (
 
 # Expression
 
-expr_chars = pp.Word(pp.alphanums + "\"'`,._+- \n\t")
-expr_chars_no_comma_space = pp.Word(pp.alphanums + "\"'`._+-")
-expression = pp.Forward()
-factor = (
-    pp.Word(pp.alphanums + '_')[0, 1] + '(' + expression + ')'
-    | expr_chars_no_comma_space + (pp.Literal(",") | ");" | (pp.LineEnd() + ");"))
-    | expr_chars
-)
-expression << factor[...]
+
+class BalancedExpression(pp.Token):
+    '''
+    Text with balanced parentheses, like column type arguments `10, 2` or
+    `'a', 'b(c)'`. The text is scanned once, without backtracking. Quoted
+    strings may contain any characters, an unclosed parenthesis ends the
+    match before it.
+    '''
+
+    _token = re.compile(
+        r"(?P<chars>[A-Za-z0-9_,.+\- \n\r\t]+)"
+        r"|(?P<string>'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|`[^`]*`)"
+        r"|(?P<open>\()"
+        r"|(?P<close>\))"
+        r"|(?P<quote>['\"`])",
+        re.DOTALL
+    )
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.mayReturnEmpty = True
+        self.mayIndexError = False
+        self.errmsg = 'Expected expression'
+
+    def parseImpl(self, instring, loc, do_actions=True):
+        match = self._token.match
+        depth = 0
+        pos = end = loc
+        while True:
+            token = match(instring, pos)
+            if token is None:
+                break
+            if token.lastgroup == 'open':
+                depth += 1
+            elif token.lastgroup == 'close':
+                if depth == 0:
+                    break
+                depth -= 1
+            pos = token.end()
+            if depth == 0:
+                end = pos
+        return end, instring[loc:end]
+
+
+expression = BalancedExpression()
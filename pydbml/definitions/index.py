@@ -11,6 +11,7 @@ from .generic import name
 from .generic import string_literal
 from pydbml.parser.blueprints import ExpressionBlueprint
 from pydbml.parser.blueprints import IndexBlueprint
+from pydbml.parser.blueprints import IndexSubjectBlueprint
 
 pp.ParserElement.set_default_whitespace_chars(' \t\r')
 
@@ -22,10 +23,30 @@ index_type = pp.CaselessLiteral("type:").suppress() + _ - (
     pp.CaselessLiteral("hash")('type') |
     pp.CaselessLiteral("spgist")('type')
 )
+storage_param_value = pp.Word(pp.alphanums + '_.') | string_literal
+storage_param = name + _ + pp.Suppress('=') + _ + storage_param_value
+storage_params = (
+    pp.Suppress('(') + _
+    + pp.Group(storage_param) + _
+    + (pp.Suppress(',') + _ - pp.Group(storage_param) + _)[...]
+    + pp.Suppress(')')
+)
+
 index_setting = _ + (
     unique('unique')
+    | pp.CaselessLiteral("concurrently")('concurrently')
+    | pp.Group(
+        pp.CaselessLiteral("if") + pp.CaselessLiteral("not") + pp.CaselessLiteral("exists")
+    )('if_not_exists')
     | index_type
     | pp.CaselessLiteral("name:") + _ - string_literal('name')
+    | pp.CaselessLiteral("where:") + _ - expression_literal('where')
+    | pp.CaselessLiteral("with:") + _ - pp.Group(storage_params)('storage_params')
+    | pp.CaselessLiteral("tablespace:") + _ - name('tablespace')
+    | pp.CaselessLiteral("include:") + _ - pp.Group(
+        pp.Suppress('(') + _ + name + _ + (pp.Suppress(',') + _ + name + _)[...] + pp.Suppress(')')
+        | name
+    )('include')
     | note('note')
     | pk('pk')
 ) + _
@@ -36,7 +57,9 @@ index_settings = (
 
 def parse_index_settings(s, lok, tok):
     '''
-    [type: btree, name: 'name', unique, note: 'note']
+    [type: btree, name: 'name', unique, where: `deleted_at is null`,
+     include: (col1, col2), concurrently, if not exists,
+     with: (fillfactor = 70), tablespace: fast, note: 'note']
     '''
     result = {}
     if 'unique' in tok:
@@ -47,6 +70,18 @@ def parse_index_settings(s, lok, tok):
         result['pk'] = True
     if 'type' in tok:
         result['type'] = tok['type']
+    if 'where' in tok:
+        result['where'] = tok['where']
+    if 'include' in tok:
+        result['include'] = list(tok['include'])
+    if 'concurrently' in tok:
+        result['concurrently'] = True
+    if 'if_not_exists' in tok:
+        result['if_not_exists'] = True
+    if 'storage_params' in tok:
+        result['storage_params'] = {k: v for k, v in tok['storage_params']}
+    if 'tablespace' in tok:
+        result['tablespace'] = tok['tablespace']
     if 'note' in tok:
         result['note'] = tok['note']
     if 'comment' in tok:
@@ -56,12 +91,44 @@ def parse_index_settings(s, lok, tok):
 
 index_settings.set_parse_action(parse_index_settings)
 
-subject = name | expression_literal
+order = pp.CaselessKeyword('asc') | pp.CaselessKeyword('desc')
+nulls = pp.CaselessKeyword('nulls').suppress() - (
+    pp.CaselessKeyword('first') | pp.CaselessKeyword('last')
+)('nulls')
+collation = pp.CaselessKeyword('collate').suppress() - name('collation')
+opclass = (
+    ~(order | pp.CaselessKeyword('nulls') | pp.CaselessKeyword('collate'))
+    + pp.Word(pp.alphanums + '_.')('opclass')
+)
+# Several single indexes may be defined on one line, so a bare operator class
+# is allowed only inside parentheses: `(name text_ops)`
+subject_options = collation[0, 1] + order('order')[0, 1] + nulls[0, 1]
+composite_subject_options = collation[0, 1] + opclass[0, 1] + order('order')[0, 1] + nulls[0, 1]
+
+
+def parse_subject(s, loc, tok):
+    '''
+    name
+    or
+    created_at collate "C" desc nulls last
+    or, inside parentheses
+    `lower(name)` text_pattern_ops
+    '''
+    options = {k: tok[k] for k in ('order', 'nulls', 'collation', 'opclass') if k in tok}
+    if not options:
+        return tok['value']
+    return IndexSubjectBlueprint(subject=tok['value'], **options)
+
+
+subject = ((name | expression_literal)('value') + subject_options).set_parse_action(parse_subject)
+composite_subject = (
+    (name | expression_literal)('value') + composite_subject_options
+).set_parse_action(parse_subject)
 composite_index_syntax = (
     pp.Suppress('(')
-    + subject + (
+    + composite_subject + (
         pp.Suppress(',')
-        + subject
+        + composite_subject
     )[...]
     + pp.Suppress(')')
 )('subject') + c + index_settings('settings')[0, 1]
@@ -89,7 +156,7 @@ def parse_index(s, lok, tok):
         ]
     '''
     init_dict = {}
-    if isinstance(tok['subject'], (str, ExpressionBlueprint)):
+    if isinstance(tok['subject'], (str, ExpressionBlueprint, IndexSubjectBlueprint)):
         subjects = [tok['subject']]
     else:
         subjects = list(tok['subject'])
@@ -1,12 +1,16 @@
 import pyparsing as pp
 
+from pydbml.parser.blueprints import PartitionBlueprint
+from pydbml.parser.blueprints import PartitionKeyBlueprint
 from pydbml.parser.blueprints import TableBlueprint
 from .column import table_column, table_column_with_properties
 from .common import _, hex_color
 from .common import _c
+from .common import c
 from .common import end
 from .common import note
 from .common import note_object
+from .generic import expression_literal
 from .generic import name, string_literal
 from .index import indexes
 
@@ -14,29 +18,104 @@ pp.ParserElement.set_default_whitespace_chars(' \t\r')
 
 alias = pp.WordStart() + pp.Literal('as').suppress() - pp.WordEnd() - name
 
+table_name = (name('schema') + '.' + name('name')) | (name('name'))
+
+partition_method = (
+    pp.CaselessKeyword('range')
+    | pp.CaselessKeyword('list')
+    | pp.CaselessKeyword('hash')
+)
+partition_subject = name | expression_literal
+partition_by = (
+    pp.CaselessLiteral('partition').suppress() + pp.CaselessLiteral('by:').suppress() + _
+    - partition_method('method') + _
+    - pp.Suppress('(') + _
+    - pp.Group(
+        partition_subject + _
+        + (pp.Suppress(',') + _ - partition_subject + _)[...]
+    )('subjects')
+    - pp.Suppress(')')
+)
+
+
+def parse_partition_by(s, loc, tok):
+    '''
+    partition by: range(created_at)
+    or
+    partition by: list(country, `lower(city)`)
+    '''
+    return PartitionKeyBlueprint(
+        method=tok['method'],
+        subject_names=list(tok['subjects'])
+    )
+
+
+partition_by.set_parse_action(parse_partition_by)
+
 
 header_color = (
     pp.CaselessLiteral('headercolor:').suppress() + _
     - pp.Combine(hex_color)('header_color')
 )
-table_setting = _ + (note('note') | header_color) + _
+table_setting = _ + (note('note') | header_color | partition_by('partition_by')) + _
 table_settings = '[' + table_setting + (',' + table_setting)[...] + ']'
 
 
 def parse_table_settings(s, loc, tok):
     '''
-    [headercolor: #cccccc, note: 'note']
+    [headercolor: #cccccc, note: 'note', partition by: range(created_at)]
     '''
     result = {}
     if 'note' in tok:
         result['note'] = tok['note']
     if 'header_color' in tok:
         result['header_color'] = tok['header_color']
+    if 'partition_by' in tok:
+        result['partition_by'] = tok['partition_by']
     return result
 
 
 table_settings.set_parse_action(parse_table_settings)
 
+partition_bound = (
+    pp.Suppress('[') + _
+    - (
+        pp.CaselessLiteral('values:').suppress() + _ - expression_literal('values')
+        | pp.CaselessKeyword('default')('default')
+    ) + _
+    - pp.Suppress(']')
+)
+partition = _c + table_name + partition_bound + c
+
+partitions = (
+    pp.CaselessLiteral('partitions').suppress() + _
+    - pp.Suppress('{')
+    - partition[1, ...] + _
+    + pp.Suppress('}')
+)
+
+
+def parse_partition(s, loc, tok):
+    '''
+    bookings_2024 [values: `FROM ('2024-01-01') TO ('2025-01-01')`]
+    or
+    archive.bookings_old [default] // rows out of all ranges
+    '''
+    init_dict = {'name': tok['name']}
+    if 'schema' in tok:
+        init_dict['schema'] = tok['schema']
+    if 'values' in tok:
+        init_dict['values'] = tok['values']
+    # comments after the bound have priority
+    if 'comment' in tok:
+        init_dict['comment'] = tok['comment'][0]
+    elif 'comment_before' in tok:
+        init_dict['comment'] = '\n'.join(c[0] for c in tok['comment_before'])
+    return PartitionBlueprint(**init_dict)
+
+
+partition.set_parse_action(parse_partition)
+
 
 note_element = note | note_object
 
@@ -45,20 +124,20 @@ prop = name + pp.Suppress(":") + string_literal
 table_element = _ + (
     table_column.set_results_name('columns', list_all_matches=True) |
     note_element('note') |
-    indexes.set_results_name('indexes', list_all_matches=True)
+    indexes.set_results_name('indexes', list_all_matches=True) |
+    partitions.set_results_name('partitions', list_all_matches=True)
 ) + _
 table_element_with_property = _ + (
     table_column_with_properties.set_results_name('columns', list_all_matches=True) |
     note_element('note') |
     indexes.set_results_name('indexes', list_all_matches=True) |
+    partitions.set_results_name('partitions', list_all_matches=True) |
     prop.set_results_name('property', list_all_matches=True)
 ) + _
 
 table_body = table_element[...]
 table_body_with_properties = table_element_with_property[...]
 
-table_name = (name('schema') + '.' + name('name')) | (name('name'))
-
 table = _c + (
     pp.CaselessLiteral("table").suppress()
     + table_name
@@ -87,6 +166,10 @@ def parse_table(s, loc, tok):
       indexes {
           (id, country) [pk] // composite primary key
       }
+
+      partitions {
+          bookings_2024 [values: `FROM ('2024-01-01') TO ('2025-01-01')`]
+      }
     }
     '''
     init_dict = {
@@ -103,6 +186,8 @@ def parse_table(s, loc, tok):
         init_dict['note'] = tok['note'][0]
     if 'indexes' in tok:
         init_dict['indexes'] = tok['indexes'][0]
+    if 'partitions' in tok:
+        init_dict['partitions'] = list(tok['partitions'][0])
     if 'columns' in tok:
         init_dict['columns'] = tok['columns']
     if 'comment_before' in tok:
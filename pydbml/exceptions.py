@@ -10,6 +10,10 @@ class IndexNotFoundError(Exception):
     pass
 
 
+class PartitionNotFoundError(Exception):
+    pass
+
+
 class AttributeMissingError(Exception):
     pass
 
@@ -32,3 +36,7 @@ class DatabaseValidationError(Exception):
 
 class ValidationError(Exception):
     pass
+
+
+class RedundantIndexError(Exception):
+    pass
@@ -0,0 +1,495 @@
+'''
+JSON interchange format for PyDBML databases.
+
+The document is a single JSON object with the following top-level keys:
+
+    {
+        "format": "pydbml",
+        "version": 1,
+        "allow_properties": false,
+        "project": {...} | null,
+        "enums": [{...}, ...],
+        "tables": [{...}, ...],
+        "refs": [{...}, ...],
+        "table_groups": [{...}, ...],
+        "sticky_notes": [{...}, ...]
+    }
+
+Objects never contain back-pointers. Cross references are stored by name:
+tables as `[schema, name]` pairs, columns by name inside their table and
+enums as `{"enum": [schema, name]}` in column types. See docs/json.md for the
+full description of each record.
+'''
+import json
+from typing import Any
+from typing import Dict
+from typing import IO
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+
+from pydbml.classes import Column
+from pydbml.classes import Enum
+from pydbml.classes import EnumItem
+from pydbml.classes import Expression
+from pydbml.classes import Index
+from pydbml.classes import IndexSubject
+from pydbml.classes import Note
+from pydbml.classes import Partition
+from pydbml.classes import PartitionKey
+from pydbml.classes import Project
+from pydbml.classes import Reference
+from pydbml.classes import StickyNote
+from pydbml.classes import Table
+from pydbml.classes import TableGroup
+from pydbml.database import Database
+from pydbml.exceptions import ColumnNotFoundError
+from pydbml.exceptions import DBMLError
+from pydbml.exceptions import TableNotFoundError
+from pydbml.renderer.base import BaseRenderer
+from pydbml.renderer.dbml.default import DefaultDBMLRenderer
+from pydbml.renderer.sql.default import DefaultSQLRenderer
+
+FORMAT_NAME = 'pydbml'
+FORMAT_VERSION = 1
+
+Record = Dict[str, Any]
+TableKey = Tuple[str, str]
+
+
+def _note_to_record(note: Optional[Note]) -> Optional[str]:
+    return note.text if note else None
+
+
+def _value_to_record(val: Any) -> Any:
+    if isinstance(val, Expression):
+        return {'expression': val.text}
+    return val
+
+
+def _value_from_record(val: Any) -> Any:
+    if isinstance(val, dict):
+        return Expression(val['expression'])
+    return val
+
+
+def enum_to_record(enum: Enum) -> Record:
+    return {
+        'name': enum.name,
+        'schema': enum.schema,
+        'comment': enum.comment,
+        'items': [
+            {'name': i.name, 'note': _note_to_record(i.note), 'comment': i.comment}
+            for i in enum.items
+        ]
+    }
+
+
+def column_to_record(col: Column) -> Record:
+    if isinstance(col.type, Enum):
+        type_: Any = {'enum': [col.type.schema, col.type.name]}
+    else:
+        type_ = col.type
+    return {
+        'name': col.name,
+        'type': type_,
+        'unique': col.unique,
+        'not_null': col.not_null,
+        'pk': col.pk,
+        'autoinc': col.autoinc,
+        'default': _value_to_record(col.default),
+        'note': _note_to_record(col.note),
+        'comment': col.comment,
+        'properties': col.properties,
+    }
+
+
+def _index_subject_to_record(subj: Any) -> Any:
+    if isinstance(subj, IndexSubject):
+        return {
+            'subject': _index_subject_to_record(subj.subject),
+            'order': subj.order,
+            'nulls': subj.nulls,
+            'collation': subj.collation,
+            'opclass': subj.opclass,
+        }
+    if isinstance(subj, Column):
+        return {'column': subj.name}
+    return _value_to_record(subj)
+
+
+def index_to_record(index: Index) -> Record:
+    return {
+        'subjects': [_index_subject_to_record(s) for s in index.subjects],
+        'name': index.name,
+        'unique': index.unique,
+        'type': index.type,
+        'pk': index.pk,
+        'note': _note_to_record(index.note),
+        'comment': index.comment,
+        'where': _value_to_record(index.where),
+        'include': index.include_names,
+        'concurrently': index.concurrently,
+        'if_not_exists': index.if_not_exists,
+        'storage_params': index.storage_params,
+        'tablespace': index.tablespace,
+    }
+
+
+def partition_key_to_record(key: Optional[PartitionKey]) -> Optional[Record]:
+    if key is None:
+        return None
+    return {
+        'method': key.method,
+        'subjects': [_index_subject_to_record(s) for s in key.subjects],
+    }
+
+
+def partition_to_record(partition: Partition) -> Record:
+    values = partition.values
+    return {
+        'name': partition.name,
+        'schema': partition.schema,
+        'values': str(values) if values is not None else None,
+        'comment': partition.comment,
+    }
+
+
+def table_to_record(table: Table) -> Record:
+    return {
+        'name': table.name,
+        'schema': table.schema,
+        'alias': table.alias,
+        'note': _note_to_record(table.note),
+        'header_color': table.header_color,
+        'comment': table.comment,
+        'abstract': table.abstract,
+        'properties': table.properties,
+        'columns': [column_to_record(c) for c in table.columns],
+        'indexes': [index_to_record(i) for i in table.indexes],
+        'partition_by': partition_key_to_record(table.partition_by),
+        'partitions': [partition_to_record(p) for p in table.partitions],
+    }
+
+
+def _cols_to_record(cols: List[Column]) -> Record:
+    table = cols[0].table
+    if table is None:
+        raise TableNotFoundError(f'Table on {cols[0]} is not set')
+    return {
+        'table': [table.schema, table.name],
+        'columns': [c.name for c in cols]
+    }
+
+
+def reference_to_record(ref: Reference) -> Record:
+    return {
+        'type': ref.type,
+        'inline': ref._inline,
+        'name': ref.name,
+        'comment': ref.comment,
+        'on_update': ref.on_update,
+        'on_delete': ref.on_delete,
+        'col1': _cols_to_record(ref.col1),
+        'col2': _cols_to_record(ref.col2),
+    }
+
+
+def table_group_to_record(table_group: TableGroup) -> Record:
+    return {
+        'name': table_group.name,
+        'items': [[t.schema, t.name] for t in table_group.items],
+        'comment': table_group.comment,
+        'note': _note_to_record(table_group.note),
+        'color': table_group.color,
+    }
+
+
+def project_to_record(project: Project) -> Record:
+    return {
+        'name': project.name,
+        'items': project.items,
+        'note': _note_to_record(project.note),
+        'comment': project.comment,
+    }
+
+
+def sticky_note_to_record(sticky_note: StickyNote) -> Record:
+    return {'name': sticky_note.name, 'text': sticky_note.text}
+
+
+def _write_list(fp: IO[str], key: str, records: Iterable[Record]) -> None:
+    fp.write(f', "{key}": [')
+    for i, record in enumerate(records):
+        if i:
+            fp.write(', ')
+        fp.write(json.dumps(record))
+    fp.write(']')
+
+
+def to_document(db: Database) -> Record:
+    '''Convert the database into a JSON-compatible dict.'''
+
+    return {
+        'format': FORMAT_NAME,
+        'version': FORMAT_VERSION,
+        'allow_properties': db.allow_properties,
+        'project': project_to_record(db.project) if db.project else None,
+        'enums': [enum_to_record(e) for e in db.enums],
+        'tables': [table_to_record(t) for t in db.tables],
+        'refs': [reference_to_record(r) for r in db.refs],
+        'table_groups': [table_group_to_record(tg) for tg in db.table_groups],
+        'sticky_notes': [sticky_note_to_record(sn) for sn in db.sticky_notes],
+    }
+
+
+def dump(db: Database, fp: IO[str]) -> None:
+    '''
+    Write the database to a text stream as JSON. Objects are serialized and
+    written one by one, the whole document is never held in memory.
+    '''
+
+    fp.write(f'{{"format": "{FORMAT_NAME}", "version": {FORMAT_VERSION}')
+    fp.write(f', "allow_properties": {json.dumps(db.allow_properties)}')
+    project = project_to_record(db.project) if db.project else None
+    fp.write(f', "project": {json.dumps(project)}')
+    _write_list(fp, 'enums', (enum_to_record(e) for e in db.enums))
+    _write_list(fp, 'tables', (table_to_record(t) for t in db.tables))
+    _write_list(fp, 'refs', (reference_to_record(r) for r in db.refs))
+    _write_list(fp, 'table_groups', (table_group_to_record(tg) for tg in db.table_groups))
+    _write_list(fp, 'sticky_notes', (sticky_note_to_record(sn) for sn in db.sticky_notes))
+    fp.write('}')
+
+
+class _Loader:
+    '''Rebuilds database objects from records, resolving names through dicts.'''
+
+    def __init__(self, db: Database):
+        self.db = db
+        self.enums: Dict[TableKey, Enum] = {}
+        self.tables: Dict[TableKey, Table] = {}
+        self.columns: Dict[TableKey, Dict[str, Column]] = {}
+
+    def enum(self, record: Record) -> Enum:
+        result = Enum(
+            name=record['name'],
+            schema=record['schema'],
+            comment=record['comment'],
+            items=[
+                EnumItem(name=i['name'], note=i['note'], comment=i['comment'])
+                for i in record['items']
+            ]
+        )
+        self.enums[(result.schema, result.name)] = result
+        return result
+
+    def column(self, record: Record) -> Column:
+        type_ = record['type']
+        if isinstance(type_, dict):
+            key = tuple(type_['enum'])
+            try:
+                type_ = self.enums[key]  # type: ignore
+            except KeyError:
+                raise DBMLError(f'Enum {".".join(key)} is not defined')
+        return Column(
+            name=record['name'],
+            type=type_,
+            unique=record['unique'],
+            not_null=record['not_null'],
+            pk=record['pk'],
+            autoinc=record['autoinc'],
+            default=_value_from_record(record['default']),
+            note=record['note'],
+            comment=record['comment'],
+            properties=record['properties'],
+        )
+
+    def table(self, record: Record) -> Table:
+        result = Table(
+            name=record['name'],
+            schema=record['schema'],
+            alias=record['alias'],
+            note=record['note'],
+            header_color=record['header_color'],
+            comment=record['comment'],
+            abstract=record['abstract'],
+            properties=record['properties'],
+        )
+        columns: Dict[str, Column] = {}
+        for col_record in record['columns']:
+            col = self.column(col_record)
+            result.add_column(col)
+            columns[col.name] = col
+        for index_record in record['indexes']:
+            result.add_index(self.index(index_record, result, columns))
+        partition_by = record.get('partition_by')
+        if partition_by is not None:
+            result.partition_by = PartitionKey(
+                method=partition_by['method'],
+                subjects=[self.index_subject(s, result, columns) for s in partition_by['subjects']],
+            )
+        for partition_record in record.get('partitions', []):
+            result.add_partition(self.partition(partition_record))
+        key = (result.schema, result.name)
+        self.tables[key] = result
+        self.columns[key] = columns
+        return result
+
+    def index_subject(self, record: Any, table: Table, columns: Dict[str, Column]) -> Any:
+        if isinstance(record, dict) and 'subject' in record:
+            return IndexSubject(
+                subject=self.index_subject(record['subject'], table, columns),
+                order=record['order'],
+                nulls=record['nulls'],
+                collation=record['collation'],
+                opclass=record['opclass'],
+            )
+        if isinstance(record, dict) and 'column' in record:
+            return self._column(columns, record['column'], table.name)
+        return _value_from_record(record)
+
+    def index(self, record: Record, table: Table, columns: Dict[str, Column]) -> Index:
+        return Index(
+            subjects=[self.index_subject(s, table, columns) for s in record['subjects']],
+            name=record['name'],
+            unique=record['unique'],
+            type=record['type'],
+            pk=record['pk'],
+            note=record['note'],
+            comment=record['comment'],
+            where=_value_from_record(record.get('where')),
+            include=[
+                self._column(columns, name, table.name)
+                for name in record.get('include', [])
+            ],
+            concurrently=record.get('concurrently', False),
+            if_not_exists=record.get('if_not_exists', False),
+            storage_params=record.get('storage_params'),
+            tablespace=record.get('tablespace'),
+        )
+
+    @staticmethod
+    def partition(record: Record) -> Partition:
+        values = record['values']
+        return Partition(
+            name=record['name'],
+            schema=record['schema'],
+            values=Expression(values) if values is not None else None,
+            comment=record['comment'],
+        )
+
+    @staticmethod
+    def _column(columns: Dict[str, Column], name: str, table_name: str) -> Column:
+        try:
+            return columns[name]
+        except KeyError:
+            raise ColumnNotFoundError(f'Column {name} not present in table {table_name}')
+
+    def _table(self, key: List[str]) -> Table:
+        try:
+            return self.tables[tuple(key)]  # type: ignore
+        except KeyError:
+            raise TableNotFoundError(f'Table {".".join(key)} not present in the database')
+
+    def _cols(self, record: Record) -> List[Column]:
+        table = self._table(record['table'])
+        columns = self.columns[(table.schema, table.name)]
+        return [self._column(columns, c, table.name) for c in record['columns']]
+
+    def reference(self, record: Record) -> Reference:
+        return Reference(
+            type=record['type'],
+            col1=self._cols(record['col1']),
+            col2=self._cols(record['col2']),
+            name=record['name'],
+            comment=record['comment'],
+            on_update=record['on_update'],
+            on_delete=record['on_delete'],
+            inline=record['inline'],
+        )
+
+    def table_group(self, record: Record) -> TableGroup:
+        note = record['note']
+        return TableGroup(
+            name=record['name'],
+            items=[self._table(key) for key in record['items']],
+            comment=record['comment'],
+            note=Note(note) if note is not None else None,
+            color=record['color'],
+        )
+
+    @staticmethod
+    def project(record: Record) -> Project:
+        return Project(
+            name=record['name'],
+            items=record['items'],
+            note=record['note'],
+            comment=record['comment'],
+        )
+
+    @staticmethod
+    def sticky_note(record: Record) -> StickyNote:
+        return StickyNote(name=record['name'], text=record['text'])
+
+    def add_table(self, table: Table) -> None:
+        # Database.add_table scans the table list for equal tables, which makes
+        # loading quadratic. Name clashes are still caught by table_dict.
+        for name in (table.full_name, table.alias):
+            if name and name in self.db.table_dict:
+                raise DBMLError(f'Table {name} is already in the database.')
+        self.db._set_database(table)
+        self.db.tables.append(table)
+        self.db.table_dict[table.full_name] = table
+        if table.alias:
+            self.db.table_dict[table.alias] = table
+
+    def add_reference(self, ref: Reference) -> None:
+        # references come from a consistent database, skip the duplicate scan
+        self.db._set_database(ref)
+        self.db.refs.append(ref)
+
+    def load(self, document: Record) -> Database:
+        for record in document['enums']:
+            self.db.add_enum(self.enum(record))
+        for record in document['tables']:
+            self.add_table(self.table(record))
+        for record in document['refs']:
+            self.add_reference(self.reference(record))
+        for record in document['table_groups']:
+            self.db.add_table_group(self.table_group(record))
+        for record in document['sticky_notes']:
+            self.db.add_sticky_note(self.sticky_note(record))
+        if document['project'] is not None:
+            self.db.add_project(self.project(document['project']))
+        return self.db
+
+
+def from_document(
+    document: Record,
+    sql_renderer: Type[BaseRenderer] = DefaultSQLRenderer,
+    dbml_renderer: Type[BaseRenderer] = DefaultDBMLRenderer,
+) -> Database:
+    '''Build a database out of an already decoded JSON document.'''
+
+    if document.get('format') != FORMAT_NAME:
+        raise DBMLError('Not a PyDBML JSON document')
+    if document.get('version') != FORMAT_VERSION:
+        raise DBMLError(f'Unsupported PyDBML JSON version: {document.get("version")}')
+    db = Database(
+        sql_renderer=sql_renderer,
+        dbml_renderer=dbml_renderer,
+        allow_properties=document['allow_properties']
+    )
+    return _Loader(db).load(document)
+
+
+def load(
+    fp: IO[str],
+    sql_renderer: Type[BaseRenderer] = DefaultSQLRenderer,
+    dbml_renderer: Type[BaseRenderer] = DefaultDBMLRenderer,
+) -> Database:
+    '''Read a database from a text stream, produced by `dump`.'''
+
+    return from_document(json.load(fp), sql_renderer=sql_renderer, dbml_renderer=dbml_renderer)
@@ -12,7 +12,10 @@ from pydbml.classes import Enum
 from pydbml.classes import EnumItem
 from pydbml.classes import Expression
 from pydbml.classes import Index
+from pydbml.classes import IndexSubject
 from pydbml.classes import Note
+from pydbml.classes import Partition
+from pydbml.classes import PartitionKey
 from pydbml.classes import Project
 from pydbml.classes import Reference
 from pydbml.classes import Table
@@ -21,6 +24,7 @@ from pydbml._classes.sticky_note import StickyNote
 from pydbml.exceptions import ColumnNotFoundError
 from pydbml.exceptions import TableNotFoundError
 from pydbml.exceptions import ValidationError
+from pydbml.tools import intern_str
 from pydbml.tools import remove_indentation
 from pydbml.tools import strip_empty_lines
 
@@ -84,6 +88,13 @@ class ReferenceBlueprint(Blueprint):
     on_update: Optional[str] = None
     on_delete: Optional[str] = None
 
+    def __post_init__(self):
+        self.type = intern_str(self.type)
+        self.schema1 = intern_str(self.schema1)
+        self.schema2 = intern_str(self.schema2)
+        self.on_update = intern_str(self.on_update)
+        self.on_delete = intern_str(self.on_delete)
+
     def build(self) -> 'Reference':
         '''
         both tables and columns should be present before build
@@ -135,9 +146,15 @@ class ColumnBlueprint(Blueprint):
     comment: Optional[str] = None
     properties: Optional[Dict[str, str]] = None
 
+    def __post_init__(self):
+        self.type = intern_str(self.type)
+
     def build(self) -> 'Column':
-        if isinstance(self.default, ExpressionBlueprint):
-            self.default = self.default.build()
+        # blueprint is not modified, so that it can be built again
+        default = self.default
+        if isinstance(default, ExpressionBlueprint):
+            default = default.build()
+        type_: Union[str, Enum] = self.type
         if self.parser:
             if '.' in self.type:
                 schema, name = self.type.split('.')
@@ -145,25 +162,44 @@ class ColumnBlueprint(Blueprint):
                 schema, name = 'public', self.type
             for enum in self.parser.database.enums:
                 if (enum.schema, enum.name) == (schema, name):
-                    self.type = enum
+                    type_ = enum
                     break
         return Column(
             name=self.name,
-            type=self.type,
+            type=type_,
             unique=self.unique,
             not_null=self.not_null,
             pk=self.pk,
             autoinc=self.autoinc,
-            default=self.default,
+            default=default,
             note=self.note.build() if self.note else None,
             comment=self.comment,
             properties=self.properties,
         )
 
 
+@dataclass
+class IndexSubjectBlueprint(Blueprint):
+    subject: Union[str, ExpressionBlueprint]
+    order: Optional[Literal['asc', 'desc']] = None
+    nulls: Optional[Literal['first', 'last']] = None
+    collation: Optional[str] = None
+    opclass: Optional[str] = None
+
+    def build(self, subject: Union[str, Column, Expression]) -> 'IndexSubject':
+        '''`subject` is the resolved column or expression'''
+        return IndexSubject(
+            subject=subject,
+            order=self.order,
+            nulls=self.nulls,
+            collation=self.collation,
+            opclass=self.opclass
+        )
+
+
 @dataclass
 class IndexBlueprint(Blueprint):
-    subject_names: List[Union[str, ExpressionBlueprint]]
+    subject_names: List[Union[str, ExpressionBlueprint, IndexSubjectBlueprint]]
     name: Optional[str] = None
     unique: bool = False
     type: Optional[
@@ -180,9 +216,19 @@ class IndexBlueprint(Blueprint):
     pk: bool = False
     note: Optional[NoteBlueprint] = None
     comment: Optional[str] = None
+    where: Optional[ExpressionBlueprint] = None
+    # column names, resolved by TableBlueprint
+    include: Optional[List[str]] = None
+    concurrently: bool = False
+    if_not_exists: bool = False
+    storage_params: Optional[Dict[str, str]] = None
+    tablespace: Optional[str] = None
 
     table = None
 
+    def __post_init__(self):
+        self.type = intern_str(self.type)
+
     def build(self) -> 'Index':
         return Index(
             # TableBlueprint will process subjects
@@ -192,6 +238,40 @@ class IndexBlueprint(Blueprint):
             type=self.type,
             pk=self.pk,
             note=self.note.build() if self.note else None,
+            comment=self.comment,
+            where=self.where.build() if self.where else None,
+            concurrently=self.concurrently,
+            if_not_exists=self.if_not_exists,
+            storage_params=self.storage_params,
+            tablespace=self.tablespace
+        )
+
+
+@dataclass
+class PartitionKeyBlueprint(Blueprint):
+    method: Literal['range', 'list', 'hash']
+    subject_names: List[Union[str, ExpressionBlueprint]]
+
+    def build(self, subjects: List[Union[str, Column, Expression]]) -> 'PartitionKey':
+        '''`subjects` are the resolved columns and expressions'''
+        return PartitionKey(method=self.method, subjects=subjects)
+
+
+@dataclass
+class PartitionBlueprint(Blueprint):
+    name: str
+    schema: str = 'public'
+    values: Optional[ExpressionBlueprint] = None
+    comment: Optional[str] = None
+
+    def __post_init__(self):
+        self.schema = intern_str(self.schema)
+
+    def build(self) -> 'Partition':
+        return Partition(
+            name=self.name,
+            schema=self.schema,
+            values=self.values.build() if self.values else None,
             comment=self.comment
         )
 
@@ -207,6 +287,11 @@ class TableBlueprint(Blueprint):
     header_color: Optional[str] = None
     comment: Optional[str] = None
     properties: Optional[Dict[str, str]] = None
+    partition_by: Optional[PartitionKeyBlueprint] = None
+    partitions: Optional[List[PartitionBlueprint]] = None
+
+    def __post_init__(self):
+        self.schema = intern_str(self.schema)
 
     def build(self) -> 'Table':
         result = Table(
@@ -224,24 +309,55 @@ class TableBlueprint(Blueprint):
             result.add_column(col_bp.build())
         for index_bp in indexes:
             index = index_bp.build()
-            new_subjects: List[Union[str, Column, Expression]] = []
-            for subj in index_bp.subject_names:
-                if isinstance(subj, ExpressionBlueprint):
-                    new_subjects.append(subj.build())
-                else:
-                    for col in result.columns:
-                        if col.name == subj:
-                            new_subjects.append(col)
-                            break
-                    else:
-                        raise ColumnNotFoundError(
-                            f'Cannot add index, column "{subj}" not defined in'
-                            ' table "{self.name}".'
-                        )
-            index.subjects = new_subjects
+            index.subjects = [
+                self._build_index_subject(result, subj)
+                for subj in index_bp.subject_names
+            ]
+            index.include = [self._get_index_column(result, c) for c in index_bp.include or []]
             result.add_index(index)
+        if self.partition_by:
+            result.partition_by = self.partition_by.build([
+                self._build_partition_subject(result, subj)
+                for subj in self.partition_by.subject_names
+            ])
+        for partition_bp in self.partitions or []:
+            result.add_partition(partition_bp.build())
         return result
 
+    def _build_index_subject(
+        self,
+        table: 'Table',
+        subj: Union[str, ExpressionBlueprint, IndexSubjectBlueprint]
+    ) -> Union[Column, Expression, IndexSubject]:
+        if isinstance(subj, IndexSubjectBlueprint):
+            return subj.build(self._build_index_subject(table, subj.subject))  # type: ignore
+        if isinstance(subj, ExpressionBlueprint):
+            return subj.build()
+        return self._get_index_column(table, subj)
+
+    def _get_index_column(self, table: 'Table', name: str) -> 'Column':
+        for col in table.columns:
+            if col.name == name:
+                return col
+        raise ColumnNotFoundError(
+            f'Cannot add index, column "{name}" not defined in'
+            f' table "{self.name}".'
+        )
+
+    def _build_partition_subject(
+        self,
+        table: 'Table',
+        subj: Union[str, ExpressionBlueprint]
+    ) -> Union[Column, Expression]:
+        if isinstance(subj, ExpressionBlueprint):
+            return subj.build()
+        for col in table.columns:
+            if col.name == subj:
+                return col
+        raise ColumnNotFoundError(
+            f'Cannot partition table "{self.name}", column "{subj}" not defined.'
+        )
+
     def get_reference_blueprints(self):
         ''' the inline ones '''
         result = []
@@ -275,6 +391,9 @@ class EnumBlueprint(Blueprint):
     schema: str = 'public'
     comment: Optional[str] = None
 
+    def __post_init__(self):
+        self.schema = intern_str(self.schema)
+
     def build(self) -> 'Enum':
         return Enum(
             name=self.name,
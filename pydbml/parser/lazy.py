@@ -0,0 +1,260 @@
+'''
+Lazy parse mode. The source is split into top-level blocks by the scanner and
+tables are indexed by name. Table bodies are parsed into Table objects only
+when they are first accessed, references and table groups are built on
+demand.
+'''
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Type
+from typing import Union
+
+import pyparsing as pp
+
+from pydbml.classes import Table
+from pydbml.database import Database
+from pydbml.exceptions import DatabaseValidationError
+from pydbml.exceptions import TableNotFoundError
+from pydbml.renderer.base import BaseRenderer
+from pydbml.renderer.dbml.default import DefaultDBMLRenderer
+from pydbml.renderer.sql.default import DefaultSQLRenderer
+from .blueprints import ReferenceBlueprint
+from .blueprints import TableBlueprint
+from .blueprints import TableGroupBlueprint
+from .parser import PyDBMLParser
+from .parser import packrat_scope
+from .scanner import Block
+from .scanner import parse_table_name
+from .scanner import scan_blocks
+
+
+class LazyParser(PyDBMLParser):
+    '''Parser which parses the source block by block on request.'''
+
+    def __init__(self, source: str, allow_properties: bool = False, packrat: Union[bool, int] = False):
+        super().__init__(source, allow_properties=allow_properties, packrat=packrat)
+        self._set_syntax()
+
+    def parse_fragment(self, start: int, end: int) -> None:
+        '''Parse a part of the source, blueprints are collected as usual.'''
+        try:
+            with packrat_scope(self._packrat):
+                self._syntax.parse_string(self.source[start:end], parseAll=True)
+        except pp.ParseBaseException as e:
+            # report the position in the whole source
+            e.pstr = self.source
+            e.loc += start
+            raise
+
+    def locate_table(self, schema: str, name: str) -> 'Table':
+        if not self.database:
+            raise RuntimeError("Database is not ready")
+        for key in (name, f'{schema}.{name}'):
+            table = self.database.get_table(key)
+            if table is not None:
+                return table
+        raise TableNotFoundError(f"Table {schema}.{name} not present in the database")
+
+
+class LazyDatabase(Database):
+    '''
+    Database, which parses its tables on first access. `db['schema.table']`
+    parses a single table, iteration parses tables one by one. Accessing
+    `tables`, `refs`, `table_groups` or rendering the database parses
+    everything that is left.
+    '''
+
+    def __init__(
+        self,
+        source: str,
+        sql_renderer: Type[BaseRenderer] = DefaultSQLRenderer,
+        dbml_renderer: Type[BaseRenderer] = DefaultDBMLRenderer,
+        allow_properties: bool = False,
+        packrat: Union[bool, int] = False
+    ) -> None:
+        self._tables: List[Table] = []
+        self._refs: List[Any] = []
+        self._table_groups: List[Any] = []
+        super().__init__(
+            sql_renderer=sql_renderer,
+            dbml_renderer=dbml_renderer,
+            allow_properties=allow_properties
+        )
+        self._parser = LazyParser(source, allow_properties=allow_properties, packrat=packrat)
+        self._parser.database = self  # type: ignore
+
+        # table blocks in source order
+        self._table_blocks: List[Block] = []
+        # block start -> fragment start, including preceding comments
+        self._fragment_starts: Dict[int, int] = {}
+        # full name and alias -> table block
+        self._table_index: Dict[str, Block] = {}
+        # block start -> materialized table
+        self._built: Dict[int, Table] = {}
+        # id of materialized table -> its block start
+        self._positions: Dict[int, int] = {}
+        # block start -> references, defined in this block, in source order
+        self._block_refs: Dict[int, List[ReferenceBlueprint]] = {}
+        self._ref_blocks: List[Block] = []
+        self._pending_groups: List[TableGroupBlueprint] = []
+        self._refs_built = False
+        self._groups_built = False
+        self._scan()
+
+    def _scan(self) -> None:
+        source = self._parser.source
+        fragment_start = 0
+        eager = []
+        for block in scan_blocks(source):
+            self._fragment_starts[block.start] = fragment_start
+            fragment_start = block.end
+            if block.kind is None:
+                # let the grammar report the error
+                self._parse_fragment(block)
+            elif block.kind == 'table':
+                table_name = parse_table_name(source, block)
+                if table_name is None:
+                    # let the grammar report the error
+                    self._parse_fragment(block)
+                    continue  # pragma: no cover
+                self._table_blocks.append(block)
+                self._table_index[table_name.full_name] = block
+                if table_name.alias:
+                    self._table_index[table_name.alias] = block
+            elif block.kind == 'ref':
+                self._ref_blocks.append(block)
+                self._parse_fragment(block)
+                self._block_refs[block.start] = [self._parser.refs.pop()]
+            elif block.kind == 'table_group':
+                self._parse_fragment(block)
+                self._pending_groups.append(self._parser.table_groups.pop())
+            else:
+                eager.append(block)
+        for block in eager:
+            self._parse_fragment(block)
+        for enum_bp in self._parser.enums:
+            self.add_enum(enum_bp.build())
+        for note_bp in self._parser.sticky_notes:
+            self.add_sticky_note(note_bp.build())
+        if self._parser.project:
+            self.add_project(self._parser.project.build())
+        self._parser.enums = []
+        self._parser.sticky_notes = []
+        self._parser.project = None
+
+    def _parse_fragment(self, block: Block) -> None:
+        self._parser.parse_fragment(self._fragment_starts[block.start], block.end)
+
+    def _materialize(self, block: Block) -> Table:
+        table = self._built.get(block.start)
+        if table is not None:
+            return table
+        self._parse_fragment(block)
+        table_bp: TableBlueprint = self._parser.tables.pop()
+        self._block_refs[block.start] = self._parser.refs
+        self._parser.refs = []
+        table = table_bp.build()
+        self._built[block.start] = table
+        self._attach(table, block.start)
+        return table
+
+    def _attach(self, table: Table, position: int) -> None:
+        '''Add a parsed table, keeping the source order of tables.'''
+        for name in (table.full_name, table.alias):
+            if name and name in self.table_dict:
+                raise DatabaseValidationError(f'Table {name} is already in the database.')
+        self._set_database(table)
+        self._positions[id(table)] = position
+        index = len(self._tables)
+        while index and self._positions.get(id(self._tables[index - 1]), -1) > position:
+            index -= 1
+        self._tables.insert(index, table)
+        self.table_dict[table.full_name] = table
+        if table.alias:
+            self.table_dict[table.alias] = table
+
+    def delete_table(self, obj: Table) -> Table:
+        result = super().delete_table(obj)
+        self._positions.pop(id(result), None)
+        return result
+
+    def _materialize_all(self) -> None:
+        if len(self._built) < len(self._table_blocks):
+            for block in self._table_blocks:
+                self._materialize(block)
+
+    @property
+    def materialized(self) -> int:
+        '''Number of tables parsed so far.'''
+        return len(self._built)
+
+    def get_table(self, key: str) -> Optional[Table]:
+        '''Get table by full name or alias, parsing it if needed.'''
+        table = self.table_dict.get(key)
+        if table is None:
+            block = self._table_index.get(key)
+            if block is not None and block.start not in self._built:
+                table = self._materialize(block)
+        return table
+
+    def __getitem__(self, k: Any) -> Table:
+        if isinstance(k, str):
+            table = self.get_table(k)
+            if table is None:
+                raise KeyError(k)
+            return table
+        return super().__getitem__(k)
+
+    def __iter__(self) -> Iterator[Table]:
+        if len(self._built) == len(self._table_blocks):
+            return iter(self._tables)
+        return self._iter_lazy()
+
+    def _iter_lazy(self) -> Iterator[Table]:
+        for block in self._table_blocks:
+            table = self._materialize(block)
+            if table.database is self:
+                yield table
+        for table in list(self._tables):
+            if id(table) not in self._positions:
+                yield table
+
+    @property  # type: ignore
+    def tables(self) -> List[Table]:  # type: ignore
+        self._materialize_all()
+        return self._tables
+
+    @tables.setter
+    def tables(self, val: List[Table]) -> None:
+        self._tables = val
+
+    @property  # type: ignore
+    def refs(self) -> List[Any]:  # type: ignore
+        if not self._refs_built:
+            self._materialize_all()
+            self._refs_built = True
+            blocks = sorted((*self._table_blocks, *self._ref_blocks), key=lambda b: b.start)
+            for block in blocks:
+                for ref_bp in self._block_refs.pop(block.start, []):
+                    self.add_reference(ref_bp.build())
+        return self._refs
+
+    @refs.setter
+    def refs(self, val: List[Any]) -> None:
+        self._refs = val
+
+    @property  # type: ignore
+    def table_groups(self) -> List[Any]:  # type: ignore
+        if not self._groups_built:
+            self._groups_built = True
+            for table_group_bp in self._pending_groups:
+                self.add_table_group(table_group_bp.build())
+            self._pending_groups = []
+        return self._table_groups
+
+    @table_groups.setter
+    def table_groups(self, val: List[Any]) -> None:
+        self._table_groups = val
@@ -0,0 +1,137 @@
+'''
+Multi-file schemas. Every file is parsed into blueprints separately, the
+blueprints of all files are built into one Database, so references between
+files are resolved as usual. Parsed files are kept in a cache and parsed
+again only when they change.
+'''
+import os
+
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import Union
+
+from pydbml.database import Database
+from pydbml.renderer.base import BaseRenderer
+from pydbml.renderer.dbml.default import DefaultDBMLRenderer
+from pydbml.renderer.sql.default import DefaultSQLRenderer
+from .blueprints import EnumBlueprint
+from .blueprints import ProjectBlueprint
+from .blueprints import ReferenceBlueprint
+from .blueprints import StickyNoteBlueprint
+from .blueprints import TableBlueprint
+from .blueprints import TableGroupBlueprint
+from .parser import PyDBMLParser
+from .parser import read_file
+
+
+@dataclass
+class ParsedFile:
+    '''Blueprints of one file. `stamp` is the file modification time and size.'''
+    path: str
+    stamp: Tuple[int, int]
+    tables: List[TableBlueprint] = field(default_factory=list)
+    refs: List[ReferenceBlueprint] = field(default_factory=list)
+    enums: List[EnumBlueprint] = field(default_factory=list)
+    table_groups: List[TableGroupBlueprint] = field(default_factory=list)
+    sticky_notes: List[StickyNoteBlueprint] = field(default_factory=list)
+    project: Optional[ProjectBlueprint] = None
+
+
+class ParseCache:
+    '''
+    Parsed files by path. A file is parsed again only if its modification
+    time or size changed. The cache is not thread-safe.
+    '''
+
+    def __init__(self) -> None:
+        self._files: Dict[Tuple[str, bool], ParsedFile] = {}
+        self.parsed = 0
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def clear(self) -> None:
+        self._files.clear()
+
+    def get(
+        self,
+        path: Union[str, Path],
+        allow_properties: bool = False,
+        packrat: Union[bool, int] = False
+    ) -> ParsedFile:
+        key = (os.path.abspath(path), allow_properties)
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._files.get(key)
+        if cached is not None and cached.stamp == stamp:
+            return cached
+
+        parser = PyDBMLParser(read_file(path), allow_properties=allow_properties, packrat=packrat)
+        parser.parse_blueprints()
+        self.parsed += 1
+        result = ParsedFile(
+            path=key[0],
+            stamp=stamp,
+            tables=parser.tables,
+            refs=parser.refs,
+            enums=parser.enums,
+            table_groups=parser.table_groups,
+            sticky_notes=parser.sticky_notes,
+            project=parser.project,
+        )
+        self._files[key] = result
+        return result
+
+
+class MultiFileParser(PyDBMLParser):
+    '''
+    Parser, which builds one Database out of several files. Files are
+    processed in the given order, as if they were concatenated.
+    '''
+
+    def __init__(
+        self,
+        files: Iterable[Union[str, Path]],
+        cache: Optional[ParseCache] = None,
+        allow_properties: bool = False,
+        sql_renderer: Type[BaseRenderer] = DefaultSQLRenderer,
+        dbml_renderer: Type[BaseRenderer] = DefaultDBMLRenderer,
+        packrat: Union[bool, int] = False,
+    ):
+        super().__init__(
+            '',
+            allow_properties=allow_properties,
+            sql_renderer=sql_renderer,
+            dbml_renderer=dbml_renderer,
+            packrat=packrat,
+        )
+        self.files = list(files)
+        self.cache = ParseCache() if cache is None else cache
+
+    def parse(self) -> Database:
+        for path in self.files:
+            parsed = self.cache.get(path, allow_properties=self._allow_properties, packrat=self._packrat)
+            self.tables.extend(parsed.tables)
+            self.refs.extend(parsed.refs)
+            self.enums.extend(parsed.enums)
+            self.table_groups.extend(parsed.table_groups)
+            self.sticky_notes.extend(parsed.sticky_notes)
+            if parsed.project:
+                self.project = parsed.project
+        for blueprints in (self.tables, self.refs, self.enums, self.table_groups, self.sticky_notes):
+            for blueprint in blueprints:
+                self.adopt(blueprint)
+        if self.project:
+            self.adopt(self.project)
+        self.build_database()
+        return self.database  # type: ignore
+
+    def __repr__(self):
+        return "<MultiFileParser>"
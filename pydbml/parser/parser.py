@@ -1,10 +1,26 @@
 from __future__ import annotations
 
+import codecs
+import gzip
+import mmap
+import os
+import stat
+import threading
+import tracemalloc
+from contextlib import contextmanager
 from io import TextIOWrapper
 from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import IO
+from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import TYPE_CHECKING
+from typing import Tuple
 from typing import Type
+from typing import TypeVar
 from typing import Union
 
 import pyparsing as pp
@@ -22,15 +38,187 @@ from pydbml.exceptions import TableNotFoundError
 from pydbml.renderer.base import BaseRenderer
 from pydbml.renderer.dbml.default import DefaultDBMLRenderer
 from pydbml.renderer.sql.default import DefaultSQLRenderer
+from pydbml.tools import GZIP_MAGIC
+from pydbml.tools import decode_source
 from pydbml.tools import remove_bom
 from .blueprints import EnumBlueprint, StickyNoteBlueprint
 from .blueprints import ProjectBlueprint
 from .blueprints import ReferenceBlueprint
 from .blueprints import TableBlueprint
 from .blueprints import TableGroupBlueprint
+from .scanner import OutlineEntry
+from .scanner import outline
+from .scanner import to_byte_offsets
+
+if TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Executor
+    from .multifile import ParseCache
+    from .recovery import Diagnostic
 
 pp.ParserElement.set_default_whitespace_chars(" \t\r")
 
+# The first parse streamlines the grammar in place. Parsers share the inner
+# elements of the grammar, so it is done once here, and parsing in several
+# threads doesn't modify shared elements.
+for _expr in (table, table_with_properties, ref, enum, table_group, project, sticky_note, comment):
+    _expr.streamline()
+
+T = TypeVar('T')
+TableFilter = Union[str, Callable[[str], bool]]
+BytesSource = Union[bytes, bytearray, memoryview, mmap.mmap]
+FileSource = Union[str, Path, TextIOWrapper, IO[Any], mmap.mmap]
+
+
+def read_file(file: FileSource) -> str:
+    '''
+    Read DBML source from a path, a text or binary stream or an mmap object.
+    Binary input is decoded once, gzip-compressed input is decompressed.
+    Non-empty regular files are memory-mapped, so the contents are not copied
+    into a bytes object before decoding. Pipes and other special files are
+    read as streams.
+    '''
+    if isinstance(file, mmap.mmap):
+        return decode_source(file)
+    if isinstance(file, (str, Path)):
+        with open(file, 'rb') as f:
+            stats = os.fstat(f.fileno())
+            if not stat.S_ISREG(stats.st_mode) or stats.st_size == 0:
+                return decode_source(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return decode_source(mapped)
+    if hasattr(file, 'read'):
+        data = file.read()
+        if isinstance(data, str):
+            return remove_bom(data)
+        return decode_source(data)
+    raise TypeError("Source must be str, bytes, path, mmap or file stream")
+
+
+@contextmanager
+def trace_peak_memory(result: List[Optional[int]]) -> Iterator[None]:
+    '''
+    Trace Python memory allocations inside the block and append the peak of
+    memory, allocated in the block, in bytes to `result`. If tracemalloc is
+    already tracing, it is not stopped, but its peak is reset at the start of
+    the block, so the caller's own peak is lost. If the peak can't be reset
+    (Python 3.8), None is appended.
+    '''
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    elif hasattr(tracemalloc, 'reset_peak'):
+        tracemalloc.reset_peak()
+    else:  # pragma: no cover
+        result.append(None)
+        yield
+        return
+    before, _ = tracemalloc.get_traced_memory()
+    try:
+        yield
+    finally:
+        _, peak = tracemalloc.get_traced_memory()
+        if started:
+            tracemalloc.stop()
+        result.append(max(peak - before, 0))
+
+
+DEFAULT_PACKRAT_CACHE_SIZE = 128
+
+
+class _SharedLock:
+    '''
+    Lock with shared and exclusive modes. Waiting exclusive holders block
+    new shared holders, so they are not starved.
+    '''
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._shared = 0
+        self._exclusive = False
+        self._waiting = 0
+
+    @contextmanager
+    def shared(self) -> Iterator[None]:
+        with self._condition:
+            while self._exclusive or self._waiting:
+                self._condition.wait()
+            self._shared += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._shared -= 1
+                if not self._shared:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        with self._condition:
+            self._waiting += 1
+            try:
+                while self._exclusive or self._shared:
+                    self._condition.wait()
+            finally:
+                self._waiting -= 1
+            self._exclusive = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._exclusive = False
+                self._condition.notify_all()
+
+
+# regular parses run concurrently, parses with scoped memoization run alone
+_parse_lock = _SharedLock()
+_scope = threading.local()
+
+
+@contextmanager
+def packrat_scope(packrat: Union[bool, int] = True) -> Iterator[None]:
+    '''
+    Enable pyparsing packrat memoization inside the block and restore the
+    previous state afterwards. `packrat` is the cache size, `True` for the
+    default size.
+
+    The setting and the cache are process-wide in pyparsing, not per parse:
+    while the block runs, every pyparsing grammar in the process, not only
+    PyDBML, parses with memoization. To keep other PyDBML parses out of the
+    shared cache, a scoped block waits for parses in other threads to finish
+    and blocks them until it exits. Without `packrat` the block only marks a
+    parse, which may run alongside other parses. If memoization or left
+    recursion is already enabled globally, it is left as is. Nested blocks
+    keep the outer setting.
+    '''
+    if getattr(_scope, 'active', False):
+        yield
+        return
+    element = pp.ParserElement
+    memoize = not (packrat is False or packrat == 0)
+    lock = _parse_lock.exclusive() if memoize else _parse_lock.shared()
+    with lock:
+        _scope.active = True
+        try:
+            saved_cache = element.packrat_cache
+            if memoize:
+                cache_size = DEFAULT_PACKRAT_CACHE_SIZE if packrat is True else int(packrat)
+                try:
+                    element.enable_packrat(cache_size)
+                except RuntimeError:
+                    # left recursion is enabled globally, it excludes packrat
+                    memoize = False
+            # enable_packrat keeps the cache if memoization is already enabled
+            if not memoize or element.packrat_cache is saved_cache:
+                yield
+                return
+            try:
+                yield
+            finally:
+                element.disable_memoization()
+                element.packrat_cache = saved_cache
+        finally:
+            _scope.active = False
+
 
 class PyDBML:
     """
@@ -52,28 +240,35 @@ class PyDBML:
 
     def __new__(
         cls,
-        source_: Optional[Union[str, Path, TextIOWrapper]] = None,
+        source_: Optional[Union[str, BytesSource, FileSource]] = None,
         allow_properties: bool = False,
         sql_renderer: Type[BaseRenderer] = DefaultSQLRenderer,
         dbml_renderer: Type[BaseRenderer] = DefaultDBMLRenderer,
+        low_memory: bool = False,
+        lazy: bool = False,
+        table_filter: Optional[TableFilter] = None,
+        include_referenced: bool = False,
+        packrat: Union[bool, int] = False,
+        trace_memory: bool = False,
     ):
         if source_ is not None:
             if isinstance(source_, str):
-                source = source_
-            elif isinstance(source_, Path):
-                with open(source_, encoding="utf8") as f:
-                    source = f.read()
-            elif isinstance(source_, TextIOWrapper):
-                source = source_.read()
+                source = remove_bom(source_)
+            elif isinstance(source_, (bytes, bytearray, memoryview)):
+                source = decode_source(source_)
             else:
-                raise TypeError("Source must be str, path or file stream")
-
-            source = remove_bom(source)
+                source = read_file(source_)
             return cls.parse(
                 source,
                 allow_properties=allow_properties,
                 sql_renderer=sql_renderer,
                 dbml_renderer=dbml_renderer,
+                low_memory=low_memory,
+                lazy=lazy,
+                table_filter=table_filter,
+                include_referenced=include_referenced,
+                packrat=packrat,
+                trace_memory=trace_memory,
             )
         else:
             return super().__new__(cls)
@@ -83,31 +278,200 @@ class PyDBML:
 
     @staticmethod
     def parse(
-        text: str,
+        text: Union[str, BytesSource],
         allow_properties: bool = False,
         sql_renderer: Type[BaseRenderer] = DefaultSQLRenderer,
         dbml_renderer: Type[BaseRenderer] = DefaultDBMLRenderer,
+        low_memory: bool = False,
+        lazy: bool = False,
+        table_filter: Optional[TableFilter] = None,
+        include_referenced: bool = False,
+        packrat: Union[bool, int] = False,
+        trace_memory: bool = False,
     ) -> Database:
-        text = remove_bom(text)
+        '''
+        Parse DBML source: a string, bytes or a binary stream.
+
+        `packrat` enables pyparsing packrat memoization for this parse, see
+        `packrat_scope`. Pyparsing keeps this setting for the whole process,
+        so the parse runs alone and other pyparsing code in the process is
+        memoized until it finishes.
+
+        With `trace_memory` the peak of memory, allocated during the parse,
+        is traced and stored in `peak_memory` of the result, see
+        `trace_peak_memory`.
+        '''
+        if trace_memory:
+            peak: List[Optional[int]] = []
+            with trace_peak_memory(peak):
+                result = PyDBML.parse(
+                    text,
+                    allow_properties=allow_properties,
+                    sql_renderer=sql_renderer,
+                    dbml_renderer=dbml_renderer,
+                    low_memory=low_memory,
+                    lazy=lazy,
+                    table_filter=table_filter,
+                    include_referenced=include_referenced,
+                    packrat=packrat,
+                )
+            result.peak_memory = peak[0]
+            return result
+        text = remove_bom(text) if isinstance(text, str) else decode_source(text)
+        if low_memory and (lazy or table_filter is not None):
+            raise ValueError("Low-memory mode can't be used with lazy mode or table filter")
+        if table_filter is not None:
+            if lazy:
+                raise ValueError("Table filter can't be used in lazy mode")
+            from .selective import SelectiveParser
+            return SelectiveParser(
+                text,
+                table_filter,
+                include_referenced=include_referenced,
+                allow_properties=allow_properties,
+                sql_renderer=sql_renderer,
+                dbml_renderer=dbml_renderer,
+                packrat=packrat,
+            ).parse()
+        if lazy:
+            from .lazy import LazyDatabase
+            return LazyDatabase(
+                text,
+                allow_properties=allow_properties,
+                sql_renderer=sql_renderer,
+                dbml_renderer=dbml_renderer,
+                packrat=packrat,
+            )
         parser = PyDBMLParser(
             text,
             allow_properties=allow_properties,
             sql_renderer=sql_renderer,
             dbml_renderer=dbml_renderer,
+            low_memory=low_memory,
+            packrat=packrat,
         )
         return parser.parse()
 
     @staticmethod
-    def parse_file(file: Union[str, Path, TextIOWrapper]) -> Database:
-        if isinstance(file, TextIOWrapper):
-            source = file.read()
-        else:
-            with open(file, encoding="utf8") as f:
-                source = f.read()
-        source = remove_bom(source)
-        parser = PyDBMLParser(source)
+    def parse_file(
+        file: FileSource,
+        low_memory: bool = False,
+        lazy: bool = False,
+        table_filter: Optional[TableFilter] = None,
+        include_referenced: bool = False,
+        packrat: Union[bool, int] = False,
+        trace_memory: bool = False,
+    ) -> Database:
+        return PyDBML.parse(
+            read_file(file),
+            low_memory=low_memory,
+            lazy=lazy,
+            table_filter=table_filter,
+            include_referenced=include_referenced,
+            packrat=packrat,
+            trace_memory=trace_memory,
+        )
+
+    @staticmethod
+    async def aparse_file(
+        file: FileSource,
+        low_memory: bool = False,
+        lazy: bool = False,
+        table_filter: Optional[TableFilter] = None,
+        include_referenced: bool = False,
+        packrat: Union[bool, int] = False,
+        trace_memory: bool = False,
+        executor: Optional[Executor] = None,
+    ) -> Database:
+        '''
+        Read and parse the file in an executor without blocking the event
+        loop. Jobs, running at the same time, are limited by
+        `pydbml.aio.set_concurrency_limit`.
+        '''
+        from pydbml.aio import run_in_executor
+        return await run_in_executor(
+            PyDBML.parse_file,
+            file,
+            low_memory=low_memory,
+            lazy=lazy,
+            table_filter=table_filter,
+            include_referenced=include_referenced,
+            packrat=packrat,
+            trace_memory=trace_memory,
+            executor=executor,
+        )
+
+    @staticmethod
+    def parse_files(
+        files: Iterable[Union[str, Path]],
+        cache: Optional[ParseCache] = None,
+        allow_properties: bool = False,
+        sql_renderer: Type[BaseRenderer] = DefaultSQLRenderer,
+        dbml_renderer: Type[BaseRenderer] = DefaultDBMLRenderer,
+        packrat: Union[bool, int] = False,
+    ) -> Database:
+        '''
+        Parse a schema, split into several files, into one database. Tables
+        may reference tables from other files. Pass the same `ParseCache`
+        to reuse files, which didn't change since the previous call.
+        '''
+        from .multifile import MultiFileParser
+        parser = MultiFileParser(
+            files,
+            cache=cache,
+            allow_properties=allow_properties,
+            sql_renderer=sql_renderer,
+            dbml_renderer=dbml_renderer,
+            packrat=packrat,
+        )
+        return parser.parse()
+
+    @staticmethod
+    def parse_with_diagnostics(
+        text: Union[str, BytesSource],
+        allow_properties: bool = False,
+        sql_renderer: Type[BaseRenderer] = DefaultSQLRenderer,
+        dbml_renderer: Type[BaseRenderer] = DefaultDBMLRenderer,
+        packrat: Union[bool, int] = False,
+    ) -> Tuple[Database, List[Diagnostic]]:
+        '''
+        Parse the source without stopping at the first error. Blocks with
+        errors are skipped, parsing resumes at the next top-level keyword.
+        Returns the database, built from valid blocks, and the list of errors.
+        '''
+        from .recovery import RecoveringParser
+        text = remove_bom(text) if isinstance(text, str) else decode_source(text)
+        parser = RecoveringParser(
+            text,
+            allow_properties=allow_properties,
+            sql_renderer=sql_renderer,
+            dbml_renderer=dbml_renderer,
+            packrat=packrat,
+        )
         return parser.parse()
 
+    @staticmethod
+    def outline(source: Union[str, BytesSource]) -> List[OutlineEntry]:
+        '''
+        List kinds, names and positions of top-level objects (tables, enums,
+        refs, table groups, project and sticky notes) without running the
+        parser. Positions are character offsets for a str source and byte
+        offsets for bytes-like input. Gzip-compressed input is decompressed
+        first, offsets are then in the decompressed data.
+        '''
+        if isinstance(source, str):
+            return outline(remove_bom(source))
+        data = bytes(source)
+        if data[:2] == GZIP_MAGIC:
+            data = gzip.decompress(data)
+        shift = len(codecs.BOM_UTF8) if data.startswith(codecs.BOM_UTF8) else 0
+        text = data[shift:].decode('utf-8')
+        result = outline(text)
+        if shift or len(text) != len(data):
+            # BOM or non-ASCII text, character and byte offsets differ
+            to_byte_offsets(text, result, shift)
+        return result
+
 
 class PyDBMLParser:
     def __init__(
@@ -116,6 +480,9 @@ class PyDBMLParser:
         allow_properties: bool = False,
         sql_renderer: Type[BaseRenderer] = DefaultSQLRenderer,
         dbml_renderer: Type[BaseRenderer] = DefaultDBMLRenderer,
+        low_memory: bool = False,
+        packrat: Union[bool, int] = False,
+        trace_memory: bool = False,
     ):
         self.database = None
 
@@ -130,13 +497,35 @@ class PyDBMLParser:
         self._allow_properties = allow_properties
         self._sql_renderer = sql_renderer
         self._dbml_renderer = dbml_renderer
+        self._low_memory = low_memory
+        self._packrat = packrat
+        self._trace_memory = trace_memory
+        self.peak_memory: Optional[int] = None
 
     def parse(self):
-        self._set_syntax()
-        self._syntax.parse_string(self.source, parseAll=True)
+        if not self._trace_memory:
+            return self._parse()
+        peak: List[Optional[int]] = []
+        with trace_peak_memory(peak):
+            result = self._parse()
+        self.peak_memory = peak[0]
+        return result
+
+    def _parse(self):
+        self.parse_blueprints()
+        if self._low_memory:
+            # parse actions hold a reference to the parser
+            self._syntax = None
+            self.source = ''
         self.build_database()
         return self.database
 
+    def parse_blueprints(self) -> None:
+        '''Run the grammar, collecting blueprints without building the database.'''
+        self._set_syntax()
+        with packrat_scope(self._packrat):
+            self._syntax.parse_string(self.source, parseAll=True)
+
     def __repr__(self):
         return "<PyDBMLParser>"
 
@@ -171,39 +560,44 @@ class PyDBMLParser:
         blueprint = tok[0]
         if isinstance(blueprint, TableBlueprint):
             self.tables.append(blueprint)
-            ref_bps = blueprint.get_reference_blueprints()
-            col_bps = blueprint.columns or []
-            index_bps = blueprint.indexes or []
-            for ref_bp in ref_bps:
+            for ref_bp in blueprint.get_reference_blueprints():
                 self.refs.append(ref_bp)
                 ref_bp.parser = self
-            for col_bp in col_bps:
-                col_bp.parser = self
-                if col_bp.note:
-                    col_bp.note.parser = self
-            for index_bp in index_bps:
-                index_bp.parser = self
-                if index_bp.note:
-                    index_bp.note.parser = self
-            if blueprint.note:
-                blueprint.note.parser = self
         elif isinstance(blueprint, ReferenceBlueprint):
             self.refs.append(blueprint)
         elif isinstance(blueprint, EnumBlueprint):
             self.enums.append(blueprint)
-            for enum_item in blueprint.items:
-                if enum_item.note:
-                    enum_item.note.parser = self
         elif isinstance(blueprint, TableGroupBlueprint):
             self.table_groups.append(blueprint)
         elif isinstance(blueprint, ProjectBlueprint):
             self.project = blueprint
-            if blueprint.note:
-                blueprint.note.parser = self
         elif isinstance(blueprint, StickyNoteBlueprint):
             self.sticky_notes.append(blueprint)
         else:
             raise RuntimeError(f"type unknown: {blueprint}")
+        self.adopt(blueprint)
+
+    def adopt(self, blueprint):
+        '''
+        Set this parser on the blueprint and its nested blueprints, so that
+        they are built against this parser's database.
+        '''
+        if isinstance(blueprint, TableBlueprint):
+            for col_bp in blueprint.columns or []:
+                col_bp.parser = self
+                if col_bp.note:
+                    col_bp.note.parser = self
+            for index_bp in blueprint.indexes or []:
+                index_bp.parser = self
+                if index_bp.note:
+                    index_bp.note.parser = self
+        elif isinstance(blueprint, EnumBlueprint):
+            for enum_item in blueprint.items:
+                if enum_item.note:
+                    enum_item.note.parser = self
+        note = getattr(blueprint, 'note', None)
+        if note:
+            note.parser = self
         blueprint.parser = self
 
     def locate_table(self, schema: str, name: str) -> "Table":
@@ -218,22 +612,40 @@ class PyDBMLParser:
             raise TableNotFoundError(f"Table {full_name} not present in the database")
         return result
 
+    def _blueprints(self, blueprints: List[T]) -> Iterator[T]:
+        '''
+        Iterate over blueprints for build. In low-memory mode the list is
+        emptied on the way, so each blueprint is freed right after it was built.
+        '''
+        if not self._low_memory:
+            yield from blueprints
+            return
+        blueprints.reverse()
+        while blueprints:
+            blueprint = blueprints.pop()
+            yield blueprint
+            blueprint.parser = None  # type: ignore
+
     def build_database(self):
         self.database = Database(
             allow_properties=self._allow_properties,
             sql_renderer=self._sql_renderer,
             dbml_renderer=self._dbml_renderer,
         )
-        for enum_bp in self.enums:
+        for enum_bp in self._blueprints(self.enums):
             self.database.add(enum_bp.build())
-        for table_bp in self.tables:
+        for table_bp in self._blueprints(self.tables):
             self.database.add(table_bp.build())
             self.ref_blueprints.extend(table_bp.get_reference_blueprints())
-        for table_group_bp in self.table_groups:
+        for table_group_bp in self._blueprints(self.table_groups):
             self.database.add(table_group_bp.build())
-        for note_bp in self.sticky_notes:
+        for note_bp in self._blueprints(self.sticky_notes):
             self.database.add(note_bp.build())
         if self.project:
             self.database.add(self.project.build())
-        for ref_bp in self.refs:
+            if self._low_memory:
+                self.project = None
+        for ref_bp in self._blueprints(self.refs):
             self.database.add(ref_bp.build())
+        if self._low_memory:
+            self.ref_blueprints.clear()
@@ -0,0 +1,198 @@
+'''
+Error-recovering parse. The source is split into top-level blocks by the
+scanner and every block is parsed separately. A block with a syntax error is
+skipped and parsing resumes at the next top-level keyword, the errors are
+collected as diagnostics. Valid blocks are built into a partial Database.
+'''
+import re
+
+from dataclasses import dataclass
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import Union
+
+import pyparsing as pp
+
+from pydbml.database import Database
+from pydbml.exceptions import AttributeMissingError
+from pydbml.exceptions import ColumnNotFoundError
+from pydbml.exceptions import DatabaseValidationError
+from pydbml.exceptions import DBMLError
+from pydbml.exceptions import IndexNotFoundError
+from pydbml.exceptions import TableNotFoundError
+from pydbml.exceptions import UnknownDatabaseError
+from pydbml.exceptions import ValidationError
+from pydbml.renderer.base import BaseRenderer
+from pydbml.renderer.dbml.default import DefaultDBMLRenderer
+from pydbml.renderer.sql.default import DefaultSQLRenderer
+from .lazy import LazyParser
+from .parser import PyDBMLParser
+from .scanner import Block
+from .scanner import scan_blocks
+
+BUILD_ERRORS = (
+    AttributeMissingError,
+    ColumnNotFoundError,
+    DatabaseValidationError,
+    DBMLError,
+    IndexNotFoundError,
+    TableNotFoundError,
+    UnknownDatabaseError,
+    ValidationError,
+)
+
+# line, which looks like a start of a top-level block
+_block_start = re.compile(
+    r'^[ \t]*(?:'
+    r'(?:table|enum|tablegroup|project)\b'
+    r'|ref\b[^\n]*[:{]'
+    r'|note[ \t]+(?:"[^"\n]*"|\w+)\s*\{'
+    r')',
+    re.IGNORECASE | re.MULTILINE
+)
+
+
+@dataclass
+class Diagnostic:
+    '''
+    Error found during the parse. `line` and `column` are 1-based, `offset`
+    is the position in the source string.
+    '''
+    message: str
+    line: int
+    column: int
+    offset: int
+
+    def __str__(self) -> str:
+        return f'{self.line}:{self.column}: {self.message}'
+
+
+def _parse_error_message(error: pp.ParseBaseException) -> str:
+    found = getattr(error, 'found', None)
+    return f'{error.msg}, found {found}' if found else error.msg
+
+
+class RecoveringParser(LazyParser):
+    '''
+    Parser, which doesn't stop at the first error. `parse` returns the
+    database, built from valid blocks, and the list of diagnostics.
+    '''
+
+    def __init__(
+        self,
+        source: str,
+        allow_properties: bool = False,
+        sql_renderer: Type[BaseRenderer] = DefaultSQLRenderer,
+        dbml_renderer: Type[BaseRenderer] = DefaultDBMLRenderer,
+        packrat: Union[bool, int] = False,
+    ):
+        super().__init__(source, allow_properties=allow_properties, packrat=packrat)
+        self._sql_renderer = sql_renderer
+        self._dbml_renderer = dbml_renderer
+        self.diagnostics: List[Diagnostic] = []
+        # id of blueprint -> start of its block
+        self._positions: Dict[int, int] = {}
+
+    # tables are built into a regular Database
+    locate_table = PyDBMLParser.locate_table
+
+    def parse(self) -> Tuple[Database, List[Diagnostic]]:  # type: ignore
+        self._parse_blocks()
+        self._build()
+        self.diagnostics.sort(key=lambda d: d.offset)
+        return self.database, self.diagnostics  # type: ignore
+
+    def _add_diagnostic(self, message: str, offset: int) -> None:
+        self.diagnostics.append(
+            Diagnostic(
+                message=message,
+                line=pp.lineno(offset, self.source),
+                column=pp.col(offset, self.source),
+                offset=offset
+            )
+        )
+
+    def _parse_blocks(self) -> None:
+        blocks: Iterator[Block] = scan_blocks(self.source)
+        fragment_start = 0
+        in_unknown_text = False
+        while True:
+            block = next(blocks, None)
+            if block is None:
+                return
+            start, fragment_start = fragment_start, block.end
+            if block.kind is None and in_unknown_text:
+                # report a run of unknown lines once
+                continue
+            in_unknown_text = block.kind is None
+            resume = self._parse_block(start, block)
+            if resume is not None:
+                fragment_start = resume
+                blocks = scan_blocks(self.source, resume)
+
+    def _parse_block(self, start: int, block: Block) -> Optional[int]:
+        '''
+        Parse the block, keeping its blueprints. On error, drop them and
+        return the position to resume parsing from, if it is inside the block.
+        '''
+        lists: List[List[Any]] = [self.tables, self.refs, self.enums, self.table_groups, self.sticky_notes]
+        sizes = [len(bps) for bps in lists]
+        project = self.project
+        try:
+            self.parse_fragment(start, block.end)
+        except (pp.ParseBaseException, SyntaxError) as e:
+            for bps, size in zip(lists, sizes):
+                del bps[size:]
+            self.project = project
+            if isinstance(e, pp.ParseBaseException):
+                self._add_diagnostic(_parse_error_message(e), e.loc)
+                return self._resume_point(e.loc, block)
+            self._add_diagnostic(str(e), block.start)
+            return self._resume_point(block.start, block)
+        for bps, size in zip(lists, sizes):
+            for blueprint in bps[size:]:
+                self._positions[id(blueprint)] = block.start
+        if self.project is not project:
+            self._positions[id(self.project)] = block.start
+        return None
+
+    def _resume_point(self, error_loc: int, block: Block) -> Optional[int]:
+        '''Start of the next top-level block inside the failed block.'''
+        line_start = self.source.rfind('\n', 0, error_loc) + 1
+        search_from = max(line_start, block.start + 1)
+        match = _block_start.search(self.source, search_from, block.end)
+        if match is None:
+            return None
+        return match.start()
+
+    def _try_build(self, blueprint: Any, add: Callable[[Any], Any]) -> None:
+        try:
+            add(blueprint.build())
+        except BUILD_ERRORS as e:
+            self._add_diagnostic(str(e), self._positions.get(id(blueprint), 0))
+
+    def _build(self) -> None:
+        self.database = Database(  # type: ignore
+            allow_properties=self._allow_properties,
+            sql_renderer=self._sql_renderer,
+            dbml_renderer=self._dbml_renderer,
+        )
+        add = self.database.add  # type: ignore
+        for enum_bp in self.enums:
+            self._try_build(enum_bp, add)
+        for table_bp in self.tables:
+            self._try_build(table_bp, add)
+        for table_group_bp in self.table_groups:
+            self._try_build(table_group_bp, add)
+        for note_bp in self.sticky_notes:
+            self._try_build(note_bp, add)
+        if self.project:
+            self._try_build(self.project, add)
+        for ref_bp in self.refs:
+            self._try_build(ref_bp, add)
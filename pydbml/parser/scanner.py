@@ -0,0 +1,285 @@
+'''
+Fast linear scanner, splitting DBML source into top-level blocks without
+running the grammar. It is aware of strings, comments and nested braces, but
+doesn't validate the block contents.
+'''
+import re
+from dataclasses import dataclass
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+KEYWORDS: Dict[str, str] = {
+    'table': 'table',
+    'ref': 'ref',
+    'enum': 'enum',
+    'tablegroup': 'table_group',
+    'project': 'project',
+    'note': 'note',
+}
+
+_word = re.compile(r'\w+')
+# end of a single-line string, escaped characters are skipped
+_string_end = {
+    q: re.compile(rf'(?:[^{q}\\\n]|\\.)*[{q}\n]', re.DOTALL) for q in '\'"'
+}
+# characters which may change the scanner state
+_special = re.compile(r'[\'"`/{}\[\]]')
+_special_short_ref = re.compile(r'[\'"`/{}\[\]\n]')
+_name = r'(?:"([^"\n]*)"|(\w+))'
+_table_header = re.compile(
+    rf'\s*{_name}(?:\s*\.\s*{_name})?(?:\s+as\s+{_name})?',
+    re.IGNORECASE
+)
+
+
+@dataclass
+class Block:
+    '''
+    Top-level block of DBML source. `kind` is one of `KEYWORDS` values or
+    `None` for text that doesn't start with a known keyword. `start` and `end`
+    are offsets of the block in the source, `header_end` is the offset of
+    the opening brace (or of the block end, if there are no braces).
+    '''
+    kind: Optional[str]
+    start: int
+    end: int
+    header_end: int
+
+
+@dataclass
+class TableName:
+    name: str
+    schema: str = 'public'
+    alias: Optional[str] = None
+
+    @property
+    def full_name(self) -> str:
+        return f'{self.schema}.{self.name}'
+
+
+def skip_string(source: str, pos: int) -> int:
+    '''`pos` points to the opening quote. Returns position after the closing one.'''
+    quote = source[pos]
+    if quote == "'" and source.startswith("'''", pos):
+        end = pos + 3
+        while True:
+            end = source.find("'''", end)
+            if end == -1:
+                return len(source)
+            if source[end - 1] != '\\':
+                return end + 3
+            end += 1
+    if quote == '`':
+        end = source.find('`', pos + 1)
+        return len(source) if end == -1 else end + 1
+    match = _string_end[quote].search(source, pos + 1)
+    if match is None:
+        return len(source)
+    return match.end()
+
+
+def skip_comment(source: str, pos: int) -> int:
+    '''
+    If a comment starts at `pos`, return position after it (before the
+    line break for single-line comments), otherwise return `pos`.
+    '''
+    if source.startswith('//', pos):
+        end = source.find('\n', pos)
+        return len(source) if end == -1 else end
+    if source.startswith('/*', pos):
+        end = source.find('*/', pos + 2)
+        return len(source) if end == -1 else end + 2
+    return pos
+
+
+def skip_blank(source: str, pos: int) -> int:
+    '''Skip whitespace and comments.'''
+    length = len(source)
+    while pos < length:
+        char = source[pos]
+        if char.isspace():
+            pos += 1
+        elif char == '/':
+            end = skip_comment(source, pos)
+            if end == pos:
+                return pos
+            pos = end
+        else:
+            return pos
+    return pos
+
+
+def find_block_end(source: str, pos: int, short_ref: bool = False) -> Tuple[int, int]:
+    '''
+    Scan from `pos` to the end of the block. Returns a tuple
+    (header_end, end). A block ends after the brace, matching the first
+    opening brace. For short refs (`Ref: a.b > c.d`) the block ends at the
+    line break outside of brackets, if it comes before any brace.
+    '''
+    depth = 0
+    brackets = 0
+    header_end = -1
+    length = len(source)
+    special = (_special_short_ref if short_ref else _special).search
+    while True:
+        match = special(source, pos)
+        if match is None:
+            break
+        pos = match.start()
+        char = source[pos]
+        if char in '\'"`':
+            pos = skip_string(source, pos)
+            continue
+        if char == '/':
+            end = skip_comment(source, pos)
+            if end != pos:
+                pos = end
+                continue
+        elif char == '{':
+            if header_end == -1:
+                header_end = pos
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth <= 0:
+                return header_end, pos + 1
+        elif char == '[':
+            brackets += 1
+        elif char == ']':
+            brackets -= 1
+        elif char == '\n' and depth == 0 and brackets <= 0:
+            return pos, pos
+        pos += 1
+    return (length if header_end == -1 else header_end), length
+
+
+def _is_short_ref(source: str, pos: int) -> bool:
+    '''True if the ref header starting at `pos` has a colon before any brace.'''
+    length = len(source)
+    while pos < length:
+        char = source[pos]
+        if char == ':':
+            return True
+        if char in '{\n':
+            return False
+        if char in '\'"`':
+            pos = skip_string(source, pos)
+            continue
+        pos += 1
+    return False
+
+
+def scan_blocks(source: str, pos: int = 0) -> Iterator[Block]:
+    '''Yield top-level blocks of the source in order, starting from `pos`.'''
+    pos = skip_blank(source, pos)
+    length = len(source)
+    while pos < length:
+        match = _word.match(source, pos)
+        kind = KEYWORDS.get(match[0].lower()) if match else None
+        if kind is None:
+            # unknown text, skip to the next line
+            end = source.find('\n', pos)
+            end = length if end == -1 else end
+            yield Block(kind=None, start=pos, end=end, header_end=end)
+        else:
+            short_ref = kind == 'ref' and _is_short_ref(source, match.end())  # type: ignore
+            header_end, end = find_block_end(source, match.end(), short_ref)  # type: ignore
+            yield Block(kind=kind, start=pos, end=end, header_end=header_end)
+        pos = skip_blank(source, end)
+
+
+def _parse_header(source: str, block: Block) -> Optional[Tuple[str, Optional[str], Optional[str]]]:
+    '''Returns (first name, second name, alias) from the block header or None.'''
+    header_start = _word.match(source, block.start).end()  # type: ignore
+    match = _table_header.match(source, header_start, block.header_end)
+    if not match:
+        return None
+    first = match[1] if match[1] is not None else match[2]
+    second = match[3] if match[3] is not None else match[4]
+    alias = match[5] if match[5] is not None else match[6]
+    return first, second, alias
+
+
+def parse_table_name(source: str, block: Block) -> Optional[TableName]:
+    '''Get the table name, schema and alias from the table block header.'''
+    header = _parse_header(source, block)
+    if header is None:
+        return None
+    first, second, alias = header
+    if second is None:
+        return TableName(name=first, alias=alias)
+    return TableName(name=second, schema=first, alias=alias)
+
+
+@dataclass
+class OutlineEntry:
+    '''
+    Top-level object of DBML source. `schema` is set for tables and enums,
+    `alias` only for tables. `name` is None for unnamed references.
+    `start` and `end` are offsets of the object in the source: character
+    offsets for a str source, byte offsets for bytes-like input (see
+    `to_byte_offsets`). `line` is the 1-based line number of its start.
+    '''
+    kind: str
+    name: Optional[str]
+    start: int
+    end: int
+    line: int
+    schema: Optional[str] = None
+    alias: Optional[str] = None
+
+    @property
+    def full_name(self) -> Optional[str]:
+        if self.name is None or self.schema is None:
+            return self.name
+        return f'{self.schema}.{self.name}'
+
+
+def outline(source: str) -> List[OutlineEntry]:
+    '''
+    List top-level objects of the source without parsing them. Text that
+    doesn't start with a known keyword is skipped, block contents are not
+    validated.
+    '''
+    result = []
+    line = 1
+    line_pos = 0
+    for block in scan_blocks(source):
+        if block.kind is None:
+            continue
+        line += source.count('\n', line_pos, block.start)
+        line_pos = block.start
+        entry = OutlineEntry(kind=block.kind, name=None, start=block.start, end=block.end, line=line)
+        header = _parse_header(source, block)
+        if header is not None:
+            first, second, alias = header
+            if block.kind in ('table', 'enum'):
+                entry.schema = 'public' if second is None else first
+                entry.name = first if second is None else second
+                if block.kind == 'table':
+                    entry.alias = alias
+            else:
+                entry.name = first
+        elif block.kind in ('table', 'enum'):
+            entry.schema = 'public'
+        result.append(entry)
+    return result
+
+
+def to_byte_offsets(source: str, entries: List[OutlineEntry], shift: int = 0) -> None:
+    '''
+    Convert character offsets of outline entries to offsets in the UTF-8
+    encoding of the source, in place. `shift` is the number of bytes before
+    the source, e.g. the BOM. Entries must be in source order, as `outline`
+    returns them.
+    '''
+    pos = 0
+    size = shift
+    for entry in entries:
+        size += len(source[pos:entry.start].encode('utf-8'))
+        pos, entry.start = entry.start, size
+        size += len(source[pos:entry.end].encode('utf-8'))
+        pos, entry.end = entry.end, size
@@ -0,0 +1,210 @@
+'''
+Selective parse. The source is split into top-level blocks by the scanner,
+only table blocks, matching the filter, are parsed and built. Bodies of other
+tables are skipped by brace matching.
+'''
+import re
+
+from fnmatch import fnmatchcase
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Type
+from typing import Union
+
+from pydbml.database import Database
+from pydbml.renderer.base import BaseRenderer
+from pydbml.renderer.dbml.default import DefaultDBMLRenderer
+from pydbml.renderer.sql.default import DefaultSQLRenderer
+from .blueprints import ReferenceBlueprint
+from .blueprints import TableBlueprint
+from .lazy import LazyParser
+from .parser import PyDBMLParser
+from .parser import TableFilter
+from .scanner import Block
+from .scanner import TableName
+from .scanner import parse_table_name
+from .scanner import scan_blocks
+
+# inline reference, which makes another table reference this one
+_backward_inline_ref = re.compile(r'ref\s*:\s*<', re.IGNORECASE)
+
+
+def get_matcher(table_filter: TableFilter) -> Callable[[str], bool]:
+    '''Glob pattern on the table full name (`schema.table`) or a predicate.'''
+    if isinstance(table_filter, str):
+        return lambda full_name: fnmatchcase(full_name, table_filter)
+    if callable(table_filter):
+        return table_filter
+    raise TypeError('Table filter must be a glob pattern or a callable')
+
+
+class SelectiveParser(LazyParser):
+    '''
+    Parser, which builds only tables, accepted by the filter. With
+    `include_referenced` the tables, which the selected tables reference
+    by foreign keys, are added transitively. References and table groups are
+    limited to the selected tables.
+    '''
+
+    def __init__(
+        self,
+        source: str,
+        table_filter: TableFilter,
+        include_referenced: bool = False,
+        allow_properties: bool = False,
+        sql_renderer: Type[BaseRenderer] = DefaultSQLRenderer,
+        dbml_renderer: Type[BaseRenderer] = DefaultDBMLRenderer,
+        packrat: Union[bool, int] = False,
+    ):
+        super().__init__(source, allow_properties=allow_properties, packrat=packrat)
+        self._sql_renderer = sql_renderer
+        self._dbml_renderer = dbml_renderer
+        self._match = get_matcher(table_filter)
+        self._include_referenced = include_referenced
+        self._fragment_starts: Dict[int, int] = {}
+        # full name and alias -> block start
+        self._table_index: Dict[str, int] = {}
+        self._table_blocks: Dict[int, Block] = {}
+        self._parsed: Dict[int, TableBlueprint] = {}
+        # block start -> references, defined in the block
+        self._block_refs: Dict[int, List[ReferenceBlueprint]] = {}
+        # block start -> starts of tables it references by foreign keys
+        self._fk_targets: Dict[int, Set[int]] = {}
+
+    # tables are built into a regular Database
+    locate_table = PyDBMLParser.locate_table
+
+    def parse(self) -> Database:
+        blocks = list(scan_blocks(self.source))
+        selected = self._scan(blocks)
+        if self._include_referenced:
+            self._add_referenced(selected)
+        for block in blocks:
+            if block.start in selected:
+                self._parse_table(block)
+
+        self.tables = []
+        self.refs = []
+        for block in blocks:
+            if block.kind == 'table' and block.start not in selected:
+                continue
+            if block.kind == 'table':
+                self.tables.append(self._parsed[block.start])
+            for ref_bp in self._block_refs.get(block.start, []):
+                if self._keep(ref_bp, selected):
+                    self.refs.append(ref_bp)
+
+        table_groups = []
+        for table_group_bp in self.table_groups:
+            table_group_bp.items = [
+                item for item in table_group_bp.items
+                if self._is_selected(self._resolve_item(item), selected)
+            ]
+            if table_group_bp.items:
+                table_groups.append(table_group_bp)
+        self.table_groups = table_groups
+
+        self.build_database()
+        return self.database  # type: ignore
+
+    def _scan(self, blocks: List[Block]) -> Set[int]:
+        '''
+        Parse all blocks except tables, index tables by name. Returns starts
+        of table blocks, accepted by the filter.
+        '''
+        selected = set()
+        fragment_start = 0
+        for block in blocks:
+            self._fragment_starts[block.start] = fragment_start
+            fragment_start = block.end
+            if block.kind != 'table':
+                self._parse_block(block)
+                continue
+            table_name = parse_table_name(self.source, block)
+            if table_name is None:
+                # let the grammar report the error
+                self._parse_block(block)
+                continue  # pragma: no cover
+            self._index_table(block, table_name)
+            if self._match(table_name.full_name):
+                selected.add(block.start)
+        return selected
+
+    def _index_table(self, block: Block, table_name: TableName) -> None:
+        self._table_blocks[block.start] = block
+        self._table_index[table_name.full_name] = block.start
+        if table_name.alias:
+            self._table_index[table_name.alias] = block.start
+
+    def _parse_block(self, block: Block) -> None:
+        self.parse_fragment(self._fragment_starts[block.start], block.end)
+        if self.refs:
+            self._block_refs[block.start] = self.refs
+            self.refs = []
+
+    def _parse_table(self, block: Block) -> TableBlueprint:
+        if block.start not in self._parsed:
+            self._parse_block(block)
+            self._parsed[block.start] = self.tables.pop()
+            for ref_bp in self._block_refs.get(block.start, []):
+                self._add_edges(ref_bp)
+        return self._parsed[block.start]
+
+    def _resolve(self, schema: str, name: Optional[str]) -> Optional[int]:
+        '''Block start of the table, the same lookup as in `locate_table`.'''
+        if name is None:
+            return None
+        result = self._table_index.get(name)
+        if result is None:
+            result = self._table_index.get(f'{schema}.{name}')
+        return result
+
+    def _resolve_item(self, item: str) -> Optional[int]:
+        components = item.split('.')
+        schema, name = components if len(components) == 2 else ('public', components[0])
+        return self._resolve(schema, name)
+
+    def _add_edges(self, ref_bp: ReferenceBlueprint) -> None:
+        table1 = self._resolve(ref_bp.schema1, ref_bp.table1)
+        table2 = self._resolve(ref_bp.schema2, ref_bp.table2)
+        if table1 is None or table2 is None:
+            return
+        if ref_bp.type in ('>', '-', '<>'):
+            self._fk_targets.setdefault(table1, set()).add(table2)
+        if ref_bp.type in ('<', '<>'):
+            self._fk_targets.setdefault(table2, set()).add(table1)
+
+    def _add_referenced(self, selected: Set[int]) -> None:
+        '''Add tables, referenced by the selected ones, transitively.'''
+        for start, ref_bps in self._block_refs.items():
+            if start not in self._table_blocks:
+                for ref_bp in ref_bps:
+                    self._add_edges(ref_bp)
+        # inline `ref: <` in a skipped table defines a foreign key in another
+        # table, such tables have to be parsed to know all the edges
+        for start, block in self._table_blocks.items():
+            if _backward_inline_ref.search(self.source, block.header_end, block.end):
+                self._parse_table(block)
+        queue = list(selected)
+        while queue:
+            start = queue.pop()
+            self._parse_table(self._table_blocks[start])
+            for target in self._fk_targets.get(start, ()):
+                if target not in selected:
+                    selected.add(target)
+                    queue.append(target)
+
+    def _keep(self, ref_bp: ReferenceBlueprint, selected: Set[int]) -> bool:
+        '''Drop references to tables, which were not selected.'''
+        return (
+            self._is_selected(self._resolve(ref_bp.schema1, ref_bp.table1), selected)
+            and self._is_selected(self._resolve(ref_bp.schema2, ref_bp.table2), selected)
+        )
+
+    @staticmethod
+    def _is_selected(table: Optional[int], selected: Set[int]) -> bool:
+        # unknown tables are kept, so that build reports them as usual
+        return table is None or table in selected
@@ -1,4 +1,4 @@
-from typing import Type, Callable, Dict, TYPE_CHECKING
+from typing import Any, Type, Callable, Dict, TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover
     from pydbml.database import Database
@@ -36,3 +36,7 @@ class BaseRenderer:
     @classmethod
     def render_db(cls, db: 'Database') -> str:
         raise NotImplementedError  # pragma: no cover
+
+    @classmethod
+    def render_db_phased(cls, db: 'Database') -> Any:
+        raise NotImplementedError  # pragma: no cover
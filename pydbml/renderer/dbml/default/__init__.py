@@ -3,6 +3,7 @@ from .enum import render_enum, render_enum_item
 from .expression import render_expression
 from .index import render_index
 from .note import render_note
+from .partition import render_partition, render_partition_key
 from .project import render_project
 from .reference import render_reference
 from .renderer import DefaultDBMLRenderer
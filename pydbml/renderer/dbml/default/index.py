@@ -1,22 +1,47 @@
+import re
 from typing import List, Any
 
-from pydbml.classes import Index, Expression, Column
+from pydbml.classes import Index, IndexSubject, Expression, Column
 from pydbml.renderer.dbml.default.renderer import DefaultDBMLRenderer
-from pydbml.renderer.dbml.default.utils import comment_to_dbml, note_option_to_dbml
+from pydbml.renderer.dbml.default.utils import comment_to_dbml, note_option_to_dbml, quote_string
 
 
-def render_subjects(source_subjects: List[Any]) -> str:
-    subjects = []
+def render_subject(subj: Any) -> str:
+    if isinstance(subj, Column):
+        return subj.name
+    elif isinstance(subj, (Expression, IndexSubject)):
+        return DefaultDBMLRenderer.render(subj)
+    else:
+        return subj
+
+
+@DefaultDBMLRenderer.renderer_for(IndexSubject)
+def render_index_subject(model: IndexSubject) -> str:
+    '''
+    created_at collate "C" desc nulls last
+    '''
+    components = [render_subject(model.subject)]
+    if model.collation:
+        components.append(f'collate "{model.collation}"')
+    if model.opclass:
+        components.append(model.opclass)
+    if model.order:
+        components.append(model.order)
+    if model.nulls:
+        components.append(f'nulls {model.nulls}')
+    return ' '.join(components)
 
-    for subj in source_subjects:
-        if isinstance(subj, Column):
-            subjects.append(subj.name)
-        elif isinstance(subj, Expression):
-            subjects.append(DefaultDBMLRenderer.render(subj))
-        else:
-            subjects.append(subj)
 
-    if len(subjects) > 1:
+def render_storage_param_value(value: str) -> str:
+    return value if re.fullmatch(r'[\w.]+', value) else quote_string(value)
+
+
+def render_subjects(source_subjects: List[Any]) -> str:
+    subjects = [render_subject(subj) for subj in source_subjects]
+
+    # operator class of a single subject is allowed only in parentheses
+    with_opclass = any(isinstance(s, IndexSubject) and s.opclass for s in source_subjects)
+    if len(subjects) > 1 or with_opclass:
         return f'({", ".join(subj for subj in subjects)})'
     else:
         return subjects[0]
@@ -30,8 +55,25 @@ def render_options(model: Index) -> str:
         options.append('pk')
     if model.unique:
         options.append('unique')
+    if model.concurrently:
+        options.append('concurrently')
+    if model.if_not_exists:
+        options.append('if not exists')
     if model.type:
         options.append(f'type: {model.type}')
+    if model.where:
+        options.append(f'where: `{model.where}`')
+    if model.include:
+        include = ', '.join(f'"{name}"' for name in model.include_names)
+        options.append(f'include: ({include})')
+    if model.storage_params:
+        params = ', '.join(
+            f'{k} = {render_storage_param_value(v)}'
+            for k, v in model.storage_params.items()
+        )
+        options.append(f'with: ({params})')
+    if model.tablespace:
+        options.append(f'tablespace: "{model.tablespace}"')
     if model.note:
         options.append(note_option_to_dbml(model.note))
 
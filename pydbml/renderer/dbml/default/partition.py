@@ -0,0 +1,28 @@
+from pydbml.classes import Partition, PartitionKey
+from pydbml.renderer.dbml.default.index import render_subject
+from pydbml.renderer.dbml.default.renderer import DefaultDBMLRenderer
+from pydbml.renderer.dbml.default.table import get_full_name_for_dbml
+from pydbml.renderer.dbml.default.utils import comment_to_dbml
+
+
+@DefaultDBMLRenderer.renderer_for(PartitionKey)
+def render_partition_key(model: PartitionKey) -> str:
+    '''
+    partition by: range(created_at)
+    '''
+    keys = ', '.join(render_subject(s) for s in model.subjects)
+    return f'partition by: {model.method}({keys})'
+
+
+@DefaultDBMLRenderer.renderer_for(Partition)
+def render_partition(model: Partition) -> str:
+    '''
+    "bookings_2024" [values: `FROM ('2024-01-01') TO ('2025-01-01')`]
+    '''
+    result = comment_to_dbml(model.comment) if model.comment else ''
+    result += get_full_name_for_dbml(model)
+    if model.default:
+        result += ' [default]'
+    else:
+        result += f' [values: `{model.values}`]'
+    return result
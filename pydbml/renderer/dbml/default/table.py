@@ -19,8 +19,13 @@ def render_header(model: Table) -> str:
     result = f'Table {name} '
     if model.alias:
         result += f'as "{model.alias}" '
+    settings = []
     if model.header_color:
-        result += f'[headercolor: {model.header_color}] '
+        settings.append(f'headercolor: {model.header_color}')
+    if model.partition_by:
+        settings.append(DefaultDBMLRenderer.render(model.partition_by))
+    if settings:
+        result += f'[{", ".join(settings)}] '
     return result
 
 
@@ -34,6 +39,16 @@ def render_indexes(model: Table) -> str:
     return ''
 
 
+def render_partitions(model: Table) -> str:
+    if model.partitions:
+        result = '\n    partitions {\n'
+        partitions_str = '\n'.join(DefaultDBMLRenderer.render(p) for p in model.partitions)
+        result += indent(partitions_str, '        ') + '\n'
+        result += '    }\n'
+        return result
+    return ''
+
+
 @DefaultDBMLRenderer.renderer_for(Table)
 def render_table(model: Table) -> str:
     result = comment_to_dbml(model.comment) if model.comment else ''
@@ -53,6 +68,7 @@ def render_table(model: Table) -> str:
         result += indent(model.note.dbml, '    ') + '\n'
 
     result += render_indexes(model)
+    result += render_partitions(model)
 
     result += '}'
     return result
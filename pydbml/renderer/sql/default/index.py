@@ -1,19 +1,45 @@
+import re
 from typing import Any
 
-from pydbml.classes import Expression, Index, Column
+from pydbml.classes import Expression, Index, IndexSubject, Column
+from pydbml._classes.index import unwrap_subject
 from pydbml.renderer.sql.default.renderer import DefaultSQLRenderer
-from pydbml.renderer.sql.default.utils import comment_to_sql
+from pydbml.renderer.sql.default.utils import comment_to_sql, is_concurrent
 
 
 def render_subject(subject: Any) -> str:
     if isinstance(subject, Column):
         return f'"{subject.name}"'
-    elif isinstance(subject, Expression):
+    elif isinstance(subject, (Expression, IndexSubject)):
         return DefaultSQLRenderer.render(subject)
     else:
         return subject
 
 
+@DefaultSQLRenderer.renderer_for(IndexSubject)
+def render_index_subject(model: IndexSubject) -> str:
+    '''
+    "created_at" COLLATE "C" DESC NULLS LAST
+    '''
+    components = [render_subject(model.subject)]
+    if model.collation:
+        components.append(f'COLLATE "{model.collation}"')
+    if model.opclass:
+        components.append(model.opclass)
+    if model.order:
+        components.append(model.order.upper())
+    if model.nulls:
+        components.append(f'NULLS {model.nulls.upper()}')
+    return ' '.join(components)
+
+
+def render_storage_param_value(value: str) -> str:
+    if re.fullmatch(r'[\w.]+', value):
+        return value
+    escaped = value.replace("'", "''")
+    return f"'{escaped}'"
+
+
 def render_pk(model: Index, keys: str) -> str:
     result = comment_to_sql(model.comment) if model.comment else ''
     result += f'PRIMARY KEY ({keys})'
@@ -32,6 +58,10 @@ def create_components(model: Index, keys: str) -> str:
 
     components.append('INDEX ')
 
+    if is_concurrent(model):
+        components.append('CONCURRENTLY ')
+    if model.if_not_exists:
+        components.append('IF NOT EXISTS ')
     if model.name:
         components.append(f'"{model.name}" ')
     if model.table:
@@ -40,6 +70,20 @@ def create_components(model: Index, keys: str) -> str:
     if model.type:
         components.append(f'USING {model.type.upper()} ')
     components.append(f'({keys})')
+
+    if model.include:
+        include = ', '.join(f'"{name}"' for name in model.include_names)
+        components.append(f' INCLUDE ({include})')
+    if model.storage_params:
+        params = ', '.join(
+            f'{k} = {render_storage_param_value(v)}'
+            for k, v in model.storage_params.items()
+        )
+        components.append(f' WITH ({params})')
+    if model.tablespace:
+        components.append(f' TABLESPACE "{model.tablespace}"')
+    if model.where:
+        components.append(f' WHERE {model.where}')
     return ''.join(components) + ';'
 
 
@@ -51,15 +95,22 @@ def render_index(model: Index) -> str:
 
     CREATE UNIQUE INDEX ON "products" USING HASH ("id");
 
+    Partial indexes get the predicate:
+
+    CREATE INDEX ON "users" ("email") WHERE deleted_at IS NULL;
+
     But if it's a (composite) primary key index, returns an inline SQL for
     composite primary key to be used inside table definition:
 
     PRIMARY KEY ("id", "name")
-    '''
 
-    keys = ', '.join(render_subject(s) for s in model.subjects)
+    Primary key constraints take plain columns, so ordering, collation and
+    operator class of the subjects are not rendered for them.
+    '''
 
     if model.pk:
+        keys = ', '.join(render_subject(unwrap_subject(s)) for s in model.subjects)
         return render_pk(model, keys)
 
+    keys = ', '.join(render_subject(s) for s in model.subjects)
     return create_components(model, keys)
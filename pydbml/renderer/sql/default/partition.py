@@ -0,0 +1,35 @@
+from pydbml.classes import Partition, PartitionKey
+from pydbml.renderer.sql.default.index import render_subject
+from pydbml.renderer.sql.default.renderer import DefaultSQLRenderer
+from pydbml.renderer.sql.default.utils import comment_to_sql, get_full_name_for_sql
+
+
+@DefaultSQLRenderer.renderer_for(PartitionKey)
+def render_partition_key(model: PartitionKey) -> str:
+    '''
+    PARTITION BY RANGE ("created_at")
+    '''
+    keys = ', '.join(render_subject(s) for s in model.subjects)
+    return f'PARTITION BY {model.method.upper()} ({keys})'
+
+
+@DefaultSQLRenderer.renderer_for(Partition)
+def render_partition(model: Partition) -> str:
+    '''
+    CREATE TABLE "bookings_2024" PARTITION OF "bookings"
+      FOR VALUES FROM ('2024-01-01') TO ('2025-01-01');
+
+    or, for the default partition:
+
+    CREATE TABLE "bookings_other" PARTITION OF "bookings" DEFAULT;
+    '''
+    result = comment_to_sql(model.comment) if model.comment else ''
+    result += (
+        f'CREATE TABLE {get_full_name_for_sql(model)} '
+        f'PARTITION OF {get_full_name_for_sql(model.table)}'  # type: ignore
+    )
+    if model.default:
+        result += ' DEFAULT;'
+    else:
+        result += f' FOR VALUES {model.values};'
+    return result
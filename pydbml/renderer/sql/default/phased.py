@@ -0,0 +1,183 @@
+'''
+Phased SQL for bulk loads, like pre-data and post-data sections of pg_dump.
+Tables are created bare, with primary keys only, so that data is loaded
+faster. Indexes, unique constraints and foreign keys are added after the
+data is in.
+'''
+from dataclasses import dataclass
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import TYPE_CHECKING
+from typing import Tuple
+
+from pydbml.classes import Column, Reference, Table
+from pydbml.constants import MANY_TO_MANY, MANY_TO_ONE, ONE_TO_ONE
+from pydbml.renderer.sql.default.reference import generate_not_inline_sql, validate_for_sql
+from pydbml.renderer.sql.default.renderer import DefaultSQLRenderer
+from pydbml.renderer.sql.default.utils import get_full_name_for_sql, is_concurrent, table_sql_scope
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pydbml.database import Database
+
+# longer identifiers are truncated by PostgreSQL
+MAX_NAME_LENGTH = 63
+
+
+@dataclass
+class PhasedSQL:
+    '''
+    Database SQL, split into scripts, which run in order: `pre_data` before
+    the data is loaded, `post_data_indexes` and `post_data_constraints`
+    after it.
+    '''
+    pre_data: str
+    post_data_indexes: str
+    post_data_constraints: str
+
+
+def get_foreign_keys(model: Reference) -> List[Tuple[List[Column], List[Column]]]:
+    '''(source columns, referenced columns) of each foreign key of the reference.'''
+    if model.type == MANY_TO_MANY:
+        join_table = model.join_table
+        n = len(model.col1)
+        return [
+            (join_table.columns[:n], model.col1),  # type: ignore
+            (join_table.columns[n:], model.col2),  # type: ignore
+        ]
+    if model.type in (MANY_TO_ONE, ONE_TO_ONE):
+        return [(model.col1, model.col2)]
+    return [(model.col2, model.col1)]
+
+
+def make_object_name(name1: str, name2: str, label: str) -> str:
+    '''
+    Name like `name1_name2_label`, fit into the identifier length as by
+    PostgreSQL: the longer of the two names is truncated first.
+    '''
+    available = MAX_NAME_LENGTH - len(label) - 2
+    while len(name1) + len(name2) > available:
+        if len(name1) > len(name2):
+            name1 = name1[:-1]
+        else:
+            name2 = name2[:-1]
+    return f'{name1}_{name2}_{label}'
+
+
+def get_constraint_name(
+    model: Reference,
+    source_col: List[Column],
+    used_names: Optional[Set[str]] = None
+) -> str:
+    '''
+    Reference name or the name PostgreSQL would generate. Both foreign keys of
+    a many-to-many join table get generated names. `used_names` are names of
+    the table constraints, taken so far: as in PostgreSQL, a generated name,
+    which is taken, gets a number after the label, `orders_user_id_fkey1`.
+    The returned name is added to them.
+    '''
+    if model.name and model.type != MANY_TO_MANY:
+        name = model.name
+    else:
+        table_name = source_col[0].table.name  # type: ignore
+        columns = '_'.join(c.name for c in source_col)
+        name = make_object_name(table_name, columns, 'fkey')
+        number = 0
+        while used_names is not None and name in used_names:
+            number += 1
+            name = make_object_name(table_name, columns, f'fkey{number}')
+    if used_names is not None:
+        used_names.add(name)
+    return name
+
+
+def render_foreign_key(
+    model: Reference,
+    source_col: List[Column],
+    ref_col: List[Column],
+    used_names: Optional[Set[str]] = None
+) -> Tuple[str, Optional[str]]:
+    '''
+    Returns the statement, adding the foreign key without checking existing
+    rows, and the statement, validating it:
+
+    ALTER TABLE "orders" ADD CONSTRAINT "orders_user_id_fkey" FOREIGN KEY ("user_id") REFERENCES "users" ("id") NOT VALID;
+    ALTER TABLE "orders" VALIDATE CONSTRAINT "orders_user_id_fkey";
+
+    Partitioned tables don't support NOT VALID foreign keys, they are added
+    as usual, without the validating statement.
+    '''
+    name = get_constraint_name(model, source_col, used_names)
+    table: Table = source_col[0].table  # type: ignore
+    result = generate_not_inline_sql(model, source_col, ref_col).format(c=f'CONSTRAINT "{name}" ')
+    if table.partition_by:
+        return result, None
+    validate = f'ALTER TABLE {get_full_name_for_sql(table)} VALIDATE CONSTRAINT "{name}";'
+    return result[:-1] + ' NOT VALID;', validate
+
+
+def render_unique_constraints(model: Table) -> List[str]:
+    '''
+    ALTER TABLE "users" ADD UNIQUE ("email");
+    '''
+    return [
+        f'ALTER TABLE {get_full_name_for_sql(model)} ADD UNIQUE ("{c.name}");'
+        for c in model.columns if c.unique
+    ]
+
+
+def render_pre_data(db: 'Database') -> str:
+    components = [DefaultSQLRenderer.render(e) for e in db.enums]
+    tables = [*db.tables, *(r.join_table for r in db.refs if r.type == MANY_TO_MANY)]
+    with table_sql_scope(post_data=False):
+        components.extend(DefaultSQLRenderer.render(t) for t in tables)
+    return '\n\n'.join(components)
+
+
+def render_post_data_indexes(db: 'Database') -> str:
+    components = []
+    for table in db.tables:
+        components.extend(render_unique_constraints(table))
+        components.extend(
+            DefaultSQLRenderer.render(i) for i in table.indexes
+            if not i.pk and not is_concurrent(i)
+        )
+    concurrent = DefaultSQLRenderer.render_concurrent_indexes(db.tables)
+    if concurrent:
+        components.append(concurrent)
+    return '\n\n'.join(components)
+
+
+def render_post_data_constraints(db: 'Database') -> str:
+    '''
+    All foreign keys are added first, then validated. Generated names are
+    unique in each table, reference names are taken first.
+    '''
+    components = []
+    validations = []
+    foreign_keys = []
+    # tables are unhashable, names are kept by table id
+    used_names: Dict[int, Set[str]] = {}
+    for ref in db.refs:
+        validate_for_sql(ref)
+        for source_col, ref_col in get_foreign_keys(ref):
+            foreign_keys.append((ref, source_col, ref_col))
+            names = used_names.setdefault(id(source_col[0].table), set())
+            if ref.name and ref.type != MANY_TO_MANY:
+                names.add(ref.name)
+    for ref, source_col, ref_col in foreign_keys:
+        names = used_names[id(source_col[0].table)]
+        add, validate = render_foreign_key(ref, source_col, ref_col, names)
+        components.append(add)
+        if validate:
+            validations.append(validate)
+    return '\n\n'.join((*components, *validations))
+
+
+def render_db_phased(db: 'Database') -> PhasedSQL:
+    return PhasedSQL(
+        pre_data=render_pre_data(db),
+        post_data_indexes=render_post_data_indexes(db),
+        post_data_constraints=render_post_data_constraints(db),
+    )
@@ -1,11 +1,20 @@
+from typing import Iterable
+from typing import Optional
 from typing import TYPE_CHECKING
 
+from pydbml.renderer.sql.default.utils import comment_to_sql
+from pydbml.renderer.sql.default.utils import is_concurrent
 from pydbml.renderer.sql.default.utils import reorder_tables_for_sql
+from pydbml.renderer.sql.default.utils import table_sql_scope
 from pydbml.renderer.base import BaseRenderer
 
 
 if TYPE_CHECKING:  # pragma: no cover
+    from pydbml.classes import Table
     from pydbml.database import Database
+    from pydbml.renderer.sql.default.phased import PhasedSQL
+
+CONCURRENT_INDEXES_COMMENT = 'Indexes, created concurrently, must run outside of a transaction block'
 
 
 class DefaultSQLRenderer(BaseRenderer):
@@ -20,5 +29,33 @@ class DefaultSQLRenderer(BaseRenderer):
     def render_db(cls, db: 'Database') -> str:
         refs = (ref for ref in db.refs if not ref.inline)
         tables = reorder_tables_for_sql(db.tables, db.refs)
-        components = (cls.render(i) for i in (*db.enums, *tables, *refs))
+        components = [cls.render(e) for e in db.enums]
+        # concurrent indexes are left out of the tables
+        with table_sql_scope(concurrent=False):
+            components.extend(cls.render(t) for t in tables)
+        components.extend(cls.render(r) for r in refs)
+        # CREATE INDEX CONCURRENTLY can't run inside a transaction block,
+        # such indexes go last, after all other statements
+        concurrent = cls.render_concurrent_indexes(tables)
+        if concurrent:
+            components.append(concurrent)
         return '\n\n'.join(components)
+
+    @classmethod
+    def render_concurrent_indexes(cls, tables: Iterable['Table']) -> Optional[str]:
+        concurrent = [i for t in tables for i in t.indexes if is_concurrent(i) and not i.pk]
+        if not concurrent:
+            return None
+        return (
+            comment_to_sql(CONCURRENT_INDEXES_COMMENT)
+            + '\n\n'.join(cls.render(i) for i in concurrent)
+        )
+
+    @classmethod
+    def render_db_phased(cls, db: 'Database') -> 'PhasedSQL':
+        '''
+        Render the database as separate pre-data, post-data indexes and
+        post-data constraints scripts for bulk loads.
+        '''
+        from pydbml.renderer.sql.default.phased import render_db_phased
+        return render_db_phased(db)
@@ -1,12 +1,14 @@
+from copy import copy
 from textwrap import indent
 from typing import List
 
 from pydbml.constants import MANY_TO_ONE, ONE_TO_ONE, ONE_TO_MANY
-from pydbml.classes import Table, Reference, Column
+from pydbml.classes import Table, Reference, Column, Index
 from pydbml.exceptions import UnknownDatabaseError
 from pydbml.renderer.sql.default.note import prepare_text_for_sql
 from pydbml.renderer.sql.default.renderer import DefaultSQLRenderer
-from pydbml.renderer.sql.default.utils import comment_to_sql, get_full_name_for_sql
+from pydbml.renderer.sql.default.utils import comment_to_sql, get_full_name_for_sql, is_concurrent
+from pydbml.renderer.sql.default.utils import get_table_sql_scope
 
 
 def get_references_for_sql(model: Table) -> List[Reference]:
@@ -35,11 +37,43 @@ def get_inline_references_for_sql(model: Table) -> List[Reference]:
     return [r for r in get_references_for_sql(model) if r.inline]
 
 
-def create_body(model: Table) -> str:
+def get_indexes_for_sql(model: Table, concurrent: bool = True) -> List[Index]:
+    '''
+    Return indexes, created after the table definition. Without `concurrent`
+    indexes, created concurrently, are skipped: the database script renders
+    them at the end.
+    '''
+    return [
+        i for i in model.indexes
+        if not i.pk and (concurrent or not is_concurrent(i))
+    ]
+
+
+def render_column_without_unique(column: Column) -> str:
+    '''
+    Column SQL without the UNIQUE constraint, phased SQL adds it after the
+    data is loaded. A copy of the column without the flag goes through the
+    renderer, so that a custom column renderer is used too.
+    '''
+    if column.unique:
+        column = copy(column)
+        column.unique = False
+    return DefaultSQLRenderer.render(column)
+
+
+def create_body(model: Table, post_data: bool = True) -> str:
+    '''
+    Columns and constraints of the table. Without `post_data` foreign keys and
+    unique constraints are skipped, only the primary key is kept.
+    '''
     body: List[str] = []
-    body.extend(indent(DefaultSQLRenderer.render(c), "  ") for c in model.columns)
+    if post_data:
+        body.extend(indent(DefaultSQLRenderer.render(c), "  ") for c in model.columns)
+    else:
+        body.extend(indent(render_column_without_unique(c), "  ") for c in model.columns)
     body.extend(indent(DefaultSQLRenderer.render(i), "  ") for i in model.indexes if i.pk)
-    body.extend(indent(DefaultSQLRenderer.render(r), "  ") for r in get_inline_references_for_sql(model))
+    if post_data:
+        body.extend(indent(DefaultSQLRenderer.render(r), "  ") for r in get_inline_references_for_sql(model))
 
     if model._has_composite_pk():
         body.append(
@@ -50,15 +84,22 @@ def create_body(model: Table) -> str:
     return ',\n'.join(body)
 
 
-def create_components(model: Table) -> str:
+def create_components(model: Table, post_data: bool = True, concurrent: bool = True) -> str:
     components = [comment_to_sql(model.comment)] if model.comment else []
     components.append(f'CREATE TABLE {get_full_name_for_sql(model)} (')
 
-    body = create_body(model)
+    body = create_body(model, post_data)
 
     components.append(body)
-    components.append(');')
-    components.extend('\n' + DefaultSQLRenderer.render(i) for i in model.indexes if not i.pk)
+    if model.partition_by:
+        components.append(f') {DefaultSQLRenderer.render(model.partition_by)};')
+    else:
+        components.append(');')
+    components.extend('\n' + DefaultSQLRenderer.render(p) for p in model.partitions)
+    if post_data:
+        components.extend(
+            '\n' + DefaultSQLRenderer.render(i) for i in get_indexes_for_sql(model, concurrent)
+        )
 
     return '\n'.join(components)
 
@@ -73,6 +114,11 @@ def render_column_notes(model: Table) -> str:
     return result
 
 
+def render_notes(model: Table) -> str:
+    result = f'\n\n{model.note.sql}' if model.note else ''
+    return result + render_column_notes(model)
+
+
 @DefaultSQLRenderer.renderer_for(Table)
 def render_table(model: Table) -> str:
     '''
@@ -84,14 +130,20 @@ def render_table(model: Table) -> str:
       "continent_name" varchar
     );
 
+    Partitions of a partitioned table follow its definition:
+
+    CREATE TABLE "bookings" (
+      "created_at" timestamp
+    ) PARTITION BY RANGE ("created_at");
+
+    CREATE TABLE "bookings_2024" PARTITION OF "bookings" FOR VALUES FROM ('2024-01-01') TO ('2025-01-01');
+
     Also returns indexes if they were defined:
 
     CREATE INDEX ON "products" ("id", "name");
-    '''
-    result = create_components(model)
-
-    if model.note:
-        result += f'\n\n{model.note.sql}'
 
-    result += render_column_notes(model)
-    return result
+    Inside `table_sql_scope` post-data parts or concurrent indexes may be
+    left out.
+    '''
+    post_data, concurrent = get_table_sql_scope()
+    return create_components(model, post_data, concurrent) + render_notes(model)
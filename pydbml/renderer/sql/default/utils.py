@@ -1,10 +1,37 @@
-from typing import List, Dict, Union
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, Dict, Tuple, Union
 
-from pydbml.classes import Enum, Reference, Table
+from pydbml.classes import Enum, Index, Partition, Reference, Table
 from pydbml.constants import MANY_TO_ONE, ONE_TO_MANY
 from pydbml.tools import comment
 
 
+_table_scope = threading.local()
+
+
+@contextmanager
+def table_sql_scope(post_data: bool = True, concurrent: bool = True) -> Iterator[None]:
+    '''
+    Render tables for a section of a script inside the block. Without
+    `post_data` foreign keys, unique constraints and indexes are left out,
+    without `concurrent` indexes, created concurrently, are left out. Tables
+    still go through the renderer, so that a custom table renderer is used.
+    The scope is per thread.
+    '''
+    previous = get_table_sql_scope()
+    _table_scope.options = (post_data, concurrent)
+    try:
+        yield
+    finally:
+        _table_scope.options = previous
+
+
+def get_table_sql_scope() -> Tuple[bool, bool]:
+    '''(post_data, concurrent) options of the current `table_sql_scope`.'''
+    return getattr(_table_scope, 'options', (True, True))
+
+
 def comment_to_sql(val: str) -> str:
     return comment(val, '--')
 
@@ -30,7 +57,15 @@ def reorder_tables_for_sql(tables: List['Table'], refs: List['Reference']) -> Li
     return sorted(tables, key=lambda t: references.get(t.name, 0), reverse=True)
 
 
-def get_full_name_for_sql(model: Union[Table, Enum]) -> str:
+def is_concurrent(model: Index) -> bool:
+    '''
+    True if the index is created concurrently. Partitioned tables don't
+    support CREATE INDEX CONCURRENTLY, their indexes are created as usual.
+    '''
+    return model.concurrently and not (model.table and model.table.partition_by)
+
+
+def get_full_name_for_sql(model: Union[Table, Enum, Partition]) -> str:
     if model.schema == 'public':
         return f'"{model.name}"'
     else:
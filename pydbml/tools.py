@@ -1,4 +1,8 @@
+import codecs
+import gzip
 import re
+import sys
+from typing import Any
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -15,12 +19,40 @@ def indent(val: str, spaces=4) -> str:
     return ' ' * spaces + val.replace('\n', '\n' + ' ' * spaces)
 
 
+def intern_str(val: Any) -> Any:
+    '''
+    Intern plain strings, so that repeated values like schema names, column
+    types or reference options share one object. Other values are returned as is.
+    '''
+    if type(val) is str:
+        return sys.intern(val)
+    return val
+
+
 def remove_bom(source: str) -> str:
     if source and source[0] == '\ufeff':
         source = source[1:]
     return source
 
 
+GZIP_MAGIC = b'\x1f\x8b'
+
+
+def decode_source(data: Any) -> str:
+    '''
+    Decode DBML source from a bytes-like object (bytes, bytearray, memoryview,
+    mmap). Gzip-compressed data is decompressed first. The UTF-8 BOM is
+    dropped by the decoder. Line endings `\\r\\n` and `\\r` are converted to
+    `\\n`, as when a file is read in text mode.
+    '''
+    if data[:2] == GZIP_MAGIC:
+        data = gzip.decompress(data)
+    result = codecs.decode(data, 'utf-8-sig')
+    if '\r' in result:
+        result = result.replace('\r\n', '\n').replace('\r', '\n')
+    return result
+
+
 def strip_empty_lines(source: str) -> str:
     """Remove empty lines or lines with just spaces from beginning and end."""
     pattern = re.compile(r'^([ \t]*\n)*(?P<content>[\s\S]+?)(\n[ \t]*)*$')
@@ -0,0 +1,92 @@
+import asyncio
+import os
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import IsolatedAsyncioTestCase
+from unittest import TestCase
+
+from pydbml import PyDBML
+from pydbml import aio
+
+
+TEST_DATA_PATH = Path(os.path.abspath(__file__)).parent / 'test_data'
+
+
+class TestAsyncParse(IsolatedAsyncioTestCase):
+    async def test_aparse_file(self) -> None:
+        path = TEST_DATA_PATH / 'general.dbml'
+        db = await PyDBML.aparse_file(path)
+        expected = PyDBML.parse_file(path)
+        self.assertEqual(db.dbml, expected.dbml)
+
+    async def test_aparse_file_options(self) -> None:
+        path = TEST_DATA_PATH / 'general.dbml'
+        db = await PyDBML.aparse_file(path, table_filter='public.orders')
+        self.assertEqual([t.name for t in db.tables], ['orders'])
+
+    async def test_render(self) -> None:
+        db = PyDBML.parse_file(TEST_DATA_PATH / 'general.dbml')
+        self.assertEqual(await db.asql(), db.sql)
+        self.assertEqual(await db.adbml(), db.dbml)
+
+    async def test_executor(self) -> None:
+        threads = []
+        executor = ThreadPoolExecutor(1, thread_name_prefix='pydbml-test')
+
+        def parse_file(*args, **kwargs):
+            threads.append(threading.current_thread().name)
+            return PyDBML.parse_file(*args, **kwargs)
+
+        try:
+            db = await aio.run_in_executor(parse_file, TEST_DATA_PATH / 'general.dbml', executor=executor)
+            sql = await db.asql(executor=executor)
+        finally:
+            executor.shutdown()
+        self.assertTrue(threads[0].startswith('pydbml-test'))
+        self.assertEqual(sql, db.sql)
+
+    async def test_errors_are_raised(self) -> None:
+        with self.assertRaises(FileNotFoundError):
+            await PyDBML.aparse_file(TEST_DATA_PATH / 'missing.dbml')
+
+
+class TestConcurrencyLimit(TestCase):
+    def tearDown(self) -> None:
+        aio.set_concurrency_limit(aio.DEFAULT_CONCURRENCY_LIMIT)
+
+    def test_limit(self) -> None:
+        aio.set_concurrency_limit(2)
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def job() -> None:
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.pop()
+
+        async def main() -> None:
+            with ThreadPoolExecutor(8) as executor:
+                await asyncio.gather(*(aio.run_in_executor(job, executor=executor) for _ in range(10)))
+
+        asyncio.run(main())
+        self.assertEqual(len(peak), 10)
+        self.assertEqual(max(peak), 2)
+
+    def test_separate_loops(self) -> None:
+        async def main() -> int:
+            return await aio.run_in_executor(len, 'abc')
+
+        self.assertEqual(asyncio.run(main()), 3)
+        self.assertEqual(asyncio.run(main()), 3)
+
+    def test_invalid_limit(self) -> None:
+        with self.assertRaises(ValueError):
+            aio.set_concurrency_limit(0)
+        self.assertEqual(aio.get_concurrency_limit(), aio.DEFAULT_CONCURRENCY_LIMIT)
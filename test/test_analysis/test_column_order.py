@@ -0,0 +1,106 @@
+from unittest import TestCase
+
+from pydbml import PyDBML
+from pydbml.analysis import find_column_orders
+from pydbml.analysis import optimize_column_order
+from pydbml.analysis import propose_column_order
+from pydbml.analysis.column_order import START
+from pydbml.analysis.column_order import get_padding
+from pydbml.analysis.column_order import place
+from pydbml.analysis.types import TypeInfo
+from pydbml.classes import Column
+
+
+SOURCE = '''
+Table events {
+    id int [pk]
+    active bool
+    created_at timestamp
+    name varchar(100)
+    user_id int
+    amount bigint
+    kind smallint
+    payload my_type
+    flag bool
+}
+
+Table aligned {
+    id bigint [pk]
+    n int
+}
+
+Table accounts {
+    code text
+    region int
+    balance bigint
+    opened date
+    indexes {
+        (region, code) [pk]
+    }
+}
+
+Ref: accounts.region > events.id
+'''
+
+
+def test_place() -> None:
+    assert place(START, TypeInfo(4, 4)) == (0, (4, 8))
+    assert place((4, 8), TypeInfo(8, 8)) == (4, (0, 8))
+    assert place((1, 8), TypeInfo(2, 2)) == (1, (4, 8))
+    assert place((3, 8), TypeInfo(-1, 4)) == (0, (0, 1))
+    assert place((0, 1), TypeInfo(8, 8)) == (7, (0, 8))
+    assert place((2, 4), TypeInfo(8, 8)) == (6, (0, 8))
+    assert place((0, 1), TypeInfo(1, 1)) == (0, (0, 1))
+
+
+def test_padding() -> None:
+    columns = [Column('a', 'bool'), Column('b', 'int8'), Column('c', 'int2'), Column('d', 'int4')]
+    assert get_padding(columns) == 7 + 2
+    assert get_padding([columns[1], columns[3], columns[2], columns[0]]) == 0
+    assert get_padding([Column('a', 'text'), Column('b', 'int4')]) == 3
+
+
+class TestColumnOrder(TestCase):
+    def setUp(self) -> None:
+        self.db = PyDBML(SOURCE)
+
+    def test_propose(self) -> None:
+        order = propose_column_order(self.db['public.events'])
+        self.assertEqual(order.padding, 3 + 3 + 4)
+        self.assertEqual(order.proposed_padding, 0)
+        self.assertEqual(order.saving, 10)
+        self.assertTrue(order.changed)
+        self.assertEqual(
+            [c.name for c in order.proposed],
+            ['id', 'user_id', 'created_at', 'amount', 'kind', 'active', 'flag', 'name', 'payload']
+        )
+        self.assertEqual(
+            str(order),
+            'public.events: 10 bytes of padding per row, 0 in the order '
+            '(id, user_id, created_at, amount, kind, active, flag, name, payload)'
+        )
+
+    def test_pk_first(self) -> None:
+        order = propose_column_order(self.db['public.accounts'])
+        self.assertEqual([c.name for c in order.proposed], ['code', 'region', 'balance', 'opened'])
+        self.assertFalse(order.changed)
+
+    def test_no_change(self) -> None:
+        order = propose_column_order(self.db['public.aligned'])
+        self.assertEqual(order.saving, 0)
+        self.assertFalse(order.changed)
+        self.assertEqual(order.proposed, order.current)
+
+    def test_find(self) -> None:
+        self.assertEqual([o.table.name for o in find_column_orders(self.db)], ['events'])
+
+    def test_optimize(self) -> None:
+        result = optimize_column_order(self.db)
+        self.assertIsNot(result, self.db)
+        self.assertEqual(self.db['public.events'].columns[1].name, 'active')
+        events = result['public.events']
+        self.assertEqual(events.columns[1].name, 'user_id')
+        self.assertIs(events.columns[1].table, events)
+        self.assertIs(result.refs[0].col2[0], events['id'])
+        self.assertIn('"user_id" int,\n  "created_at" timestamp,', result.sql)
+        self.assertIn('"user_id" int\n    "created_at" timestamp\n', result.dbml)
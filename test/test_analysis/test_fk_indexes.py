@@ -0,0 +1,105 @@
+from unittest import TestCase
+
+from pydbml import PyDBML
+from pydbml.analysis import add_missing_fk_indexes
+from pydbml.analysis import find_missing_fk_indexes
+from pydbml.analysis.fk_indexes import get_covered_column_sets
+from pydbml.analysis.fk_indexes import get_referencing_columns
+
+
+SOURCE = '''
+Table users {
+    id int [pk]
+    country_code int
+    manager_id int
+}
+
+Table orders {
+    id int [pk]
+    user_id int
+    shop_id int
+    region_id int
+    indexes {
+        (shop_id, region_id)
+        user_id [where: `user_id is not null`]
+    }
+}
+
+Table shops {
+    id int
+    region_id int
+    indexes {
+        (id, region_id) [pk]
+    }
+}
+
+Table countries {
+    code int [pk]
+}
+
+Ref: orders.user_id > users.id
+Ref: orders.(region_id, shop_id) > shops.(region_id, id)
+Ref: orders.shop_id > shops.id
+Ref: countries.code < users.country_code
+Ref: users.manager_id > users.id
+Ref: users.id <> shops.id
+'''
+
+
+class TestFindMissingFKIndexes(TestCase):
+    def setUp(self) -> None:
+        self.db = PyDBML(SOURCE)
+
+    def test_find(self) -> None:
+        missing = find_missing_fk_indexes(self.db)
+        self.assertEqual(
+            [(m.table.name, [c.name for c in m.columns]) for m in missing],
+            [
+                ('orders', ['user_id']),
+                ('users', ['country_code']),
+                ('users', ['manager_id']),
+            ]
+        )
+        self.assertIs(missing[0].reference, self.db.refs[0])
+        self.assertEqual(
+            str(missing[1]),
+            'Foreign key public.users (country_code) -> public.countries (code) is not indexed'
+        )
+
+    def test_fix(self) -> None:
+        missing = find_missing_fk_indexes(self.db)
+        self.assertEqual(missing[0].sql, 'CREATE INDEX ON "orders" ("user_id");')
+        index = missing[0].to_index()
+        self.assertIs(index.table, self.db['public.orders'])
+        self.assertNotIn(index, self.db['public.orders'].indexes)
+
+    def test_add(self) -> None:
+        added = add_missing_fk_indexes(self.db)
+        self.assertEqual([i.subject_names for i in added], [['user_id'], ['country_code'], ['manager_id']])
+        self.assertIs(self.db['public.users'].indexes[0], added[1])
+        self.assertEqual(find_missing_fk_indexes(self.db), [])
+
+    def test_add_once(self) -> None:
+        # two foreign keys on the same column
+        db = PyDBML(SOURCE + 'Ref: orders.user_id > countries.code')
+        self.assertEqual(len(find_missing_fk_indexes(db)), 4)
+        self.assertEqual(len(add_missing_fk_indexes(db)), 3)
+
+
+class TestHelpers(TestCase):
+    def setUp(self) -> None:
+        self.db = PyDBML(SOURCE)
+
+    def test_referencing_columns(self) -> None:
+        refs = self.db.refs
+        self.assertEqual(get_referencing_columns(refs[0]), refs[0].col1)
+        self.assertEqual(get_referencing_columns(refs[3]), refs[3].col2)
+        self.assertIsNone(get_referencing_columns(refs[5]))
+
+    def test_covered_column_sets(self) -> None:
+        shops = self.db['public.shops']
+        id_, region_id = (id(c) for c in shops.columns)
+        self.assertEqual(
+            get_covered_column_sets(shops),
+            {frozenset([id_]), frozenset([id_, region_id])}
+        )
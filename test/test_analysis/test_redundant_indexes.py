@@ -0,0 +1,144 @@
+from unittest import TestCase
+
+from pydbml import PyDBML
+from pydbml.analysis import check_redundant_indexes
+from pydbml.analysis import find_redundant_indexes
+from pydbml.analysis.redundant_indexes import DUPLICATE
+from pydbml.analysis.redundant_indexes import IMPLIED_UNIQUE
+from pydbml.analysis.redundant_indexes import PREFIX
+from pydbml.analysis.redundant_indexes import UNIQUE_NOT_NEEDED
+from pydbml.analysis.redundant_indexes import get_subject_key
+from pydbml.classes import Column, Expression, IndexSubject
+from pydbml.exceptions import RedundantIndexError
+
+
+SOURCE = '''
+Table users {
+    id int [pk, unique]
+    email varchar [unique]
+    name varchar
+    created_at timestamp
+    indexes {
+        email
+        (name, created_at) [name: 'ix_name_created']
+        name
+        (name, created_at)
+        (id, email) [unique]
+        (created_at) [include: name]
+        (created_at, name)
+    }
+}
+
+Table orders {
+    id int
+    user_id int
+    created_at timestamp
+    indexes {
+        (id, user_id) [pk]
+        id
+        user_id [type: hash]
+        user_id [where: `user_id > 0`]
+        (user_id, created_at)
+        `lower(name)`
+        (`lower(name)`, created_at)
+        (user_id desc)
+        user_id [unique]
+    }
+}
+'''
+
+
+class TestSubjectKey(TestCase):
+    def test_options(self) -> None:
+        col = Column('name', 'varchar')
+        self.assertEqual(get_subject_key(col), get_subject_key(IndexSubject(col)))
+        self.assertNotEqual(get_subject_key(col), get_subject_key(IndexSubject(col, order='desc')))
+        self.assertNotEqual(get_subject_key(col), get_subject_key(Column('name', 'varchar')))
+        self.assertEqual(
+            get_subject_key(Expression('lower(name)')),
+            get_subject_key(Expression(' lower(name) '))
+        )
+
+
+class TestFindRedundantIndexes(TestCase):
+    def setUp(self) -> None:
+        self.db = PyDBML(SOURCE)
+
+    def test_users(self) -> None:
+        users = self.db['public.users']
+        result = find_redundant_indexes(self.db)[:6]
+        self.assertEqual(
+            [(r.kind, r.redundant) for r in result],
+            [
+                (IMPLIED_UNIQUE, users['id']),
+                (DUPLICATE, users.indexes[0]),
+                (PREFIX, users.indexes[2]),
+                (DUPLICATE, users.indexes[3]),
+                (IMPLIED_UNIQUE, users.indexes[4]),
+                (PREFIX, users.indexes[5]),
+            ]
+        )
+        self.assertEqual(result[0].covered_by, [users['id']])
+        self.assertIs(result[2].covered_by, users.indexes[1])
+        self.assertEqual(
+            [str(r) for r in result],
+            [
+                'public.users: unique column id is implied by primary key (id)',
+                'public.users: index (email) duplicates unique column email',
+                'public.users: index (name) is a prefix of index ix_name_created',
+                'public.users: index (name, created_at) duplicates index ix_name_created',
+                'public.users: index (id, email) is implied by primary key (id)',
+                'public.users: index (created_at) is a prefix of index (created_at, name)',
+            ]
+        )
+
+    def test_orders(self) -> None:
+        orders = self.db['public.orders']
+        result = find_redundant_indexes(self.db)[6:]
+        self.assertEqual(
+            [(r.kind, r.redundant, r.covered_by) for r in result],
+            [
+                (PREFIX, orders.indexes[1], orders.indexes[0]),
+                (PREFIX, orders.indexes[5], orders.indexes[6]),
+            ]
+        )
+        self.assertEqual(str(result[0]), 'public.orders: index (id) is a prefix of primary key (id, user_id)')
+
+    def test_clean(self) -> None:
+        db = PyDBML('Table t {\n id int [pk]\n a int\n indexes {\n (a, id)\n }\n}')
+        self.assertEqual(find_redundant_indexes(db), [])
+        check_redundant_indexes(db)
+
+    def test_unique_not_needed(self) -> None:
+        db = PyDBML(
+            'Table users {\n id int [pk]\n email varchar\n'
+            ' indexes {\n (email, id) [unique]\n }\n}'
+        )
+        users = db['public.users']
+        result = find_redundant_indexes(db)
+        self.assertEqual([(r.kind, r.redundant) for r in result], [(UNIQUE_NOT_NEEDED, users.indexes[0])])
+        self.assertFalse(result[0].removable)
+        self.assertEqual(
+            str(result[0]),
+            'public.users: uniqueness of index (email, id) is implied by primary key (id);'
+            ' the index could be non-unique'
+        )
+        check_redundant_indexes(db)
+
+    def test_implied_unique_column_order(self) -> None:
+        db = PyDBML(
+            'Table t {\n a int\n b int\n c int\n'
+            ' indexes {\n (a, b) [pk]\n (b, a) [unique]\n (b, a, c) [unique]\n (c, a, b) [unique]\n }\n}'
+        )
+        result = find_redundant_indexes(db)
+        self.assertEqual(
+            [r.kind for r in result],
+            [IMPLIED_UNIQUE, IMPLIED_UNIQUE, UNIQUE_NOT_NEEDED]
+        )
+
+    def test_check(self) -> None:
+        with self.assertRaises(RedundantIndexError) as cm:
+            check_redundant_indexes(self.db)
+        lines = str(cm.exception).split('\n')
+        self.assertEqual(lines[0], 'Found 8 redundant indexes:')
+        self.assertEqual(lines[1], 'public.users: unique column id is implied by primary key (id)')
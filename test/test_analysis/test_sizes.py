@@ -0,0 +1,120 @@
+from unittest import TestCase
+
+import pytest
+
+from pydbml import PyDBML
+from pydbml.analysis import estimate_sizes
+from pydbml.analysis import estimate_table_size
+from pydbml.analysis.sizes import PAGE_SIZE
+from pydbml.analysis.sizes import estimate_index_bytes
+from pydbml.analysis.sizes import format_bytes
+from pydbml.analysis.sizes import get_data_width
+from pydbml.analysis.sizes import get_rows
+from pydbml.classes import Table
+
+
+SOURCE = """
+Table users {
+    id bigint [pk]
+    email varchar(255) [unique, not null]
+    created_at timestamp [not null]
+    tags text[]
+    rows: '1_000_000'
+    indexes {
+        (created_at, id)
+        email [type: hash]
+        tags [type: gin]
+    }
+}
+
+Table audit.events {
+    id int [pk]
+    kind smallint [not null]
+}
+
+Table audit.logs {
+    id int [pk]
+    rows: '1e3'
+}
+"""
+
+
+def test_format_bytes() -> None:
+    assert format_bytes(0) == '0 bytes'
+    assert format_bytes(10239) == '10239 bytes'
+    assert format_bytes(10240) == '10 kB'
+    assert format_bytes(10 * 1024 ** 2) == '10 MB'
+    assert format_bytes(20 * 1024 ** 5) == '20480 TB'
+
+
+def test_rows() -> None:
+    assert get_rows(Table('t')) is None
+    assert get_rows(Table('t', properties={'rows': '10_000'})) == 10000
+    assert get_rows(Table('t', properties={'rows': '2.5e6'})) == 2500000
+    for value in ('many', '-1', '1.5', '-1e3', 'inf', 'nan'):
+        with pytest.raises(ValueError, match='must be a non-negative integer'):
+            get_rows(Table('t', properties={'rows': value}))
+
+
+def test_data_width() -> None:
+    assert get_data_width([1, 8, 2, 4], [1, 8, 2, 4]) == 8 + 8 + 2 + 2 + 4
+    assert get_data_width([8, 21, 4], [8, 1, 4]) == 8 + 21 + 3 + 4
+
+
+def test_index_bytes() -> None:
+    # 8152 * 0.9 // 16 = 458 entries per leaf page
+    assert estimate_index_bytes(16, 458) == 2 * PAGE_SIZE
+    assert estimate_index_bytes(16, 459) == (2 + 1 + 1) * PAGE_SIZE
+    assert estimate_index_bytes(16, 459, 'hash') == 3 * PAGE_SIZE
+    assert estimate_index_bytes(16, 0) == PAGE_SIZE
+    with pytest.raises(ValueError):
+        estimate_index_bytes(16, -1)
+
+
+class TestEstimate(TestCase):
+    def setUp(self) -> None:
+        self.db = PyDBML(SOURCE, allow_properties=True)
+
+    def test_table(self) -> None:
+        size = estimate_table_size(self.db['public.users'])
+        self.assertEqual(size.rows, 1000000)
+        self.assertEqual(size.header_bytes, 24)
+        # id 8, email 145, padding 7, created_at 8, padding 0, tags 152
+        self.assertEqual(size.data_bytes, 8 + 145 + 7 + 8 + 152)
+        self.assertEqual(size.row_bytes, 24 + 320 + 4)
+        # 23 rows per page
+        self.assertEqual(size.table_bytes, 43479 * PAGE_SIZE)
+        self.assertEqual(
+            [(i.name, i.entry_bytes) for i in size.indexes],
+            [('primary key (id)', 20), ('unique (email)', 164), ('(created_at, id)', 28), ('(email)', 20)]
+        )
+        self.assertIs(size.indexes[2].index, self.db['public.users'].indexes[0])
+        self.assertIsNone(size.indexes[0].index)
+        self.assertEqual(size.index_bytes, sum(i.total_bytes for i in size.indexes))
+        self.assertEqual(size.total_bytes, size.table_bytes + size.index_bytes)
+
+    def test_no_rows(self) -> None:
+        size = estimate_table_size(self.db['audit.events'])
+        self.assertIsNone(size.rows)
+        self.assertEqual(size.header_bytes, 24)
+        self.assertEqual(size.row_bytes, 24 + 8 + 4)
+        self.assertIsNone(size.table_bytes)
+        self.assertIsNone(size.index_bytes)
+        self.assertIsNone(size.total_bytes)
+        self.assertIsNone(size.indexes[0].total_bytes)
+        self.assertEqual(str(size), 'audit.events: 36 bytes per row')
+        size = estimate_table_size(self.db['audit.events'], rows=100)
+        self.assertEqual(size.table_bytes, PAGE_SIZE)
+        with self.assertRaises(ValueError):
+            estimate_table_size(self.db['audit.events'], rows=-100)
+
+    def test_schemas(self) -> None:
+        schemas = estimate_sizes(self.db, rows={'audit.events': 10})
+        self.assertEqual([s.schema for s in schemas], ['public', 'audit'])
+        audit = schemas[1]
+        self.assertEqual([t.rows for t in audit.tables], [10, 1000])
+        self.assertEqual(audit.rows, 1010)
+        self.assertEqual(audit.table_bytes, PAGE_SIZE + 5 * PAGE_SIZE)
+        self.assertEqual(audit.index_bytes, 2 * PAGE_SIZE + 5 * PAGE_SIZE)
+        self.assertEqual(audit.total_bytes, 13 * PAGE_SIZE)
+        self.assertEqual(str(audit), 'audit: 2 tables, 1010 rows, tables 48 kB, indexes 56 kB, total 104 kB')
@@ -0,0 +1,46 @@
+from pydbml.analysis.types import ENUM_TYPE
+from pydbml.analysis.types import ParsedType
+from pydbml.analysis.types import TypeInfo
+from pydbml.analysis.types import VARIABLE_LENGTH
+from pydbml.analysis.types import get_type_info
+from pydbml.analysis.types import get_type_width
+from pydbml.analysis.types import parse_type
+from pydbml.classes import Enum
+
+
+def test_parse_type() -> None:
+    assert parse_type('int') == ParsedType('int')
+    assert parse_type('  BIGINT ') == ParsedType('bigint')
+    assert parse_type('double   precision') == ParsedType('double precision')
+    assert parse_type('varchar(255)') == ParsedType('varchar', ('255',))
+    assert parse_type('numeric( 10 , 2 )') == ParsedType('numeric', ('10', '2'))
+    assert parse_type('time(3) with time zone') == ParsedType('time with time zone', ('3',))
+    assert parse_type('int[]') == ParsedType('int', array_dims=1)
+    assert parse_type('text [3][ ]') == ParsedType('text', array_dims=2)
+    assert parse_type('"char"') == ParsedType('"char"')
+
+
+def test_type_info() -> None:
+    assert get_type_info('integer') == TypeInfo(4, 4)
+    assert get_type_info('timestamp(6) with time zone') == TypeInfo(8, 8)
+    assert get_type_info('uuid') == TypeInfo(16, 1)
+    assert get_type_info('varchar(20)') == TypeInfo(VARIABLE_LENGTH, 4)
+    assert get_type_info('varchar(20)').variable
+    assert get_type_info('smallint[]') == TypeInfo(VARIABLE_LENGTH, 4)
+    assert get_type_info('float8[]') == TypeInfo(VARIABLE_LENGTH, 8)
+    assert get_type_info(Enum('status', ['active'])) == ENUM_TYPE
+    assert get_type_info('my_type') is None
+
+
+def test_type_width() -> None:
+    assert get_type_width('int4') == 4
+    assert get_type_width(Enum('status', ['active'])) == 4
+    assert get_type_width('text') == 32
+    assert get_type_width('varchar(20)') == 24
+    assert get_type_width('varchar(255)') == (259 - 32) // 2 + 32
+    assert get_type_width('char(100)') == 104
+    assert get_type_width('numeric(10,2)') == 8 + 2 * 4
+    assert get_type_width('numeric') == 32
+    assert get_type_width('bigint[]') == 16 + 8 + 4 * 8
+    assert get_type_width('varchar(10)[][]') == 16 + 16 + 4 * 14
+    assert get_type_width('my_type') == 32
@@ -0,0 +1,23 @@
+from pydbml.analysis.utils import get_leading_columns, get_lookup_keys
+from pydbml.classes import Column, Expression, Index, IndexSubject, Table
+
+
+def test_leading_columns(table1: Table) -> None:
+    id_, name = table1.columns
+    index = Index([IndexSubject(name, order='desc'), id_, Expression('id * 2'), name])
+    assert get_leading_columns(index) == [name, id_]
+    index = Index([Expression('lower(name)'), name])
+    assert get_leading_columns(index) == []
+
+
+def test_lookup_keys() -> None:
+    c1 = Column('a', 'int', pk=True)
+    c2 = Column('b', 'int', pk=True)
+    c3 = Column('c', 'int', unique=True)
+    c4 = Column('d', 'int')
+    table = Table('t', columns=[c1, c2, c3, c4])
+    table.add_index(Index([c4, c3]))
+    table.add_index(Index([c4], where='d > 0'))
+    table.add_index(Index([c4], type='gin'))
+    table.add_index(Index([Expression('d + 1')]))
+    assert get_lookup_keys(table) == [[c1, c2], [c3], [c4, c3]]
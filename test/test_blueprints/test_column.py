@@ -88,3 +88,23 @@ class TestColumn(TestCase):
         bp.parser = parser
         result = bp.build()
         self.assertIs(result.type, e)
+
+    def test_build_twice(self) -> None:
+        s = Database()
+        e = Enum('myenum', items=[EnumItem('i1')])
+        s.add(e)
+        parser = Mock()
+        parser.database = s
+
+        bp = ColumnBlueprint(
+            name='testcol',
+            type='myenum',
+            default='i1'
+        )
+        bp.parser = parser
+        result1 = bp.build()
+        result2 = bp.build()
+        self.assertEqual(bp.type, 'myenum')
+        self.assertIs(result1.type, e)
+        self.assertIs(result2.type, e)
+        self.assertIsNot(result1, result2)
@@ -1,8 +1,13 @@
 from unittest import TestCase
 
+from pydbml.classes import Column
+from pydbml.classes import Expression
 from pydbml.classes import Index
+from pydbml.classes import IndexSubject
 from pydbml.classes import Note
+from pydbml.parser.blueprints import ExpressionBlueprint
 from pydbml.parser.blueprints import IndexBlueprint
+from pydbml.parser.blueprints import IndexSubjectBlueprint
 from pydbml.parser.blueprints import NoteBlueprint
 
 
@@ -23,7 +28,12 @@ class TestIndex(TestCase):
             type='hash',
             pk=True,
             note=NoteBlueprint(text='Note text'),
-            comment='Comment text'
+            comment='Comment text',
+            where=ExpressionBlueprint(text='deleted_at is null'),
+            concurrently=True,
+            if_not_exists=True,
+            storage_params={'fillfactor': '70'},
+            tablespace='fast'
         )
         result = bp.build()
         self.assertIsInstance(result, Index)
@@ -35,3 +45,28 @@ class TestIndex(TestCase):
         self.assertIsInstance(result.note, Note)
         self.assertEqual(result.note.text, bp.note.text)
         self.assertEqual(result.comment, bp.comment)
+        self.assertIsInstance(result.where, Expression)
+        self.assertEqual(result.where.text, 'deleted_at is null')
+        self.assertTrue(result.concurrently)
+        self.assertTrue(result.if_not_exists)
+        self.assertEqual(result.storage_params, {'fillfactor': '70'})
+        self.assertEqual(result.tablespace, 'fast')
+
+
+class TestIndexSubject(TestCase):
+    def test_build(self) -> None:
+        bp = IndexSubjectBlueprint(
+            subject='name',
+            order='desc',
+            nulls='last',
+            collation='C',
+            opclass='text_pattern_ops'
+        )
+        column = Column('name', 'varchar')
+        result = bp.build(column)
+        self.assertIsInstance(result, IndexSubject)
+        self.assertIs(result.subject, column)
+        self.assertEqual(result.order, bp.order)
+        self.assertEqual(result.nulls, bp.nulls)
+        self.assertEqual(result.collation, bp.collation)
+        self.assertEqual(result.opclass, bp.opclass)
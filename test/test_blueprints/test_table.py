@@ -3,13 +3,18 @@ from unittest import TestCase
 from pydbml.classes import Column
 from pydbml.classes import Expression
 from pydbml.classes import Index
+from pydbml.classes import IndexSubject
 from pydbml.classes import Note
+from pydbml.classes import Partition
 from pydbml.classes import Table
 from pydbml.exceptions import ColumnNotFoundError
 from pydbml.parser.blueprints import ColumnBlueprint
 from pydbml.parser.blueprints import ExpressionBlueprint
 from pydbml.parser.blueprints import IndexBlueprint
+from pydbml.parser.blueprints import IndexSubjectBlueprint
 from pydbml.parser.blueprints import NoteBlueprint
+from pydbml.parser.blueprints import PartitionBlueprint
+from pydbml.parser.blueprints import PartitionKeyBlueprint
 from pydbml.parser.blueprints import ReferenceBlueprint
 from pydbml.parser.blueprints import TableBlueprint
 
@@ -88,6 +93,92 @@ class TestTable(TestCase):
         with self.assertRaises(ColumnNotFoundError):
             bp.build()
 
+    def test_index_subject_options(self) -> None:
+        bp = TableBlueprint(
+            name='TestTable',
+            columns=[
+                ColumnBlueprint(name='id', type='Integer'),
+                ColumnBlueprint(name='name', type='Varchar')
+            ],
+            indexes=[
+                IndexBlueprint(subject_names=[
+                    IndexSubjectBlueprint('name', order='desc', collation='C'),
+                    IndexSubjectBlueprint(ExpressionBlueprint('id*2'), opclass='int4_ops'),
+                    'id'
+                ])
+            ]
+        )
+        result = bp.build()
+        subjects = result.indexes[0].subjects
+        self.assertIsInstance(subjects[0], IndexSubject)
+        self.assertIs(subjects[0].subject, result['name'])
+        self.assertEqual(subjects[0].order, 'desc')
+        self.assertEqual(subjects[0].collation, 'C')
+        self.assertIsInstance(subjects[1].subject, Expression)
+        self.assertEqual(subjects[1].opclass, 'int4_ops')
+        self.assertIs(subjects[2], result['id'])
+        self.assertEqual(result.indexes[0].subject_names, ['name', 'id*2', 'id'])
+
+        bp.indexes[0].subject_names = [IndexSubjectBlueprint('wrong', order='asc')]
+        with self.assertRaises(ColumnNotFoundError):
+            bp.build()
+
+    def test_index_include(self) -> None:
+        bp = TableBlueprint(
+            name='TestTable',
+            columns=[
+                ColumnBlueprint(name='id', type='Integer'),
+                ColumnBlueprint(name='name', type='Varchar')
+            ],
+            indexes=[
+                IndexBlueprint(subject_names=['id'], include=['name'])
+            ]
+        )
+        result = bp.build()
+        self.assertIs(result.indexes[0].include[0], result['name'])
+
+        bp.indexes[0].include = ['wrong']
+        with self.assertRaises(ColumnNotFoundError):
+            bp.build()
+
+    def test_partitions(self) -> None:
+        bp = TableBlueprint(
+            name='TestTable',
+            columns=[
+                ColumnBlueprint(name='id', type='Integer'),
+                ColumnBlueprint(name='created_at', type='timestamp')
+            ],
+            partition_by=PartitionKeyBlueprint(
+                'range',
+                ['created_at', ExpressionBlueprint('id % 10')]
+            ),
+            partitions=[
+                PartitionBlueprint('p1', values=ExpressionBlueprint('FROM (1) TO (10)')),
+                PartitionBlueprint('p2', schema='archive', comment='rest')
+            ]
+        )
+        result = bp.build()
+        self.assertEqual(result.partition_by.method, 'range')
+        self.assertIs(result.partition_by.subjects[0], result['created_at'])
+        self.assertEqual(result.partition_by.subjects[1], Expression('id % 10'))
+        self.assertEqual(len(result.partitions), 2)
+        p1, p2 = result.partitions
+        self.assertIsInstance(p1, Partition)
+        self.assertIs(p1.table, result)
+        self.assertEqual(p1.values, Expression('FROM (1) TO (10)'))
+        self.assertTrue(p2.default)
+        self.assertEqual(p2.full_name, 'archive.p2')
+        self.assertEqual(p2.comment, 'rest')
+
+    def test_bad_partition_key(self) -> None:
+        bp = TableBlueprint(
+            name='TestTable',
+            columns=[ColumnBlueprint(name='id', type='Integer')],
+            partition_by=PartitionKeyBlueprint('hash', ['wrong'])
+        )
+        with self.assertRaises(ColumnNotFoundError):
+            bp.build()
+
     def test_get_reference_blueprints(self) -> None:
         bp = TableBlueprint(
             name='TestTable',
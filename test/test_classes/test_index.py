@@ -1,5 +1,7 @@
 from pydbml.classes import Column
+from pydbml.classes import Expression
 from pydbml.classes import Index
+from pydbml.classes import IndexSubject
 from pydbml.classes import Note
 from pydbml.classes import Table
 
@@ -19,3 +21,25 @@ def test_repr(index1: Index) -> None:
 
 def test_str(index1: Index) -> None:
     assert str(index1) == 'Index(products[name])'
+
+
+def test_include_names(index1: Index) -> None:
+    index1.include = [index1.table.columns[0], 'price']
+    assert index1.include_names == [index1.table.columns[0].name, 'price']
+
+
+def test_subject_names_options(index1: Index) -> None:
+    column = index1.table.columns[0]
+    index1.subjects = [
+        IndexSubject(column, order='desc'),
+        IndexSubject(Expression('lower(name)'), opclass='text_pattern_ops'),
+    ]
+    assert index1.subject_names == [column.name, 'lower(name)']
+
+
+def test_index_subject() -> None:
+    subject = IndexSubject(Column('id', 'integer'), order='asc', nulls='first', collation='C', opclass='int4_ops')
+    assert subject.name == 'id'
+    assert repr(subject) == "<IndexSubject 'id' collate C int4_ops asc nulls first>"
+    assert subject == IndexSubject(Column('id', 'integer'), order='asc', nulls='first', collation='C', opclass='int4_ops')
+    assert subject != IndexSubject(Column('id', 'integer'), order='desc', nulls='first', collation='C', opclass='int4_ops')
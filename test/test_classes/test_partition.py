@@ -0,0 +1,32 @@
+from pydbml.classes import Column
+from pydbml.classes import Expression
+from pydbml.classes import Partition
+from pydbml.classes import PartitionKey
+from pydbml.classes import Table
+
+
+def test_partition_key_subject_names() -> None:
+    t = Table('bookings')
+    c = Column('created_at', 'timestamp')
+    t.add_column(c)
+    key = PartitionKey('range', [c, Expression('id % 10'), 'country'])
+    assert key.subject_names == ['created_at', 'id % 10', 'country']
+    c.name = 'booked_at'
+    assert key.subject_names[0] == 'booked_at'
+
+
+def test_partition_default() -> None:
+    p = Partition('bookings_other', schema='archive')
+    assert p.default
+    assert p.full_name == 'archive.bookings_other'
+    p.values = Expression("IN ('eu')")
+    assert not p.default
+
+
+def test_partition_compare() -> None:
+    p1 = Partition('bookings_2024', values='FROM (1) TO (2)')
+    p2 = Partition('bookings_2024', values='FROM (1) TO (2)')
+    Table('bookings', partitions=[p1])
+    assert p1 == p2
+    p2.values = None
+    assert p1 != p2
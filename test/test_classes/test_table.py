@@ -5,13 +5,19 @@ import pytest
 from pydbml.classes import Column
 from pydbml.classes import Expression
 from pydbml.classes import Index
+from pydbml.classes import IndexSubject
 from pydbml.classes import Note
+from pydbml.classes import Partition
+from pydbml.classes import PartitionKey
 from pydbml.classes import Reference
 from pydbml.classes import Table
 from pydbml.database import Database
 from pydbml.exceptions import ColumnNotFoundError
+from pydbml.exceptions import DatabaseValidationError
 from pydbml.exceptions import IndexNotFoundError
+from pydbml.exceptions import PartitionNotFoundError
 from pydbml.exceptions import UnknownDatabaseError
+from pydbml.exceptions import ValidationError
 
 
 class TestTable(TestCase):
@@ -131,6 +137,28 @@ class TestTable(TestCase):
         with self.assertRaises(TypeError):
             t.add_index('wrong_type')
 
+    def test_add_index_include(self) -> None:
+        t = Table('products')
+        c1 = Column('id', 'integer')
+        c2 = Column('name', 'varchar2')
+        t.add_column(c1)
+        i = Index([c1], include=[c2])
+        with self.assertRaises(ColumnNotFoundError):
+            t.add_index(i)
+        t.add_column(c2)
+        t.add_index(i)
+        self.assertEqual(i.include_names, ['name'])
+
+    def test_add_index_subject_options(self) -> None:
+        t = Table('products')
+        c1 = Column('id', 'integer')
+        i = Index([IndexSubject(c1, order='desc')])
+        with self.assertRaises(ColumnNotFoundError):
+            t.add_index(i)
+        t.add_column(c1)
+        t.add_index(i)
+        self.assertIs(i.table, t)
+
     def test_delete_index(self) -> None:
         t = Table('products')
         c1 = Column('id', 'integer')
@@ -150,6 +178,76 @@ class TestTable(TestCase):
         with self.assertRaises(IndexNotFoundError):
             t.delete_index(i1)
 
+    def test_partition_by(self) -> None:
+        t = Table('bookings')
+        c1 = Column('created_at', 'timestamp')
+        key = PartitionKey('range', [c1])
+        with self.assertRaises(ColumnNotFoundError):
+            t.partition_by = key
+        t.add_column(c1)
+        t.partition_by = key
+        self.assertIs(t.partition_by, key)
+        t.partition_by = None
+        self.assertIsNone(t.partition_by)
+
+    def test_add_partition(self) -> None:
+        p1 = Partition('bookings_2024', values='FROM (1) TO (2)')
+        p2 = Partition('bookings_other')
+        t = Table('bookings', partitions=[p1])
+        t.add_partition(p2)
+        self.assertIs(p1.table, t)
+        self.assertIs(p2.table, t)
+        self.assertEqual(t.partitions, [p1, p2])
+        with self.assertRaises(TypeError):
+            t.add_partition('wrong_type')
+
+    def test_partition_key_in_unique_keys(self) -> None:
+        c1 = Column('id', 'integer', pk=True)
+        c2 = Column('created_at', 'timestamp')
+        t = Table('bookings', columns=[c1, c2])
+        t.partition_by = PartitionKey('range', [c2])
+        with self.assertRaises(ValidationError):
+            t.check_attributes_for_sql()
+        c2.pk = True
+        t.check_attributes_for_sql()
+        t.add_index(Index([c1], unique=True))
+        with self.assertRaises(ValidationError):
+            t.check_attributes_for_sql()
+        t.indexes[0].subjects.append(IndexSubject(c2, order='desc'))
+        t.check_attributes_for_sql()
+        t.partition_by = PartitionKey('range', [Expression('date(created_at)')])
+        with self.assertRaises(ValidationError):
+            t.check_attributes_for_sql()
+
+    def test_partition_name_clash(self) -> None:
+        database = Database()
+        database.add_table(Table('bookings_2024'))
+        t = Table('bookings', partitions=[Partition('bookings_2024')])
+        with self.assertRaises(DatabaseValidationError):
+            database.add_table(t)
+        t = database.add_table(Table('bookings'))
+        with self.assertRaises(DatabaseValidationError):
+            t.add_partition(Partition('bookings_2024'))
+        t.add_partition(Partition('bookings_2025'))
+        t.check_attributes_for_sql()
+        # a table, added after the partition, is found when rendering
+        database.add_table(Table('bookings_2025'))
+        with self.assertRaises(DatabaseValidationError):
+            t.check_attributes_for_sql()
+
+    def test_delete_partition(self) -> None:
+        p1 = Partition('bookings_2024', values='FROM (1) TO (2)')
+        p2 = Partition('bookings_other')
+        t = Table('bookings', partitions=[p1, p2])
+        t.delete_partition(0)
+        self.assertIsNone(p1.table)
+        self.assertNotIn(p1, t.partitions)
+        t.delete_partition(p2)
+        self.assertIsNone(p2.table)
+        self.assertEqual(t.partitions, [])
+        with self.assertRaises(PartitionNotFoundError):
+            t.delete_partition(p1)
+
     def test_get_refs(self):
         t = Table('products')
         with self.assertRaises(UnknownDatabaseError):
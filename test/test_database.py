@@ -1,4 +1,6 @@
+import copy
 import os
+import pickle
 
 from pathlib import Path
 from unittest import TestCase
@@ -14,6 +16,7 @@ from pydbml.classes import TableGroup
 from pydbml.database import Database
 from pydbml.exceptions import DatabaseValidationError
 from pydbml.constants import ONE_TO_MANY, MANY_TO_ONE, MANY_TO_MANY
+from pydbml.renderer.sql.default import DefaultSQLRenderer
 from pydbml.renderer.sql.default.utils import reorder_tables_for_sql
 
 TEST_DATA_PATH = Path(os.path.abspath(__file__)).parent / 'test_data'
@@ -372,3 +375,73 @@ class TestDatabase(TestCase):
 
 def test_repr() -> None:
     assert repr(Database()) == "<Database>"
+
+
+class TestPickle(TestCase):
+    def test_round_trip(self) -> None:
+        from pydbml import PyDBML
+        db = PyDBML.parse_file(TEST_DATA_PATH / 'general.dbml')
+        loaded = pickle.loads(pickle.dumps(db))
+        self.assertIsNot(loaded, db)
+        self.assertEqual(loaded.dbml, db.dbml)
+        self.assertEqual(loaded.sql, db.sql)
+
+    def test_back_references(self) -> None:
+        from pydbml import PyDBML
+        db = PyDBML.parse_file(TEST_DATA_PATH / 'general.dbml')
+        loaded = pickle.loads(pickle.dumps(db))
+        orders = loaded['public.orders']
+        self.assertIs(orders.database, loaded)
+        self.assertIs(orders['id'].table, orders)
+        self.assertIs(orders.note.parent, orders)
+        self.assertIs(loaded.refs[0].col1[0], orders['id'])
+        self.assertIs(loaded.refs[0].database, loaded)
+
+    def test_table(self) -> None:
+        from pydbml import PyDBML
+        db = PyDBML.parse_file(TEST_DATA_PATH / 'general.dbml')
+        for copy_table in (lambda t: pickle.loads(pickle.dumps(t)), copy.deepcopy):
+            table = copy_table(db['public.orders'])
+            self.assertIsNot(table, db['public.orders'])
+            self.assertIs(table.database['public.orders'], table)
+            self.assertIs(table.columns[0].table, table)
+            self.assertEqual(table.sql, db['public.orders'].sql)
+
+    def test_reference(self) -> None:
+        from pydbml import PyDBML
+        db = PyDBML.parse_file(TEST_DATA_PATH / 'general.dbml')
+        for copy_ref in (lambda r: pickle.loads(pickle.dumps(r)), copy.deepcopy):
+            ref = copy_ref(db.refs[0])
+            self.assertIsNot(ref, db.refs[0])
+            self.assertIs(ref.database.refs[0], ref)
+            self.assertIs(ref.table1, ref.database[ref.table1.full_name])
+            self.assertIn(ref.col1[0], ref.table1.columns)
+
+    def test_shared_database(self) -> None:
+        from pydbml import PyDBML
+        db = PyDBML.parse_file(TEST_DATA_PATH / 'general.dbml')
+        column, ref = pickle.loads(pickle.dumps((db['public.orders'][0], db.refs[0])))
+        self.assertIs(column.table.database, ref.database)
+        self.assertIs(column.table, ref.database['public.orders'])
+
+    def test_detached(self) -> None:
+        table = Table('test', columns=[Column('id', 'int')])
+        loaded = pickle.loads(pickle.dumps(table))
+        self.assertIsNone(loaded.database)
+        self.assertIs(loaded.columns[0].table, loaded)
+
+    def test_copy(self) -> None:
+        from pydbml import PyDBML
+        db = PyDBML.parse_file(TEST_DATA_PATH / 'general.dbml')
+        shallow = copy.copy(db)
+        self.assertIsNot(shallow, db)
+        self.assertIs(shallow.tables, db.tables)
+        table = copy.copy(db['public.orders'])
+        self.assertIsNot(table, db['public.orders'])
+        self.assertIs(table.columns, db['public.orders'].columns)
+
+    def test_renderers(self) -> None:
+        db = Database(sql_renderer=DefaultSQLRenderer, allow_properties=True)
+        loaded = pickle.loads(pickle.dumps(db))
+        self.assertIs(loaded.sql_renderer, DefaultSQLRenderer)
+        self.assertTrue(loaded.allow_properties)
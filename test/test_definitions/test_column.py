@@ -38,6 +38,11 @@ class TestColumnType(TestCase):
         res = column_type.parse_string(val, parseAll=True)
         self.assertEqual(res[0], val)
 
+    def test_expression_crlf(self) -> None:
+        val = "enum(\r\n'a',\r\n 'b')"
+        res = column_type.parse_string(val, parseAll=True)
+        self.assertEqual(res[0], val)
+
     def test_array(self) -> None:
         val = "int[]"
         res = column_type.parse_string(val, parseAll=True)
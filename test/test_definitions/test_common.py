@@ -1,8 +1,10 @@
 from unittest import TestCase
 
+from pyparsing import ParseException
 from pyparsing import ParseSyntaxException
 from pyparsing import ParserElement
 
+from pydbml.definitions.common import _
 from pydbml.definitions.common import _c
 from pydbml.definitions.common import comment
 from pydbml.definitions.common import note
@@ -39,6 +41,23 @@ class Test_c(TestCase):
         res = _c.parse_string(val, parseAll=True)
         self.assertEqual(list(res), ['comment line 1', 'comment line 2'])
 
+    def test_comment_before(self) -> None:
+        val = '// line comment  \n  /* block\ncomment */\n'
+        res = _c.parse_string(val, parseAll=True)
+        self.assertEqual([c[0] for c in res['comment_before']], ['line comment  ', 'block\ncomment '])
+
+    def test_unclosed_block_comment(self) -> None:
+        val = '// comment\n/* unclosed'
+        with self.assertRaises(ParseException):
+            _c.parse_string(val, parseAll=True)
+
+
+class Test_(TestCase):
+    def test_skipped(self) -> None:
+        val = '\n// comment\n\n/* block\ncomment */ \n'
+        res = _.parse_string(val, parseAll=True)
+        self.assertEqual(list(res), [])
+
 
 class TestNote(TestCase):
     def test_single_quote(self) -> None:
@@ -1,5 +1,6 @@
 from unittest import TestCase
 
+from pyparsing import ParseException
 from pyparsing import ParserElement
 
 from pydbml.definitions.generic import expression_literal, expression
@@ -19,6 +20,38 @@ class TestExpressionLiteral(TestCase):
 class TestExpression(TestCase):
     def test_comma_separated_expression(self) -> None:
         val = 'MAX, 3, "MAX", \'MAX\''
-        expected = ['MAX', ',', '3', ',', '"MAX"', ',', "'MAX'"]
         res = expression.parse_string(val, parseAll=True)
-        self.assertEqual(res.asList(), expected)
+        self.assertEqual(res.asList(), [val])
+
+    def test_nested(self) -> None:
+        val = 'a(b, (c)), d()'
+        res = expression.parse_string(val, parseAll=True)
+        self.assertEqual(res[0], val)
+
+    def test_quoted_parentheses(self) -> None:
+        val = "'a)', \"(b\", `c)`"
+        res = expression.parse_string(val, parseAll=True)
+        self.assertEqual(res[0], val)
+
+    def test_empty(self) -> None:
+        res = expression.parse_string('', parseAll=True)
+        self.assertEqual(res[0], '')
+
+    def test_stops_at_unbalanced(self) -> None:
+        res = expression.parse_string('10, 2)')
+        self.assertEqual(res[0], '10, 2')
+        res = expression.parse_string('10, (2')
+        self.assertEqual(res[0], '10, ')
+        with self.assertRaises(ParseException):
+            expression.parse_string('10, (2', parseAll=True)
+
+    def test_crlf(self) -> None:
+        val = "'a',\r\n 'b'\r\n"
+        res = expression.parse_string(val, parseAll=True)
+        self.assertEqual(res[0], val)
+
+    def test_long_input(self) -> None:
+        val = ', '.join(str(i) for i in range(10000))
+        nested = '(' * 1000 + ')' * 1000
+        res = expression.parse_string(val + nested, parseAll=True)
+        self.assertEqual(res[0], val + nested)
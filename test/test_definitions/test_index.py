@@ -5,6 +5,7 @@ from pyparsing import ParseSyntaxException
 from pyparsing import ParserElement
 
 from pydbml.definitions.index import composite_index_syntax
+from pydbml.definitions.index import composite_subject
 from pydbml.definitions.index import index
 from pydbml.definitions.index import index_setting
 from pydbml.definitions.index import index_settings
@@ -13,6 +14,7 @@ from pydbml.definitions.index import indexes
 from pydbml.definitions.index import single_index_syntax
 from pydbml.definitions.index import subject
 from pydbml.parser.blueprints import ExpressionBlueprint
+from pydbml.parser.blueprints import IndexSubjectBlueprint
 
 
 ParserElement.set_default_whitespace_chars(' \t\r')
@@ -66,6 +68,53 @@ class TestIndexSetting(TestCase):
         res = index_setting.parse_string(val, parseAll=True)
         self.assertEqual(res['note'].text, 'note text')
 
+    def test_where(self) -> None:
+        val = 'where: `deleted_at is null`'
+        res = index_setting.parse_string(val, parseAll=True)
+        self.assertEqual(res['where'], ExpressionBlueprint('deleted_at is null'))
+
+    def test_concurrently(self) -> None:
+        val = 'Concurrently'
+        res = index_setting.parse_string(val, parseAll=True)
+        self.assertIn('concurrently', res)
+        val = 'if not exists'
+        res = index_setting.parse_string(val, parseAll=True)
+        self.assertIn('if_not_exists', res)
+        val = 'If  Not\tExists'
+        res = index_setting.parse_string(val, parseAll=True)
+        self.assertIn('if_not_exists', res)
+
+    def test_include(self) -> None:
+        val = 'include: (id, "full name")'
+        res = index_setting.parse_string(val, parseAll=True)
+        self.assertEqual(list(res['include']), ['id', 'full name'])
+        val = 'include: id'
+        res = index_setting.parse_string(val, parseAll=True)
+        self.assertEqual(list(res['include']), ['id'])
+
+    def test_wrong_include(self) -> None:
+        val = 'include: (id,)'
+        with self.assertRaises(ParseSyntaxException):
+            index_setting.parse_string(val, parseAll=True)
+
+    def test_storage_params(self) -> None:
+        val = "with: (fillfactor = 70, deduplicate_items=off, param = 'a b')"
+        res = index_setting.parse_string(val, parseAll=True)
+        self.assertEqual(
+            [list(p) for p in res['storage_params']],
+            [['fillfactor', '70'], ['deduplicate_items', 'off'], ['param', 'a b']]
+        )
+
+    def test_tablespace(self) -> None:
+        val = 'tablespace: "fast ssd"'
+        res = index_setting.parse_string(val, parseAll=True)
+        self.assertEqual(res['tablespace'], 'fast ssd')
+
+    def test_wrong_where(self) -> None:
+        val = "where: 'deleted_at is null'"
+        with self.assertRaises(ParseSyntaxException):
+            index_setting.parse_string(val, parseAll=True)
+
 
 class TestIndexSettings(TestCase):
     def test_unique(self) -> None:
@@ -92,6 +141,30 @@ class TestIndexSettings(TestCase):
         self.assertEqual(res[0]['note'].text, 'index note')
         self.assertTrue(res[0]['unique'])
 
+    def test_where(self) -> None:
+        val = '[unique, where: `status = \'active\'`]'
+        res = index_settings.parse_string(val, parseAll=True)
+        self.assertTrue(res[0]['unique'])
+        self.assertEqual(res[0]['where'].text, "status = 'active'")
+
+    def test_concurrently(self) -> None:
+        val = '[concurrently, if not exists, name: "idx"]'
+        res = index_settings.parse_string(val, parseAll=True)
+        self.assertTrue(res[0]['concurrently'])
+        self.assertTrue(res[0]['if_not_exists'])
+        self.assertEqual(res[0]['name'], 'idx')
+
+    def test_storage(self) -> None:
+        val = '[with: (fillfactor = 70), tablespace: fast]'
+        res = index_settings.parse_string(val, parseAll=True)
+        self.assertEqual(res[0]['storage_params'], {'fillfactor': '70'})
+        self.assertEqual(res[0]['tablespace'], 'fast')
+
+    def test_include(self) -> None:
+        val = '[include: (\n  a,\n  b\n), unique]'
+        res = index_settings.parse_string(val, parseAll=True)
+        self.assertEqual(res[0]['include'], ['a', 'b'])
+
 
 class TestSubject(TestCase):
     def test_name(self) -> None:
@@ -110,6 +183,42 @@ class TestSubject(TestCase):
         with self.assertRaises(ParseException):
             subject.parse_string(val, parseAll=True)
 
+    def test_options(self) -> None:
+        val = 'created_at COLLATE "C" DESC NULLS LAST'
+        res = subject.parse_string(val, parseAll=True)
+        self.assertEqual(
+            res[0],
+            IndexSubjectBlueprint(
+                subject='created_at',
+                order='desc',
+                nulls='last',
+                collation='C'
+            )
+        )
+
+    def test_composite_options(self) -> None:
+        val = 'created_at collate "C" varchar_pattern_ops desc'
+        res = composite_subject.parse_string(val, parseAll=True)
+        self.assertEqual(res[0].opclass, 'varchar_pattern_ops')
+        self.assertEqual(res[0].collation, 'C')
+        self.assertEqual(res[0].order, 'desc')
+        val = '`lower(email)` text_pattern_ops'
+        res = composite_subject.parse_string(val, parseAll=True)
+        self.assertEqual(res[0].subject, ExpressionBlueprint('lower(email)'))
+        self.assertEqual(res[0].opclass, 'text_pattern_ops')
+        self.assertIsNone(res[0].order)
+
+    def test_opclass_outside_parentheses(self) -> None:
+        val = 'name text_ops'
+        with self.assertRaises(ParseException):
+            subject.parse_string(val, parseAll=True)
+
+    def test_wrong_options(self) -> None:
+        for val in ('name nulls', 'name desc asc', 'name collate'):
+            with self.subTest(val=val):
+                with self.assertRaises((ParseException, ParseSyntaxException)):
+                    composite_subject.parse_string(val, parseAll=True)
+
 
 class TestSingleIndex(TestCase):
     def test_no_settings(self) -> None:
@@ -178,6 +287,16 @@ class TestIndex(TestCase):
         self.assertEqual(res[0].subject_names[0].text, 'id*3')
         self.assertEqual(res[0].subject_names[1], 'fieldname')
 
+    def test_subject_options(self) -> None:
+        val = 'my_column desc [unique]'
+        res = index.parse_string(val, parseAll=True)
+        self.assertEqual(res[0].subject_names, [IndexSubjectBlueprint('my_column', order='desc')])
+        self.assertTrue(res[0].unique)
+        val = '(my_column nulls first, `id*3` int4_ops)'
+        res = index.parse_string(val, parseAll=True)
+        self.assertEqual(res[0].subject_names[0], IndexSubjectBlueprint('my_column', nulls='first'))
+        self.assertEqual(res[0].subject_names[1].opclass, 'int4_ops')
+
     def test_with_settings(self) -> None:
         val = '(my_column, my_another_column) [unique]'
         res = index.parse_string(val, parseAll=True)
@@ -228,6 +347,18 @@ class TestIndexes(TestCase):
         res = indexes.parse_string(val)
         self.assertEqual(len(res), 8)
 
+    def test_subject_options(self) -> None:
+        val = '''  indexes {
+      created_at desc booking_date (country text_ops, booking_date) [unique]
+      (`lower(name)` text_pattern_ops)
+  }'''
+        res = indexes.parse_string(val)
+        self.assertEqual(len(res), 4)
+        self.assertEqual(res[0].subject_names, [IndexSubjectBlueprint('created_at', order='desc')])
+        self.assertEqual(res[1].subject_names, ['booking_date'])
+        self.assertEqual(res[2].subject_names[0].opclass, 'text_ops')
+        self.assertEqual(res[3].subject_names[0].opclass, 'text_pattern_ops')
+
     def test_invalid(self) -> None:
         val = 'indexes {my_column'
         with self.assertRaises(ParseSyntaxException):
@@ -6,9 +6,14 @@ from pyparsing import ParserElement
 
 from pydbml.definitions.table import alias, table_with_properties
 from pydbml.definitions.table import header_color
+from pydbml.definitions.table import partition
+from pydbml.definitions.table import partition_by
+from pydbml.definitions.table import partitions
 from pydbml.definitions.table import table
 from pydbml.definitions.table import table_body
 from pydbml.definitions.table import table_settings
+from pydbml.parser.blueprints import ExpressionBlueprint
+from pydbml.parser.blueprints import PartitionKeyBlueprint
 
 
 ParserElement.set_default_whitespace_chars(" \t\r")
@@ -37,6 +42,76 @@ class TestHeaderColor(TestCase):
         self.assertEqual(res["header_color"], "#E02")
 
 
+class TestPartitionBy(TestCase):
+    def test_single(self) -> None:
+        val = "partition by: range(created_at)"
+        res = partition_by.parse_string(val, parseAll=True)
+        self.assertEqual(res[0], PartitionKeyBlueprint("range", ["created_at"]))
+
+    def test_composite(self) -> None:
+        val = 'Partition By: LIST ( "country", `lower(city)` )'
+        res = partition_by.parse_string(val, parseAll=True)
+        self.assertEqual(res[0].method, "list")
+        self.assertEqual(
+            res[0].subject_names,
+            ["country", ExpressionBlueprint("lower(city)")]
+        )
+
+    def test_wrong_method(self) -> None:
+        val = "partition by: interval(created_at)"
+        with self.assertRaises(ParseSyntaxException):
+            partition_by.parse_string(val, parseAll=True)
+
+    def test_no_key(self) -> None:
+        val = "partition by: hash()"
+        with self.assertRaises(ParseSyntaxException):
+            partition_by.parse_string(val, parseAll=True)
+
+
+class TestPartition(TestCase):
+    def test_values(self) -> None:
+        val = "bookings_2024 [values: `FROM ('2024-01-01') TO ('2025-01-01')`]"
+        res = partition.parse_string(val, parseAll=True)
+        self.assertEqual(res[0].name, "bookings_2024")
+        self.assertEqual(res[0].schema, "public")
+        self.assertEqual(
+            res[0].values,
+            ExpressionBlueprint("FROM ('2024-01-01') TO ('2025-01-01')")
+        )
+
+    def test_default(self) -> None:
+        val = 'archive."bookings old" [default]'
+        res = partition.parse_string(val, parseAll=True)
+        self.assertEqual(res[0].name, "bookings old")
+        self.assertEqual(res[0].schema, "archive")
+        self.assertIsNone(res[0].values)
+
+    def test_comment(self) -> None:
+        val = "// before\nbookings_2024 [default]"
+        res = partition.parse_string(val, parseAll=True)
+        self.assertEqual(res[0].comment, "before")
+        val = "// before\nbookings_2024 [default] // after"
+        res = partition.parse_string(val, parseAll=True)
+        self.assertEqual(res[0].comment, "after")
+
+    def test_no_bound(self) -> None:
+        val = "bookings_2024"
+        with self.assertRaises(ParseException):
+            partition.parse_string(val, parseAll=True)
+        val = "bookings_2024 [note: 'note']"
+        with self.assertRaises(ParseSyntaxException):
+            partition.parse_string(val, parseAll=True)
+
+    def test_block(self) -> None:
+        val = """partitions {
+    bookings_2024 [values: `FROM ('2024-01-01') TO ('2025-01-01')`]
+
+    bookings_other [default]
+}"""
+        res = partitions.parse_string(val, parseAll=True)
+        self.assertEqual([p.name for p in res], ["bookings_2024", "bookings_other"])
+
+
 class TestTableSettings(TestCase):
     def test_one(self) -> None:
         val = "[headercolor: #E024DF]"
@@ -49,6 +124,11 @@ class TestTableSettings(TestCase):
         self.assertEqual(res[0]["header_color"], "#E024DF")
         self.assertIn("note", res[0])
 
+    def test_partition_by(self) -> None:
+        val = "[headercolor: #E024DF, partition by: hash(id)]"
+        res = table_settings.parse_string(val, parseAll=True)
+        self.assertEqual(res[0]["partition_by"], PartitionKeyBlueprint("hash", ["id"]))
+
 
 class TestTableBody(TestCase):
     def test_one_column(self) -> None:
@@ -208,6 +288,32 @@ table ids as ii [
         self.assertEqual(len(res[0].columns), 2)
         self.assertEqual(len(res[0].indexes), 1)
 
+    def test_with_partitions(self) -> None:
+        val = """
+table bookings [partition by: range(created_at)]
+{
+  id integer
+  created_at timestamp
+  partitions {
+      bookings_2024 [values: `FROM ('2024-01-01') TO ('2025-01-01')`]
+      bookings_other [default]
+  }
+  indexes {
+      created_at
+  }
+}"""
+        res = table.parse_string(val, parseAll=True)
+        self.assertEqual(res[0].partition_by, PartitionKeyBlueprint("range", ["created_at"]))
+        self.assertEqual(len(res[0].partitions), 2)
+        self.assertEqual(len(res[0].indexes), 1)
+        self.assertEqual(len(res[0].columns), 2)
+
+    def test_partitions_column(self) -> None:
+        val = "table ids {\npartitions integer\n}"
+        res = table.parse_string(val, parseAll=True)
+        self.assertEqual(res[0].columns[0].name, "partitions")
+        self.assertIsNone(res[0].partitions)
+
 
 def test_properties() -> None:
     val = """
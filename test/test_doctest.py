@@ -10,6 +10,9 @@ from pydbml._classes import project
 from pydbml._classes import reference
 from pydbml._classes import table
 from pydbml._classes import table_group
+from pydbml.analysis import redundant_indexes
+from pydbml.analysis import sizes
+from pydbml.analysis import types
 from pydbml.parser import parser
 
 
@@ -25,4 +28,7 @@ def load_tests(loader, tests, ignore):
     tests.addTests(doctest.DocTestSuite(table))
     tests.addTests(doctest.DocTestSuite(table_group))
     tests.addTests(doctest.DocTestSuite(parser))
+    tests.addTests(doctest.DocTestSuite(redundant_indexes))
+    tests.addTests(doctest.DocTestSuite(sizes))
+    tests.addTests(doctest.DocTestSuite(types))
     return tests
@@ -0,0 +1,210 @@
+import json
+import os
+
+from io import StringIO
+from pathlib import Path
+from unittest import TestCase
+
+from pydbml import PyDBML
+from pydbml.classes import Column
+from pydbml.classes import Enum
+from pydbml.classes import Expression
+from pydbml.classes import Table
+from pydbml.database import Database
+from pydbml.exceptions import ColumnNotFoundError
+from pydbml.exceptions import DBMLError
+from pydbml.exceptions import TableNotFoundError
+from pydbml.interchange import dump
+from pydbml.interchange import from_document
+from pydbml.interchange import load
+
+
+TEST_DATA_PATH = Path(os.path.abspath(__file__)).parent / 'test_data'
+
+
+def round_trip(db: Database) -> Database:
+    buf = StringIO()
+    dump(db, buf)
+    buf.seek(0)
+    return load(buf)
+
+
+class TestRoundTrip(TestCase):
+    def test_files(self) -> None:
+        for path in (
+            TEST_DATA_PATH / 'general.dbml',
+            TEST_DATA_PATH / 'integration1.dbml',
+            TEST_DATA_PATH / 'relationships_composite.dbml',
+            TEST_DATA_PATH / 'docs' / 'table_group.dbml',
+            TEST_DATA_PATH / 'docs' / 'index_definition.dbml',
+            TEST_DATA_PATH / 'docs' / 'sticky_notes.dbml',
+            TEST_DATA_PATH / 'docs' / 'project_notes.dbml',
+        ):
+            with self.subTest(path=path.name):
+                db = PyDBML.parse_file(path)
+                loaded = round_trip(db)
+                self.assertEqual(loaded.dbml, db.dbml)
+                self.assertEqual(loaded.sql, db.sql)
+
+    def test_cross_references(self) -> None:
+        db = PyDBML.parse_file(TEST_DATA_PATH / 'docs' / 'enum_definition.dbml')
+        loaded = round_trip(db)
+        jobs = loaded['public.jobs']
+        self.assertIsInstance(jobs['status'].type, Enum)
+        self.assertIs(jobs['status'].type, loaded.enums[0])
+        self.assertIs(jobs.database, loaded)
+
+        db = PyDBML.parse_file(TEST_DATA_PATH / 'general.dbml')
+        loaded = round_trip(db)
+        ref = loaded.refs[0]
+        self.assertIs(ref.col1[0].table, loaded['public.orders'])
+        self.assertIs(ref.col1[0], loaded['public.orders']['id'])
+        self.assertIs(ref.database, loaded)
+
+    def test_methods(self) -> None:
+        db = PyDBML.parse_file(TEST_DATA_PATH / 'general.dbml')
+        buf = StringIO()
+        db.to_json(buf)
+        buf.seek(0)
+        loaded = Database.from_json(buf)
+        self.assertEqual(loaded.dbml, db.dbml)
+
+    def test_properties(self) -> None:
+        source = '''
+Table products {
+    id integer [col_prop: 'value']
+    table_prop: 'another value'
+}'''
+        db = PyDBML.parse(source, allow_properties=True)
+        loaded = round_trip(db)
+        self.assertTrue(loaded.allow_properties)
+        self.assertEqual(loaded['public.products'].properties, {'table_prop': 'another value'})
+        self.assertEqual(loaded['public.products']['id'].properties, {'col_prop': 'value'})
+
+    def test_index_options(self) -> None:
+        source = '''
+Table users {
+    id integer
+    email varchar
+    deleted_at timestamp
+    indexes {
+        email [unique, where: `deleted_at is null`, include: (id)]
+        id [concurrently, if not exists, name: 'users_id']
+        (deleted_at desc nulls last, `lower(email)` text_pattern_ops) [with: (fillfactor = 70), tablespace: fast]
+    }
+}'''
+        db = PyDBML.parse(source)
+        loaded = round_trip(db)
+        index = loaded['public.users'].indexes[0]
+        self.assertIsInstance(index.where, Expression)
+        self.assertEqual(index.where.text, 'deleted_at is null')
+        self.assertIs(index.include[0], loaded['public.users']['id'])
+        index = loaded['public.users'].indexes[1]
+        self.assertTrue(index.concurrently)
+        self.assertTrue(index.if_not_exists)
+        index = loaded['public.users'].indexes[2]
+        self.assertIs(index.subjects[0].subject, loaded['public.users']['deleted_at'])
+        self.assertEqual(index.subjects[0].order, 'desc')
+        self.assertEqual(index.subjects[0].nulls, 'last')
+        self.assertIsInstance(index.subjects[1].subject, Expression)
+        self.assertEqual(index.subjects[1].opclass, 'text_pattern_ops')
+        self.assertEqual(index.storage_params, {'fillfactor': '70'})
+        self.assertEqual(index.tablespace, 'fast')
+        self.assertEqual(loaded.sql, db.sql)
+        self.assertEqual(loaded.dbml, db.dbml)
+
+    def test_partitions(self) -> None:
+        source = '''
+Table bookings [partition by: range(created_at, `id % 4`)] {
+    id integer
+    created_at timestamp
+    partitions {
+        bookings_2024 [values: `FROM ('2024-01-01') TO ('2025-01-01')`]
+        // the rest
+        archive.bookings_other [default]
+    }
+}'''
+        db = PyDBML.parse(source)
+        loaded = round_trip(db)
+        table = loaded['public.bookings']
+        self.assertEqual(table.partition_by.method, 'range')
+        self.assertIs(table.partition_by.subjects[0], table['created_at'])
+        self.assertEqual(table.partition_by.subjects[1], Expression('id % 4'))
+        self.assertEqual(len(table.partitions), 2)
+        self.assertIs(table.partitions[0].table, table)
+        self.assertEqual(table.partitions[1].full_name, 'archive.bookings_other')
+        self.assertTrue(table.partitions[1].default)
+        self.assertEqual(table.partitions[1].comment, 'the rest')
+        self.assertEqual(loaded.sql, db.sql)
+        self.assertEqual(loaded.dbml, db.dbml)
+
+
+class TestDump(TestCase):
+    def test_valid_json(self) -> None:
+        db = Database()
+        table = Table('products', columns=[Column('created', 'timestamp', default=Expression('now()'))])
+        db.add(table)
+        buf = StringIO()
+        dump(db, buf)
+        document = json.loads(buf.getvalue())
+        self.assertEqual(document['format'], 'pydbml')
+        self.assertEqual(document['version'], 1)
+        self.assertIsNone(document['project'])
+        self.assertEqual(document['refs'], [])
+        column = document['tables'][0]['columns'][0]
+        self.assertEqual(column['default'], {'expression': 'now()'})
+
+    def test_empty(self) -> None:
+        buf = StringIO()
+        dump(Database(), buf)
+        loaded = from_document(json.loads(buf.getvalue()))
+        self.assertEqual(loaded.tables, [])
+
+
+class TestLoad(TestCase):
+    def setUp(self) -> None:
+        db = PyDBML.parse_file(TEST_DATA_PATH / 'general.dbml')
+        buf = StringIO()
+        dump(db, buf)
+        self.document = json.loads(buf.getvalue())
+
+    def test_wrong_format(self) -> None:
+        with self.assertRaises(DBMLError):
+            from_document({'format': 'other'})
+        self.document['version'] = 100
+        with self.assertRaises(DBMLError):
+            from_document(self.document)
+
+    def test_missing_table(self) -> None:
+        self.document['refs'][0]['col1']['table'] = ['public', 'missing']
+        with self.assertRaises(TableNotFoundError):
+            from_document(self.document)
+
+    def test_missing_column(self) -> None:
+        self.document['refs'][0]['col1']['columns'] = ['missing']
+        with self.assertRaises(ColumnNotFoundError):
+            from_document(self.document)
+
+    def test_missing_index_options(self) -> None:
+        # documents written before the options were added
+        db = PyDBML.parse_file(TEST_DATA_PATH / 'docs' / 'index_definition.dbml')
+        buf = StringIO()
+        dump(db, buf)
+        document = json.loads(buf.getvalue())
+        for table in document['tables']:
+            for index in table['indexes']:
+                del index['where']
+                del index['include']
+                del index['concurrently']
+                del index['if_not_exists']
+                del index['storage_params']
+                del index['tablespace']
+            del table['partition_by']
+            del table['partitions']
+        loaded = from_document(document)
+        self.assertEqual(loaded.sql, db.sql)
+
+    def test_duplicate_table(self) -> None:
+        self.document['tables'].append(self.document['tables'][0])
+        with self.assertRaises(DBMLError):
+            from_document(self.document)
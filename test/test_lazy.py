@@ -0,0 +1,130 @@
+import os
+
+from pathlib import Path
+from unittest import TestCase
+
+from pyparsing import ParseBaseException
+
+from pydbml import PyDBML
+from pydbml.classes import Column
+from pydbml.classes import Table
+from pydbml.parser.lazy import LazyDatabase
+
+
+TEST_DATA_PATH = Path(os.path.abspath(__file__)).parent / 'test_data'
+
+
+SOURCE = '''
+enum status {
+    active
+    deleted
+}
+
+// users table
+Table myschema.users as U {
+    id integer [pk]
+    status status
+}
+
+Table posts {
+    id integer [pk]
+    user_id integer [ref: > U.id]
+}
+
+Table comments {
+    id integer [pk]
+    post_id integer
+}
+
+Ref: comments.post_id > posts.id
+
+TableGroup content {
+    posts
+    comments
+}
+'''
+
+
+class TestLazyDatabase(TestCase):
+    def test_nothing_parsed(self) -> None:
+        db = PyDBML.parse(SOURCE, lazy=True)
+        self.assertIsInstance(db, LazyDatabase)
+        self.assertEqual(db.materialized, 0)
+        self.assertEqual(len(db.enums), 1)
+
+    def test_getitem(self) -> None:
+        db = PyDBML.parse(SOURCE, lazy=True)
+        users = db['myschema.users']
+        self.assertEqual(users.name, 'users')
+        self.assertEqual(users.comment, 'users table')
+        self.assertIs(users['status'].type, db.enums[0])
+        self.assertEqual(db.materialized, 1)
+        self.assertIs(db['U'], users)
+        self.assertIs(db['myschema.users'], users)
+        self.assertEqual(db.materialized, 1)
+        with self.assertRaises(KeyError):
+            db['public.missing']
+
+    def test_iteration(self) -> None:
+        db = PyDBML.parse(SOURCE, lazy=True)
+        iterator = iter(db)
+        self.assertEqual(next(iterator).name, 'users')
+        self.assertEqual(db.materialized, 1)
+        self.assertEqual([t.name for t in iterator], ['posts', 'comments'])
+        self.assertEqual(db.materialized, 3)
+
+    def test_source_order(self) -> None:
+        db = PyDBML.parse(SOURCE, lazy=True)
+        db['public.comments']
+        db['U']
+        self.assertEqual([t.name for t in db.tables], ['users', 'posts', 'comments'])
+
+    def test_refs_on_demand(self) -> None:
+        db = PyDBML.parse(SOURCE, lazy=True)
+        posts = db['public.posts']
+        self.assertEqual(db.materialized, 1)
+        refs = posts.get_refs()
+        self.assertEqual(len(refs), 1)
+        self.assertIs(refs[0].col2[0].table, db['U'])
+        self.assertEqual(len(db.refs), 2)
+
+    def test_table_groups(self) -> None:
+        db = PyDBML.parse(SOURCE, lazy=True)
+        group = db.table_groups[0]
+        self.assertEqual([t.name for t in group.items], ['posts', 'comments'])
+        self.assertEqual(db.materialized, 2)
+
+    def test_same_as_eager(self) -> None:
+        for path in (
+            TEST_DATA_PATH / 'general.dbml',
+            TEST_DATA_PATH / 'integration1.dbml',
+            TEST_DATA_PATH / 'relationships_aliases.dbml',
+            TEST_DATA_PATH / 'docs' / 'table_group.dbml',
+            TEST_DATA_PATH / 'docs' / 'project_notes.dbml',
+            TEST_DATA_PATH / 'docs' / 'sticky_notes.dbml',
+        ):
+            with self.subTest(path=path.name):
+                eager = PyDBML.parse_file(path)
+                lazy = PyDBML.parse_file(path, lazy=True)
+                self.assertEqual(lazy.dbml, eager.dbml)
+                self.assertEqual(lazy.sql, eager.sql)
+
+    def test_editing(self) -> None:
+        db = PyDBML.parse(SOURCE, lazy=True)
+        table = Table('new', columns=[Column('id', 'integer')])
+        db.add(table)
+        self.assertEqual([t.name for t in db], ['users', 'posts', 'comments', 'new'])
+        db.delete(db['public.posts'])
+        self.assertEqual([t.name for t in db.tables], ['users', 'comments', 'new'])
+
+    def test_syntax_error_on_access(self) -> None:
+        source = SOURCE + '\nTable broken {\n    id integer [pk\n}\n'
+        db = PyDBML.parse(source, lazy=True)
+        self.assertEqual(db['public.posts'].name, 'posts')
+        with self.assertRaises(ParseBaseException) as e:
+            db['public.broken']
+        self.assertEqual(e.exception.lineno, source.count('\n'))
+
+    def test_unknown_block(self) -> None:
+        with self.assertRaises(ParseBaseException):
+            PyDBML.parse(SOURCE + '\nwrong\n', lazy=True)
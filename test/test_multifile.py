@@ -0,0 +1,110 @@
+import os
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from pydbml import PyDBML
+from pydbml.exceptions import TableNotFoundError
+from pydbml.parser.multifile import ParseCache
+
+
+USERS = '''enum status {
+  active
+  inactive
+}
+
+Table users as U {
+  id integer [pk]
+  status status
+}
+'''
+
+POSTS = '''Project blog {
+  database_type: 'PostgreSQL'
+}
+
+Table posts {
+  id integer [pk]
+  user_id integer [ref: > U.id]
+  status status
+}
+
+TableGroup content {
+  users
+  posts
+}
+'''
+
+
+class TestParseFiles(TestCase):
+    def setUp(self) -> None:
+        self.tempdir = TemporaryDirectory()
+        self.dir = Path(self.tempdir.name)
+        self.users = self.dir / 'users.dbml'
+        self.posts = self.dir / 'posts.dbml'
+        self.users.write_text(USERS)
+        self.posts.write_text(POSTS)
+
+    def tearDown(self) -> None:
+        self.tempdir.cleanup()
+
+    def test_cross_file_references(self) -> None:
+        db = PyDBML.parse_files([self.users, self.posts])
+        self.assertEqual([t.name for t in db.tables], ['users', 'posts'])
+        self.assertEqual(len(db.refs), 1)
+        ref = db.refs[0]
+        self.assertIs(ref.col1[0].table, db['public.posts'])
+        self.assertIs(ref.col2[0].table, db['public.users'])
+        self.assertIs(db['public.posts']['status'].type, db.enums[0])
+        self.assertEqual(db.project.name, 'blog')
+        self.assertEqual([t.name for t in db.table_groups[0].items], ['users', 'posts'])
+
+    def test_same_as_concatenated(self) -> None:
+        db = PyDBML.parse_files([str(self.users), str(self.posts)])
+        expected = PyDBML(USERS + POSTS)
+        self.assertEqual(db.dbml, expected.dbml)
+        self.assertEqual(db.sql, expected.sql)
+
+    def test_order_matters(self) -> None:
+        with self.assertRaises(TableNotFoundError):
+            PyDBML.parse_files([self.posts])
+
+    def test_cache(self) -> None:
+        cache = ParseCache()
+        db1 = PyDBML.parse_files([self.users, self.posts], cache=cache)
+        self.assertEqual(cache.parsed, 2)
+        self.assertEqual(len(cache), 2)
+        parsed = cache.get(self.users)
+        db2 = PyDBML.parse_files([self.users, self.posts], cache=cache)
+        self.assertEqual(cache.parsed, 2)
+        self.assertIs(cache.get(self.users), parsed)
+        self.assertIsNot(db1['public.users'], db2['public.users'])
+        self.assertIs(db2['public.users'].database, db2)
+        self.assertEqual(db1.dbml, db2.dbml)
+
+    def test_changed_file_is_parsed_again(self) -> None:
+        cache = ParseCache()
+        PyDBML.parse_files([self.users, self.posts], cache=cache)
+        stat = os.stat(self.posts)
+        self.posts.write_text(POSTS.replace('id integer [pk]', 'id bigint [pk]'))
+        os.utime(self.posts, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        db = PyDBML.parse_files([self.users, self.posts], cache=cache)
+        self.assertEqual(cache.parsed, 3)
+        self.assertEqual(db['public.posts']['id'].type, 'bigint')
+        self.assertEqual(db['public.users']['id'].type, 'integer')
+
+    def test_clear(self) -> None:
+        cache = ParseCache()
+        PyDBML.parse_files([self.users, self.posts], cache=cache)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        PyDBML.parse_files([self.users, self.posts], cache=cache)
+        self.assertEqual(cache.parsed, 4)
+
+    def test_allow_properties(self) -> None:
+        self.users.write_text(USERS.replace('id integer [pk]', 'id integer [pk, mykey: "myvalue"]'))
+        cache = ParseCache()
+        db = PyDBML.parse_files([self.users, self.posts], cache=cache, allow_properties=True)
+        self.assertEqual(db['public.users']['id'].properties, {'mykey': 'myvalue'})
+        self.assertTrue(db.allow_properties)
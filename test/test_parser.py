@@ -1,12 +1,24 @@
+import gc
+import gzip
+import mmap
 import os
+import tracemalloc
 
+from io import BytesIO
 from pathlib import Path
+from tempfile import TemporaryDirectory
+from threading import Thread
 from unittest import TestCase
+from unittest import skipUnless
+
+from pyparsing import ParserElement
 
 from pydbml import PyDBML
 from pydbml.exceptions import ColumnNotFoundError
 from pydbml.exceptions import TableNotFoundError
+from pydbml.parser.blueprints import Blueprint
 from pydbml.parser.parser import PyDBMLParser
+from pydbml.parser.parser import packrat_scope
 
 
 TEST_DATA_PATH = Path(os.path.abspath(__file__)).parent / 'test_data'
@@ -185,3 +197,217 @@ def test_repr_pydbml() -> None:
 def test_repr_pydbml_parser() -> None:
     assert repr(PyDBMLParser('')) == "<PyDBMLParser>"
 
+
+class TestInterning(TestCase):
+    def test_repeated_values_share_objects(self) -> None:
+        source = '''
+Table myschema.t1 {
+    id integer
+}
+Table myschema.t2 {
+    id integer
+    t1_id integer [ref: > myschema.t1.id]
+}
+'''
+        db = PyDBML.parse(source)
+        t1, t2 = db.tables
+        self.assertIs(t1.schema, t2.schema)
+        self.assertIs(t1['id'].type, t2['t1_id'].type)
+
+
+class TestLowMemory(TestCase):
+    @staticmethod
+    def reachable(root):
+        seen = {id(root)}
+        stack = [root]
+        while stack:
+            obj = stack.pop()
+            yield obj
+            for ref in gc.get_referents(obj):
+                if id(ref) not in seen and not isinstance(ref, type):
+                    seen.add(id(ref))
+                    stack.append(ref)
+
+    def test_parse(self) -> None:
+        with open(TEST_DATA_PATH / 'general.dbml', encoding='utf8') as f:
+            source = f.read()
+        parser = PyDBMLParser(source, low_memory=True)
+        db = parser.parse()
+        self.assertEqual(db.dbml, PyDBML.parse(source).dbml)
+        self.assertEqual(parser.source, '')
+        self.assertEqual(parser.tables, [])
+        self.assertEqual(parser.refs, [])
+        self.assertEqual(parser.enums, [])
+        self.assertEqual(parser.table_groups, [])
+        self.assertIsNone(parser.project)
+        self.assertEqual(parser.ref_blueprints, [])
+        self.assertIsNone(parser.peak_memory)
+
+    def test_ref_blueprints(self) -> None:
+        source = 'Table a {\n id int [ref: > b.id]\n}\nTable b {\n id int\n}'
+        parser = PyDBMLParser(source)
+        parser.parse()
+        self.assertEqual(len(parser.ref_blueprints), 1)
+        self.assertIs(parser.ref_blueprints[0], parser.refs[0])
+        parser = PyDBMLParser(source, low_memory=True)
+        parser.parse()
+        self.assertEqual(parser.ref_blueprints, [])
+
+    def test_trace_memory(self) -> None:
+        source = (TEST_DATA_PATH / 'general.dbml').read_text(encoding='utf8')
+        parser = PyDBMLParser(source, low_memory=True, trace_memory=True)
+        parser.parse()
+        self.assertGreater(parser.peak_memory, 0)
+        self.assertFalse(tracemalloc.is_tracing())
+        if not hasattr(tracemalloc, 'reset_peak'):  # pragma: no cover
+            return
+        # a large allocation before the parse doesn't count
+        tracemalloc.start()
+        try:
+            data = bytearray(50 * 2 ** 20)  # noqa: F841
+            parser = PyDBMLParser(source, trace_memory=True)
+            parser.parse()
+            self.assertLess(parser.peak_memory, 50 * 2 ** 20)
+            self.assertTrue(tracemalloc.is_tracing())
+        finally:
+            tracemalloc.stop()
+
+    def test_trace_memory_public(self) -> None:
+        path = TEST_DATA_PATH / 'general.dbml'
+        self.assertIsNone(PyDBML.parse_file(path, low_memory=True).peak_memory)
+        db = PyDBML.parse_file(path, low_memory=True, trace_memory=True)
+        self.assertGreater(db.peak_memory, 0)
+        self.assertEqual(db.dbml, PyDBML.parse_file(path).dbml)
+        self.assertGreater(PyDBML(path, lazy=True, trace_memory=True).peak_memory, 0)
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_unsupported_modes(self) -> None:
+        with self.assertRaises(ValueError):
+            PyDBML.parse('', low_memory=True, lazy=True)
+        with self.assertRaises(ValueError):
+            PyDBML.parse('', low_memory=True, table_filter='users')
+
+    def test_nothing_reachable_from_database(self) -> None:
+        source = (TEST_DATA_PATH / 'general.dbml').read_text(encoding='utf8')
+        db = PyDBML.parse(source, low_memory=True)
+        for obj in self.reachable(db):
+            self.assertNotIsInstance(obj, (Blueprint, PyDBMLParser))
+            self.assertIsNot(obj, source)
+
+    def test_parse_file(self) -> None:
+        db = PyDBML.parse_file(TEST_DATA_PATH / 'general.dbml', low_memory=True)
+        self.assertEqual(len(db.tables), 6)
+
+
+class TestBinaryInput(TestCase):
+    def setUp(self) -> None:
+        self.path = TEST_DATA_PATH / 'general.dbml'
+        self.data = self.path.read_bytes()
+        self.expected = PyDBML.parse(self.data.decode('utf8')).dbml
+
+    def test_bytes(self) -> None:
+        for data in (
+            self.data,
+            b'\xef\xbb\xbf' + self.data,
+            bytearray(self.data),
+            memoryview(self.data),
+            gzip.compress(self.data),
+        ):
+            with self.subTest(data=type(data)):
+                self.assertEqual(PyDBML.parse(data).dbml, self.expected)
+                self.assertEqual(PyDBML(data).dbml, self.expected)
+
+    def test_streams(self) -> None:
+        self.assertEqual(PyDBML.parse_file(BytesIO(self.data)).dbml, self.expected)
+        self.assertEqual(PyDBML(BytesIO(gzip.compress(self.data))).dbml, self.expected)
+        with open(self.path, 'rb') as f:
+            self.assertEqual(PyDBML.parse_file(f).dbml, self.expected)
+        with open(self.path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                self.assertEqual(PyDBML.parse_file(mapped).dbml, self.expected)
+
+    def test_files(self) -> None:
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'schema.dbml.gz'
+            with gzip.open(path, 'wb') as f:
+                f.write(b'\xef\xbb\xbf' + self.data)
+            self.assertEqual(PyDBML.parse_file(path).dbml, self.expected)
+            with gzip.open(path) as f:
+                self.assertEqual(PyDBML.parse_file(f).dbml, self.expected)
+            empty = Path(tmp) / 'empty.dbml'
+            empty.write_bytes(b'')
+            self.assertEqual(PyDBML.parse_file(str(empty)).tables, [])
+
+    @skipUnless(hasattr(os, 'mkfifo'), 'named pipes are not supported')
+    def test_pipe(self) -> None:
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'schema.dbml'
+            os.mkfifo(path)
+            writer = Thread(target=path.write_bytes, args=(gzip.compress(self.data),))
+            writer.start()
+            try:
+                self.assertEqual(PyDBML.parse_file(path).dbml, self.expected)
+            finally:
+                writer.join()
+
+    def test_crlf(self) -> None:
+        source = "Table t {\n  id int\n  Note: '''\n    line1\n    line2\n  '''\n}\n"
+        expected = PyDBML(source)
+        self.assertEqual(expected.tables[0].note.text, 'line1\nline2')
+        for newline in ('\r\n', '\r'):
+            data = source.replace('\n', newline).encode('utf8')
+            with self.subTest(newline=newline):
+                with TemporaryDirectory() as tmp:
+                    path = Path(tmp) / 'schema.dbml'
+                    path.write_bytes(data)
+                    db = PyDBML.parse_file(path)
+                    self.assertEqual(db.tables[0].note.text, 'line1\nline2')
+                    self.assertEqual(db.sql, expected.sql)
+                    self.assertEqual(db.dbml, expected.dbml)
+                    with open(path, 'rb') as f:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                            self.assertEqual(PyDBML.parse_file(mapped).dbml, expected.dbml)
+                self.assertEqual(PyDBML(BytesIO(data)).dbml, expected.dbml)
+                self.assertEqual(PyDBML.parse(data).dbml, expected.dbml)
+
+
+class TestPackrat(TestCase):
+    def test_same_result(self) -> None:
+        for path in (TEST_DATA_PATH / 'general.dbml', TEST_DATA_PATH / 'integration1.dbml'):
+            with self.subTest(path=path.name):
+                expected = PyDBML.parse_file(path).dbml
+                self.assertEqual(PyDBML.parse_file(path, packrat=True).dbml, expected)
+                self.assertEqual(PyDBML.parse_file(path, packrat=16).dbml, expected)
+                self.assertEqual(PyDBML.parse_file(path, packrat=True, lazy=True).dbml, expected)
+
+    def test_state_restored(self) -> None:
+        cache = ParserElement.packrat_cache
+        with packrat_scope(8):
+            self.assertIsNot(ParserElement.packrat_cache, cache)
+        self.assertIs(ParserElement.packrat_cache, cache)
+        # memoization is disabled again, so enabling it creates a new cache
+        ParserElement.enable_packrat(4)
+        try:
+            self.assertIsNot(ParserElement.packrat_cache, cache)
+        finally:
+            ParserElement.disable_memoization()
+            ParserElement.packrat_cache = cache
+
+    def test_global_setting_kept(self) -> None:
+        ParserElement.enable_packrat(64)
+        try:
+            cache = ParserElement.packrat_cache
+            PyDBML.parse_file(TEST_DATA_PATH / 'general.dbml', packrat=True)
+            self.assertIs(ParserElement.packrat_cache, cache)
+        finally:
+            ParserElement.disable_memoization()
+
+    def test_left_recursion_kept(self) -> None:
+        cache = ParserElement.packrat_cache
+        ParserElement.enable_left_recursion()
+        try:
+            path = TEST_DATA_PATH / 'general.dbml'
+            self.assertEqual(PyDBML.parse_file(path, packrat=True).dbml, PyDBML.parse_file(path).dbml)
+            self.assertIs(ParserElement.packrat_cache, cache)
+        finally:
+            ParserElement.disable_memoization()
@@ -0,0 +1,79 @@
+import os
+
+from pathlib import Path
+from unittest import TestCase
+
+from pydbml import PyDBML
+from pydbml.parser.recovery import Diagnostic
+
+
+TEST_DATA_PATH = Path(os.path.abspath(__file__)).parent / 'test_data'
+
+
+SOURCE = '''Table users {
+  id integer [pk]
+  name varchar [wrong setting]
+}
+
+Table posts {
+  id integer
+  user_id integer
+
+Table comments {
+  id integer
+  post_id integer [ref: > posts.id]
+}
+
+garbage line
+more garbage
+
+enum status {
+  active
+}
+
+Ref: comments.post_id > missing.id
+
+Table ok {
+  id int
+}
+'''
+
+
+class TestParseWithDiagnostics(TestCase):
+    def test_valid_source(self) -> None:
+        path = TEST_DATA_PATH / 'integration1.dbml'
+        db, diagnostics = PyDBML.parse_with_diagnostics(path.read_text())
+        self.assertEqual(diagnostics, [])
+        self.assertEqual(db.dbml, PyDBML.parse_file(path).dbml)
+
+    def test_all_errors_reported(self) -> None:
+        db, diagnostics = PyDBML.parse_with_diagnostics(SOURCE)
+        self.assertEqual(
+            [(d.line, d.column) for d in diagnostics],
+            [(3, 17), (10, 1), (10, 1), (15, 1), (22, 1)]
+        )
+        self.assertTrue(diagnostics[1].message.startswith("Expected '}'"))
+        self.assertIn('public.posts', diagnostics[2].message)
+        self.assertTrue(diagnostics[3].message.endswith("found 'garbage'"))
+        self.assertIn('public.missing', diagnostics[4].message)
+        self.assertIsInstance(diagnostics[0], Diagnostic)
+        self.assertEqual(str(diagnostics[1]), f"10:1: {diagnostics[1].message}")
+
+    def test_partial_database(self) -> None:
+        db, _ = PyDBML.parse_with_diagnostics(SOURCE)
+        self.assertEqual([t.name for t in db.tables], ['comments', 'ok'])
+        self.assertEqual([e.name for e in db.enums], ['status'])
+        self.assertEqual(db.refs, [])
+
+    def test_build_errors(self) -> None:
+        source = 'Table a {\n  id int\n}\nTable a {\n  id int\n}\nTable b {\n  Note: "no columns"\n}\n'
+        db, diagnostics = PyDBML.parse_with_diagnostics(source)
+        self.assertEqual([(d.line, d.column) for d in diagnostics], [(4, 1), (7, 1)])
+        self.assertEqual(len(db.tables), 1)
+
+    def test_failed_block_dropped(self) -> None:
+        source = 'Table a {\n  id int [ref: > b.id]\n  name varchar [\n}\nTable b {\n  id int\n}\n'
+        db, diagnostics = PyDBML.parse_with_diagnostics(source)
+        self.assertEqual(len(diagnostics), 1)
+        self.assertEqual([t.name for t in db.tables], ['b'])
+        self.assertEqual(db.refs, [])
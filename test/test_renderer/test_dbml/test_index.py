@@ -1,7 +1,12 @@
 from unittest.mock import patch, Mock
 
-from pydbml.classes import Index, Expression, Note
-from pydbml.renderer.dbml.default.index import render_subjects, render_options, render_index
+from pydbml.classes import Index, IndexSubject, Expression, Note
+from pydbml.renderer.dbml.default.index import (
+    render_subjects,
+    render_options,
+    render_index,
+    render_index_subject,
+)
 
 
 class TestRenderSubjects:
@@ -25,6 +30,28 @@ class TestRenderSubjects:
         index1.subjects.append("name")
         assert render_subjects(index1.subjects) == "(name, `SUM(amount)`, name)"
 
+    @staticmethod
+    def test_subject_options(index1: Index) -> None:
+        index1.subjects = [
+            IndexSubject(index1.subjects[0], order="desc", nulls="last"),
+            IndexSubject(Expression("lower(name)"), opclass="text_pattern_ops"),
+        ]
+        expected = "(name desc nulls last, `lower(name)` text_pattern_ops)"
+        assert render_subjects(index1.subjects) == expected
+
+
+    @staticmethod
+    def test_single_with_opclass(index1: Index) -> None:
+        index1.subjects = [IndexSubject("name", opclass="text_ops")]
+        assert render_subjects(index1.subjects) == "(name text_ops)"
+        index1.subjects = [IndexSubject("name", order="desc")]
+        assert render_subjects(index1.subjects) == "name desc"
+
+
+def test_render_index_subject() -> None:
+    subject = IndexSubject("name", order="asc", nulls="first", collation="C", opclass="text_ops")
+    assert render_index_subject(subject) == 'name collate "C" text_ops asc nulls first'
+
 
 class TestRenderOptions:
     @staticmethod
@@ -47,6 +74,28 @@ class TestRenderOptions:
         index1.type = "hash"
         assert render_options(index1) == " [type: hash]"
 
+    @staticmethod
+    def test_concurrently(index1: Index) -> None:
+        index1.concurrently = True
+        index1.if_not_exists = True
+        assert render_options(index1) == " [concurrently, if not exists]"
+
+    @staticmethod
+    def test_include(index1: Index) -> None:
+        index1.include = ["id", "full name"]
+        assert render_options(index1) == ' [include: ("id", "full name")]'
+
+    @staticmethod
+    def test_storage(index1: Index) -> None:
+        index1.storage_params = {"fillfactor": "70", "param": "a b"}
+        index1.tablespace = "fast"
+        assert render_options(index1) == " [with: (fillfactor = 70, param = 'a b'), tablespace: \"fast\"]"
+
+    @staticmethod
+    def test_where(index1: Index) -> None:
+        index1.where = Expression("deleted_at is null")
+        assert render_options(index1) == " [where: `deleted_at is null`]"
+
     @staticmethod
     def test_note(index1: Index) -> None:
         index1.note = Note("note")
@@ -66,6 +115,8 @@ class TestRenderOptions:
         index1.pk = True
         index1.unique = True
         index1.type = "hash"
+        index1.where = "price > 0"
+        index1.include = ["id"]
         index1.note = Note("note")
         with patch(
             "pydbml.renderer.dbml.default.index.note_option_to_dbml",
@@ -73,7 +124,7 @@ class TestRenderOptions:
         ):
             assert (
                 render_options(index1)
-                == " [name: 'index_name', pk, unique, type: hash, note]"
+                == " [name: 'index_name', pk, unique, type: hash, where: `price > 0`, include: (\"id\"), note]"
             )
 
 
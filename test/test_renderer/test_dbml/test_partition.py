@@ -0,0 +1,27 @@
+from pydbml.classes import Expression, Partition, PartitionKey, Table
+from pydbml.renderer.dbml.default.partition import render_partition, render_partition_key
+
+
+class TestRenderPartitionKey:
+    @staticmethod
+    def test_column(table1: Table) -> None:
+        key = PartitionKey("hash", [table1.columns[0]])
+        assert render_partition_key(key) == "partition by: hash(id)"
+
+    @staticmethod
+    def test_expression(table1: Table) -> None:
+        key = PartitionKey("list", [table1.columns[1], Expression("lower(name)")])
+        assert render_partition_key(key) == "partition by: list(name, `lower(name)`)"
+
+
+class TestRenderPartition:
+    @staticmethod
+    def test_values() -> None:
+        partition = Partition("products_a", values=Expression("IN ('a')"))
+        assert render_partition(partition) == "\"products_a\" [values: `IN ('a')`]"
+
+    @staticmethod
+    def test_default() -> None:
+        partition = Partition("products_other", schema="archive", comment="The rest")
+        expected = '// The rest\n"archive"."products_other" [default]'
+        assert render_partition(partition) == expected
@@ -1,9 +1,10 @@
 from pydbml import Database
-from pydbml.classes import Table, Index, Note
+from pydbml.classes import Table, Index, Note, Partition, PartitionKey
 from pydbml.renderer.dbml.default.table import (
     get_full_name_for_dbml,
     render_header,
     render_indexes,
+    render_partitions,
     render_table,
 )
 
@@ -46,6 +47,32 @@ class TestRenderHeader:
         assert render_header(table1) == expected
 
 
+    @staticmethod
+    def test_partition_by(table1: Table) -> None:
+        table1.header_color = "red"
+        table1.partition_by = PartitionKey("range", [table1.columns[0]])
+        expected = 'Table "products" [headercolor: red, partition by: range(id)] '
+        assert render_header(table1) == expected
+
+
+class TestRenderPartitions:
+    @staticmethod
+    def test_no_partitions(table1: Table) -> None:
+        assert render_partitions(table1) == ""
+
+    @staticmethod
+    def test_partitions(table1: Table) -> None:
+        table1.add_partition(Partition("p1", values="IN (1)"))
+        table1.add_partition(Partition("p2"))
+        expected = (
+            "\n    partitions {\n"
+            '        "p1" [values: `IN (1)`]\n'
+            '        "p2" [default]\n'
+            "    }\n"
+        )
+        assert render_partitions(table1) == expected
+
+
 class TestRenderIndexes:
     @staticmethod
     def test_no_indexes(table1: Table) -> None:
@@ -1,5 +1,14 @@
-from pydbml.classes import Column, Expression, Index
-from pydbml.renderer.sql.default.index import render_subject, render_index, render_pk
+import pytest
+
+from pydbml.classes import Column, Expression, Index, IndexSubject
+from pydbml.exceptions import AttributeMissingError
+from pydbml.renderer.sql.default.index import (
+    render_subject,
+    render_index,
+    render_index_subject,
+    render_pk,
+    render_storage_param_value,
+)
 
 
 class TestRenderSubject:
@@ -19,6 +28,26 @@ class TestRenderSubject:
         assert render_subject(expected) == expected
 
 
+class TestRenderIndexSubject:
+    @staticmethod
+    def test_column(simple_column: Column) -> None:
+        subject = IndexSubject(simple_column, order='desc', nulls='last')
+        assert render_index_subject(subject) == '"id" DESC NULLS LAST'
+        assert render_subject(subject) == '"id" DESC NULLS LAST'
+
+    @staticmethod
+    def test_all_options(expression1: Expression) -> None:
+        subject = IndexSubject(expression1, order='asc', nulls='first', collation='C', opclass='text_pattern_ops')
+        expected = f'({expression1.text}) COLLATE "C" text_pattern_ops ASC NULLS FIRST'
+        assert render_index_subject(subject) == expected
+
+
+def test_render_storage_param_value() -> None:
+    assert render_storage_param_value('70') == '70'
+    assert render_storage_param_value('off') == 'off'
+    assert render_storage_param_value("it's") == "'it''s'"
+
+
 class TestRenderPK:
     @staticmethod
     def test_comment(index1: Index) -> None:
@@ -63,6 +92,59 @@ class TestRenderComponents:
         expected = 'CREATE INDEX ON "products" USING HASH ("name");'
         assert render_index(index1) == expected
 
+    @staticmethod
+    def test_where(index1: Index) -> None:
+        index1.where = Expression("deleted_at IS NULL")
+        expected = 'CREATE INDEX ON "products" ("name") WHERE deleted_at IS NULL;'
+        assert render_index(index1) == expected
+
+    @staticmethod
+    def test_concurrently(index1: Index) -> None:
+        index1.concurrently = True
+        expected = 'CREATE INDEX CONCURRENTLY ON "products" ("name");'
+        assert render_index(index1) == expected
+
+    @staticmethod
+    def test_if_not_exists(index1: Index) -> None:
+        index1.if_not_exists = True
+        index1.unique = True
+        index1.concurrently = True
+        # requires a name
+        with pytest.raises(AttributeMissingError):
+            index1.sql
+        index1.name = "test"
+        expected = 'CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS "test" ON "products" ("name");'
+        assert render_index(index1) == expected
+
+    @staticmethod
+    def test_include(index1: Index) -> None:
+        index1.include = [index1.table.columns[0], "price"]
+        index1.where = "price > 0"
+        expected = (
+            'CREATE INDEX ON "products" ("name") INCLUDE ("id", "price")'
+            ' WHERE price > 0;'
+        )
+        assert render_index(index1) == expected
+
+    @staticmethod
+    def test_storage(index1: Index) -> None:
+        index1.storage_params = {'fillfactor': '70', 'deduplicate_items': 'off'}
+        index1.tablespace = 'fast'
+        index1.include = ['price']
+        index1.where = 'price > 0'
+        expected = (
+            'CREATE INDEX ON "products" ("name") INCLUDE ("price")'
+            ' WITH (fillfactor = 70, deduplicate_items = off) TABLESPACE "fast"'
+            ' WHERE price > 0;'
+        )
+        assert render_index(index1) == expected
+
+    @staticmethod
+    def test_where_string(index1: Index) -> None:
+        index1.where = "price > 0"
+        expected = 'CREATE INDEX ON "products" ("name") WHERE price > 0;'
+        assert render_index(index1) == expected
+
 
 class TestRenderIndex:
     @staticmethod
@@ -80,3 +162,13 @@ class TestRenderIndex:
         index1.pk = True
         expected = 'PRIMARY KEY ("name")'
         assert render_index(index1) == expected
+
+    @staticmethod
+    def test_render_pk_subject_options(index1: Index) -> None:
+        index1.pk = True
+        index1.subjects = [
+            IndexSubject(index1.table.columns[0], order='desc', collation='C'),
+            index1.subjects[0],
+        ]
+        expected = 'PRIMARY KEY ("id", "name")'
+        assert render_index(index1) == expected
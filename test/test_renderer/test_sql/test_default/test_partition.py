@@ -0,0 +1,34 @@
+from pydbml.classes import Expression, Partition, PartitionKey, Table
+from pydbml.renderer.sql.default.partition import render_partition, render_partition_key
+
+
+class TestRenderPartitionKey:
+    @staticmethod
+    def test_column(table1: Table) -> None:
+        key = PartitionKey("range", [table1.columns[0]])
+        assert render_partition_key(key) == 'PARTITION BY RANGE ("id")'
+
+    @staticmethod
+    def test_expression(table1: Table) -> None:
+        key = PartitionKey("list", [table1.columns[1], Expression("lower(name)")])
+        assert render_partition_key(key) == 'PARTITION BY LIST ("name", (lower(name)))'
+
+
+class TestRenderPartition:
+    @staticmethod
+    def test_values(table1: Table) -> None:
+        partition = Partition("products_a", values=Expression("IN ('a')"))
+        table1.add_partition(partition)
+        expected = "CREATE TABLE \"products_a\" PARTITION OF \"products\" FOR VALUES IN ('a');"
+        assert render_partition(partition) == expected
+
+    @staticmethod
+    def test_default(table1: Table) -> None:
+        table1.schema = "shop"
+        partition = Partition("products_other", schema="archive", comment="The rest")
+        table1.add_partition(partition)
+        expected = (
+            "-- The rest\n"
+            'CREATE TABLE "archive"."products_other" PARTITION OF "shop"."products" DEFAULT;'
+        )
+        assert render_partition(partition) == expected
@@ -0,0 +1,209 @@
+from textwrap import dedent
+
+import pytest
+
+from pydbml import PyDBML
+from pydbml.classes import Column, Reference, Table
+from pydbml.database import Database
+from pydbml.renderer.sql.default import DefaultSQLRenderer
+from pydbml.renderer.sql.default.phased import (
+    PhasedSQL,
+    get_constraint_name,
+    get_foreign_keys,
+    render_foreign_key,
+    render_unique_constraints,
+)
+
+
+SOURCE = '''
+Enum status {
+    active
+    blocked
+}
+
+Table users {
+    id int [pk]
+    email varchar [unique]
+    status status
+    indexes {
+        status [name: 'users_status', concurrently]
+    }
+}
+
+Table orders [partition by: range(created_at)] {
+    id int
+    user_id int [ref: > users.id]
+    created_at timestamp
+    indexes {
+        (id, created_at) [pk]
+        user_id
+    }
+    partitions {
+        orders_2024 [values: `FROM ('2024-01-01') TO ('2025-01-01')`]
+    }
+}
+
+Table tags {
+    id int [pk]
+    name varchar
+}
+
+Ref user_tags: users.id <> tags.id
+'''
+
+
+@pytest.fixture
+def phased() -> PhasedSQL:
+    return PyDBML(SOURCE).phased_sql
+
+
+def test_pre_data(phased: PhasedSQL) -> None:
+    expected = dedent('''\
+        CREATE TYPE "status" AS ENUM (
+          'active',
+          'blocked'
+        );
+
+        CREATE TABLE "users" (
+          "id" int PRIMARY KEY,
+          "email" varchar,
+          "status" "status"
+        );
+
+        CREATE TABLE "orders" (
+          "id" int,
+          "user_id" int,
+          "created_at" timestamp,
+          PRIMARY KEY ("id", "created_at")
+        ) PARTITION BY RANGE ("created_at");
+
+        CREATE TABLE "orders_2024" PARTITION OF "orders" FOR VALUES FROM ('2024-01-01') TO ('2025-01-01');
+
+        CREATE TABLE "tags" (
+          "id" int PRIMARY KEY,
+          "name" varchar
+        );
+
+        CREATE TABLE "users_tags" (
+          "users_id" int NOT NULL,
+          "tags_id" int NOT NULL,
+          PRIMARY KEY ("users_id", "tags_id")
+        );''')
+    assert phased.pre_data == expected
+
+
+def test_post_data_indexes(phased: PhasedSQL) -> None:
+    expected = dedent('''\
+        ALTER TABLE "users" ADD UNIQUE ("email");
+
+        CREATE INDEX ON "orders" ("user_id");
+
+        -- Indexes, created concurrently, must run outside of a transaction block
+        CREATE INDEX CONCURRENTLY "users_status" ON "users" ("status");''')
+    assert phased.post_data_indexes == expected
+
+
+def test_post_data_constraints(phased: PhasedSQL) -> None:
+    expected = dedent('''\
+        ALTER TABLE "orders" ADD CONSTRAINT "orders_user_id_fkey" FOREIGN KEY ("user_id") REFERENCES "users" ("id");
+
+        ALTER TABLE "users_tags" ADD CONSTRAINT "users_tags_users_id_fkey" FOREIGN KEY ("users_id") REFERENCES "users" ("id") NOT VALID;
+
+        ALTER TABLE "users_tags" ADD CONSTRAINT "users_tags_tags_id_fkey" FOREIGN KEY ("tags_id") REFERENCES "tags" ("id") NOT VALID;
+
+        ALTER TABLE "users_tags" VALIDATE CONSTRAINT "users_tags_users_id_fkey";
+
+        ALTER TABLE "users_tags" VALIDATE CONSTRAINT "users_tags_tags_id_fkey";''')
+    assert phased.post_data_constraints == expected
+
+
+def test_empty() -> None:
+    assert DefaultSQLRenderer.render_db_phased(Database()) == PhasedSQL('', '', '')
+
+
+class TestGetForeignKeys:
+    @staticmethod
+    def test_many_to_one(reference1: Reference) -> None:
+        assert get_foreign_keys(reference1) == [(reference1.col1, reference1.col2)]
+
+    @staticmethod
+    def test_one_to_many(reference1: Reference) -> None:
+        reference1.type = '<'
+        assert get_foreign_keys(reference1) == [(reference1.col2, reference1.col1)]
+
+
+class TestGetConstraintName:
+    @staticmethod
+    def test_named(reference1: Reference) -> None:
+        reference1.name = 'fk_name'
+        assert get_constraint_name(reference1, reference1.col1) == 'fk_name'
+
+    @staticmethod
+    def test_many_to_many(reference1: Reference) -> None:
+        reference1.name = 'fk_name'
+        reference1.type = '<>'
+        source_col = reference1.join_table.columns[:1]
+        assert get_constraint_name(reference1, source_col) == 'orders_products_orders_product_id_fkey'
+
+    @staticmethod
+    def test_generated(reference1: Reference) -> None:
+        expected = f'{reference1.table1.name}_{reference1.col1[0].name}_fkey'
+        assert get_constraint_name(reference1, reference1.col1) == expected
+
+    @staticmethod
+    def test_long(reference1: Reference) -> None:
+        reference1.col1[0].name = 'c' * 100
+        name = get_constraint_name(reference1, reference1.col1)
+        assert len(name) == 63
+        assert name == f'{reference1.table1.name}_{"c" * 51}_fkey'
+
+    @staticmethod
+    def test_used_names(reference1: Reference) -> None:
+        expected = f'{reference1.table1.name}_{reference1.col1[0].name}_fkey'
+        used_names = {expected, f'{expected}1'}
+        assert get_constraint_name(reference1, reference1.col1, used_names) == f'{expected}2'
+        assert f'{expected}2' in used_names
+        reference1.name = 'fk_name'
+        assert get_constraint_name(reference1, reference1.col1, used_names) == 'fk_name'
+        assert 'fk_name' in used_names
+
+
+def test_duplicate_generated_names() -> None:
+    source = """
+    Table users {
+        id integer [pk]
+    }
+    Table orders {
+        id integer [pk]
+        user_id integer
+    }
+    Ref: orders.user_id > users.id
+    Ref: orders.user_id > users.id [delete: cascade]
+    Ref orders_user_id_fkey1: orders.id > users.id
+    """
+    constraints = PyDBML(source).phased_sql.post_data_constraints
+    assert 'ADD CONSTRAINT "orders_user_id_fkey" FOREIGN KEY ("user_id")' in constraints
+    assert 'ADD CONSTRAINT "orders_user_id_fkey2" FOREIGN KEY ("user_id")' in constraints
+    assert 'ADD CONSTRAINT "orders_user_id_fkey1" FOREIGN KEY ("id")' in constraints
+
+
+class TestRenderForeignKey:
+    @staticmethod
+    def test_not_valid(reference1: Reference) -> None:
+        reference1.name = 'fk'
+        reference1.on_delete = 'cascade'
+        add, validate = render_foreign_key(reference1, reference1.col1, reference1.col2)
+        assert add == (
+            'ALTER TABLE "orders" ADD CONSTRAINT "fk" FOREIGN KEY ("product_id")'
+            ' REFERENCES "products" ("id") ON DELETE CASCADE NOT VALID;'
+        )
+        assert validate == 'ALTER TABLE "orders" VALIDATE CONSTRAINT "fk";'
+
+
+def test_render_unique_constraints() -> None:
+    table = Table(
+        'users',
+        schema='auth',
+        columns=[Column('id', 'int', pk=True), Column('email', 'varchar', unique=True)]
+    )
+    assert render_unique_constraints(table) == ['ALTER TABLE "auth"."users" ADD UNIQUE ("email");']
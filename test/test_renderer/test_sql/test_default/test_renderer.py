@@ -1,5 +1,7 @@
 from unittest.mock import Mock, patch
 
+from pydbml import PyDBML
+from pydbml.classes import Table
 from pydbml.renderer.sql.default import DefaultSQLRenderer
 
 
@@ -13,7 +15,7 @@ def test_render() -> None:
 def test_render_db() -> None:
     db = Mock(
         refs=(Mock(inline=False), Mock(inline=False), Mock(inline=True)),
-        tables=[Mock(), Mock(), Mock()],
+        tables=[Mock(indexes=[]), Mock(indexes=[]), Mock(indexes=[])],
         enums=[Mock(), Mock()],
     )
 
@@ -27,3 +29,56 @@ def test_render_db() -> None:
             result = DefaultSQLRenderer.render_db(db)
             assert reorder_mock.called
             assert render_mock.call_count == 7
+
+
+def test_render_db_concurrent_indexes() -> None:
+    db = Mock(
+        refs=(),
+        tables=[
+            Mock(indexes=[
+                Mock(concurrently=True, pk=False, table=None),
+                Mock(concurrently=False, pk=False, table=None)
+            ]),
+            Mock(indexes=[Mock(concurrently=True, pk=False, table=None)]),
+            # partitioned table, its indexes are not created concurrently
+            Mock(indexes=[Mock(concurrently=True, pk=False, table=Mock(partition_by=Mock()))]),
+        ],
+        enums=[],
+    )
+
+    with patch(
+        "pydbml.renderer.sql.default.renderer.reorder_tables_for_sql",
+        Mock(return_value=db.tables),
+    ):
+        with patch.object(
+            DefaultSQLRenderer,
+            "render",
+            Mock(side_effect=["table1", "table2", "table3", "index1", "index2"])
+        ) as render_mock:
+            result = DefaultSQLRenderer.render_db(db)
+            assert render_mock.call_count == 5
+            assert result == (
+                "table1\n\ntable2\n\ntable3\n\n"
+                "-- Indexes, created concurrently, must run outside of a transaction block\n"
+                "index1\n\nindex2"
+            )
+
+
+def test_render_db_custom_table_renderer() -> None:
+    db = PyDBML(
+        'Table users {\n  id int [pk]\n  email varchar [unique]\n'
+        '  indexes {\n    email [concurrently]\n  }\n}'
+    )
+    default = DefaultSQLRenderer.model_renderers[Table]
+
+    def render_table(model: Table) -> str:
+        return '-- custom\n' + default(model)
+
+    with patch.dict(DefaultSQLRenderer.model_renderers, {Table: render_table}):
+        sql = db.sql
+        pre_data = DefaultSQLRenderer.render_db_phased(db).pre_data
+    assert sql.startswith('-- custom\nCREATE TABLE "users"')
+    assert sql.count('CONCURRENTLY') == 1
+    assert sql.endswith('CREATE INDEX CONCURRENTLY ON "users" ("email");')
+    assert pre_data.startswith('-- custom\nCREATE TABLE "users"')
+    assert 'UNIQUE' not in pre_data
@@ -5,7 +5,7 @@ import pytest
 
 import pydbml.renderer.sql.default.table
 from pydbml import Database
-from pydbml.classes import Table, Column, Reference, Note
+from pydbml.classes import Table, Column, Reference, Note, Index, Partition, PartitionKey
 from pydbml.exceptions import UnknownDatabaseError
 from pydbml.renderer.sql.default.table import (
     get_references_for_sql,
@@ -13,7 +13,10 @@ from pydbml.renderer.sql.default.table import (
     create_components,
     render_column_notes,
     create_body,
+    get_indexes_for_sql,
+    render_table,
 )
+from pydbml.renderer.sql.default.utils import table_sql_scope
 
 
 @pytest.fixture
@@ -135,6 +138,28 @@ class TestCreateBody:
                 assert get_inline_mock.called
                 assert render_mock.call_count == 4
 
+    @staticmethod
+    def test_pre_data(table1: Table, table2: Table, inline_refs) -> None:
+        table1.columns[1].unique = True
+        expected = (
+            '  "id" integer PRIMARY KEY,\n'
+            '  "name" varchar'
+        )
+        assert create_body(table1, post_data=False) == expected
+        assert table1.columns[1].unique
+
+    @staticmethod
+    def test_pre_data_renderer(table1: Table) -> None:
+        table1.columns[1].unique = True
+        with patch(
+            "pydbml.renderer.sql.default.renderer.DefaultSQLRenderer.render",
+            Mock(return_value="column"),
+        ) as render_mock:
+            assert create_body(table1, post_data=False) == '  column,\n  column'
+            rendered = render_mock.call_args_list[1].args[0]
+            assert rendered.name == "name"
+            assert not rendered.unique
+
     @staticmethod
     def test_composite_pk(table1: Table) -> None:
         table1.add_column(Column("id2", "integer", pk=True))
@@ -167,7 +192,7 @@ class TestCreateComponents:
 
     @staticmethod
     def test_indexes(table1: Table) -> None:
-        table1.indexes = [Mock(pk=False), Mock(pk=True)]
+        table1.indexes = [Mock(pk=False, concurrently=False), Mock(pk=True)]
         with patch(
             "pydbml.renderer.sql.default.table.create_body", Mock(return_value="body")
         ) as create_body_mock:
@@ -179,6 +204,62 @@ class TestCreateComponents:
                 assert create_components(table1) == expected
 
 
+    @staticmethod
+    def test_partitions(table1: Table) -> None:
+        table1.partition_by = PartitionKey("hash", [table1.columns[0]])
+        table1.add_partition(Partition("products_0", values="WITH (MODULUS 2, REMAINDER 0)"))
+        table1.add_partition(Partition("products_1", values="WITH (MODULUS 2, REMAINDER 1)"))
+        with patch(
+            "pydbml.renderer.sql.default.table.create_body", Mock(return_value="body")
+        ):
+            expected = (
+                'CREATE TABLE "products" (\nbody\n) PARTITION BY HASH ("id");\n'
+                '\n'
+                'CREATE TABLE "products_0" PARTITION OF "products" FOR VALUES WITH (MODULUS 2, REMAINDER 0);\n'
+                '\n'
+                'CREATE TABLE "products_1" PARTITION OF "products" FOR VALUES WITH (MODULUS 2, REMAINDER 1);'
+            )
+            assert create_components(table1) == expected
+
+
+class TestGetIndexesForSQL:
+    @staticmethod
+    def test_all(table1: Table) -> None:
+        indexes = [
+            Mock(pk=False, concurrently=False),
+            Mock(pk=True, concurrently=False),
+            Mock(pk=False, concurrently=True, table=None),
+        ]
+        table1.indexes = indexes
+        assert get_indexes_for_sql(table1) == [indexes[0], indexes[2]]
+
+    @staticmethod
+    def test_skip_concurrent(table1: Table) -> None:
+        indexes = [
+            Mock(pk=False, concurrently=False),
+            Mock(pk=True, concurrently=False),
+            Mock(pk=False, concurrently=True, table=None),
+        ]
+        table1.indexes = indexes
+        assert get_indexes_for_sql(table1, concurrent=False) == [indexes[0]]
+
+    @staticmethod
+    def test_partitioned(table1: Table) -> None:
+        index = Index([table1.columns[1]], concurrently=True)
+        table1.add_index(index)
+        assert get_indexes_for_sql(table1, concurrent=False) == []
+        table1.partition_by = PartitionKey("list", [table1.columns[1]])
+        assert get_indexes_for_sql(table1, concurrent=False) == [index]
+        assert index.sql == 'CREATE INDEX ON "products" ("name");'
+
+    @staticmethod
+    def test_table_sql_complete(table1: Table) -> None:
+        table1.add_index(Index([table1.columns[1]], concurrently=True))
+        assert table1.sql.endswith('CREATE INDEX CONCURRENTLY ON "products" ("name");')
+        with table_sql_scope(concurrent=False):
+            assert 'CONCURRENTLY' not in table1.sql
+
+
 class TestRenderColumnNotes:
     @staticmethod
     def test_notes(table1: Table) -> None:
@@ -198,6 +279,22 @@ class TestRenderColumnNotes:
         assert render_column_notes(table1) == ""
 
 
+def test_render_table_scope(table1: Table) -> None:
+    table1.note = Note("Table note")
+    table1.add_index(Index([table1.columns[1]]))
+    expected = (
+        'CREATE TABLE "products" (\n'
+        '  "id" integer PRIMARY KEY,\n'
+        '  "name" varchar\n'
+        ');\n'
+        '\n'
+        'COMMENT ON TABLE "products" IS \'Table note\';'
+    )
+    with table_sql_scope(post_data=False):
+        assert render_table(table1) == expected
+    assert 'CREATE INDEX ON "products" ("name");' in render_table(table1)
+
+
 def test_render_table(table1: Table) -> None:
     table1.note = Mock(sql="-- Simple note")
     with patch(
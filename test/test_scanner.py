@@ -0,0 +1,163 @@
+import codecs
+import gzip
+import os
+
+from pathlib import Path
+from unittest import TestCase
+
+from pydbml import PyDBML
+from pydbml.parser.scanner import parse_table_name
+from pydbml.parser.scanner import scan_blocks
+
+
+TEST_DATA_PATH = Path(os.path.abspath(__file__)).parent / 'test_data'
+
+
+def kinds(source):
+    return [(b.kind, source[b.start:b.end]) for b in scan_blocks(source)]
+
+
+class TestScanBlocks(TestCase):
+    def test_braces_in_strings_and_comments(self) -> None:
+        source = '''
+Table a [note: '}'] {
+    id int [note: "{"] // }
+    /* { */
+    name varchar [default: `'}'`]
+    Note: \'\'\'
+    }}}
+    \'\'\'
+}
+Enum e {
+    x
+}'''
+        result = kinds(source)
+        self.assertEqual([k for k, _ in result], ['table', 'enum'])
+        self.assertTrue(result[0][1].startswith('Table a'))
+        self.assertTrue(result[0][1].endswith("'''\n}"))
+        self.assertEqual(result[1][1], 'Enum e {\n    x\n}')
+
+    def test_refs(self) -> None:
+        source = '''Ref: a.id > b.id
+Ref name: a.x < b.y [
+    delete: cascade
+]
+Ref name {
+    a.id - b.id
+}
+'''
+        result = kinds(source)
+        self.assertEqual([k for k, _ in result], ['ref', 'ref', 'ref'])
+        self.assertEqual(result[0][1], 'Ref: a.id > b.id')
+        self.assertEqual(result[1][1], 'Ref name: a.x < b.y [\n    delete: cascade\n]')
+        self.assertEqual(result[2][1], 'Ref name {\n    a.id - b.id\n}')
+
+    def test_all_kinds(self) -> None:
+        source = '''Project p { database_type: 'PostgreSQL' }
+TableGroup g { a }
+Note n { 'text' }
+table a { id int }
+'''
+        self.assertEqual(
+            [k for k, _ in kinds(source)],
+            ['project', 'table_group', 'note', 'table']
+        )
+
+    def test_unknown(self) -> None:
+        source = 'wrong text\nTable a {\n  id int\n}'
+        result = kinds(source)
+        self.assertEqual(result[0], (None, 'wrong text'))
+        self.assertEqual(result[1][0], 'table')
+
+    def test_unterminated(self) -> None:
+        source = 'Table a {\n  id int\n'
+        result = list(scan_blocks(source))
+        self.assertEqual(result[0].end, len(source))
+
+
+class TestParseTableName(TestCase):
+    def test_names(self) -> None:
+        for header, expected in (
+            ('Table users {', ('public', 'users', None)),
+            ('Table "my table" {', ('public', 'my table', None)),
+            ('Table myschema.users {', ('myschema', 'users', None)),
+            ('Table "my schema" . "users" as U [note: "x"] {', ('my schema', 'users', 'U')),
+            ('TABLE users AS "u 1" {', ('public', 'users', 'u 1')),
+        ):
+            with self.subTest(header=header):
+                source = header + '\n  id int\n}'
+                block = next(scan_blocks(source))
+                name = parse_table_name(source, block)
+                self.assertEqual((name.schema, name.name, name.alias), expected)
+
+
+class TestOutline(TestCase):
+    def test_outline(self) -> None:
+        source = '''Project "my project" {
+    database_type: 'PostgreSQL'
+}
+
+enum myschema.status {
+    active
+}
+
+// "Table fake {"
+Table "my schema"."users" as U {
+    id integer [note: 'Table fake {']
+}
+Table posts { id integer }
+Ref: posts.id > U.id
+Ref fk_name {
+    posts.id - U.id
+}
+TableGroup g1 {
+    posts
+}
+Note sticky {
+    'text'
+}
+'''
+        result = PyDBML.outline(source)
+        self.assertEqual(
+            [(e.kind, e.schema, e.name, e.alias, e.line) for e in result],
+            [
+                ('project', None, 'my project', None, 1),
+                ('enum', 'myschema', 'status', None, 5),
+                ('table', 'my schema', 'users', 'U', 10),
+                ('table', 'public', 'posts', None, 13),
+                ('ref', None, None, None, 14),
+                ('ref', None, 'fk_name', None, 15),
+                ('table_group', None, 'g1', None, 18),
+                ('note', None, 'sticky', None, 21),
+            ]
+        )
+        self.assertEqual(result[2].full_name, 'my schema.users')
+        self.assertEqual(result[4].full_name, None)
+        self.assertEqual(source[result[3].start:result[3].end], 'Table posts { id integer }')
+
+    def test_bytes_offsets(self) -> None:
+        source = 'Note {\n  \'Заметка\'\n}\n\nTable "таблица" {\n  id int\n}\nTable t2 { id int }\n'
+        data = source.encode('utf-8')
+        by_chars = PyDBML.outline(source)
+        by_bytes = PyDBML.outline(data)
+        self.assertEqual(
+            [data[e.start:e.end].decode('utf-8') for e in by_bytes],
+            [source[e.start:e.end] for e in by_chars]
+        )
+        self.assertNotEqual(by_bytes[1].start, by_chars[1].start)
+        self.assertEqual(by_bytes[1].name, 'таблица')
+        self.assertEqual(by_bytes[2].line, 8)
+
+    def test_bytes_bom_gzip(self) -> None:
+        data = codecs.BOM_UTF8 + 'Table "таблица" {\n  id int\n}\n'.encode('utf-8')
+        for source in (data, bytearray(data), memoryview(data), gzip.compress(data)):
+            with self.subTest(source=type(source)):
+                entry, = PyDBML.outline(source)
+                self.assertEqual((entry.start, entry.end), (3, len(data) - 1))
+
+    def test_matches_parser(self) -> None:
+        with open(TEST_DATA_PATH / 'integration1.dbml') as f:
+            source = f.read()
+        db = PyDBML.parse(source)
+        tables = [e.full_name for e in PyDBML.outline(source) if e.kind == 'table']
+        self.assertEqual(tables, [t.full_name for t in db.tables])
@@ -0,0 +1,103 @@
+import os
+
+from pathlib import Path
+from unittest import TestCase
+
+from pydbml import PyDBML
+
+
+TEST_DATA_PATH = Path(os.path.abspath(__file__)).parent / 'test_data'
+
+
+SOURCE = '''
+Table countries {
+    code varchar [pk]
+}
+
+Table users as U {
+    id integer [pk]
+    country_code varchar [ref: > countries.code]
+}
+
+Table orders {
+    id integer [pk]
+    user_id integer
+}
+
+Table order_items {
+    order_id integer [ref: > orders.id]
+    product_id integer
+}
+
+Table products {
+    id integer [pk, ref: < order_items.product_id]
+}
+
+Table audit.log {
+    id integer
+}
+
+Ref: orders.user_id > U.id
+
+TableGroup shop {
+    orders
+    order_items
+    products
+}
+
+TableGroup audit {
+    audit.log
+}
+'''
+
+
+def names(db):
+    return [t.full_name for t in db.tables]
+
+
+class TestSelectiveParse(TestCase):
+    def test_glob(self) -> None:
+        db = PyDBML.parse(SOURCE, table_filter='public.order*')
+        self.assertEqual(names(db), ['public.orders', 'public.order_items'])
+        self.assertEqual(len(db.refs), 1)
+        self.assertIs(db.refs[0].col1[0].table, db['public.order_items'])
+        self.assertEqual(len(db.table_groups), 1)
+        self.assertEqual(db.table_groups[0].items, [db['public.orders'], db['public.order_items']])
+
+    def test_predicate(self) -> None:
+        db = PyDBML.parse(SOURCE, table_filter=lambda name: name.startswith('audit.'))
+        self.assertEqual(names(db), ['audit.log'])
+        self.assertEqual(db.refs, [])
+        self.assertEqual([g.name for g in db.table_groups], ['audit'])
+
+    def test_include_referenced(self) -> None:
+        db = PyDBML.parse(SOURCE, table_filter='public.orders', include_referenced=True)
+        self.assertEqual(names(db), ['public.countries', 'public.users', 'public.orders'])
+        self.assertEqual(len(db.refs), 2)
+
+    def test_include_referenced_backward_inline(self) -> None:
+        # the reference is defined in the products table, which is not selected
+        db = PyDBML.parse(SOURCE, table_filter='public.order_items', include_referenced=True)
+        self.assertEqual(
+            names(db),
+            ['public.countries', 'public.users', 'public.orders', 'public.order_items', 'public.products']
+        )
+        self.assertEqual(len(db.refs), 4)
+
+    def test_same_as_full_parse(self) -> None:
+        with open(TEST_DATA_PATH / 'integration1.dbml') as f:
+            source = f.read()
+        self.assertEqual(
+            PyDBML.parse(source, table_filter='*').dbml,
+            PyDBML.parse(source).dbml
+        )
+
+    def test_parse_file(self) -> None:
+        db = PyDBML.parse_file(TEST_DATA_PATH / 'general.dbml', table_filter='public.orders')
+        self.assertEqual(names(db), ['public.orders'])
+
+    def test_wrong_arguments(self) -> None:
+        with self.assertRaises(TypeError):
+            PyDBML.parse(SOURCE, table_filter=1)
+        with self.assertRaises(ValueError):
+            PyDBML.parse(SOURCE, table_filter='*', lazy=True)
@@ -0,0 +1,94 @@
+import os
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from threading import Barrier
+from unittest import TestCase
+
+from pydbml import PyDBML
+
+
+TEST_DATA_PATH = Path(os.path.abspath(__file__)).parent / 'test_data'
+
+THREADS = 8
+ROUNDS = 4
+
+
+def parse(source: str, mode: str) -> str:
+    if mode == 'lazy':
+        db = PyDBML.parse(source, lazy=True)
+    elif mode == 'selective':
+        db = PyDBML.parse(source, table_filter='*')
+    elif mode == 'packrat':
+        db = PyDBML.parse(source, packrat=True)
+    elif mode == 'recovering':
+        db, _ = PyDBML.parse_with_diagnostics(source)
+    else:
+        db = PyDBML.parse(source)
+    return db.sql + db.dbml
+
+
+class TestConcurrentParsing(TestCase):
+    def setUp(self) -> None:
+        paths = [
+            *TEST_DATA_PATH.glob('*.dbml'),
+            *(TEST_DATA_PATH / 'docs').glob('*.dbml'),
+        ]
+        self.sources = {}
+        for path in sorted(paths):
+            if not path.name.startswith('wrong'):
+                self.sources[path.name] = path.read_text()
+
+    def run_concurrently(self, modes, rounds: int = ROUNDS) -> None:
+        jobs = [
+            (name, mode)
+            for name in self.sources
+            for mode in modes
+        ] * rounds
+        expected = {
+            (name, mode): parse(self.sources[name], mode)
+            for name in self.sources
+            for mode in modes
+        }
+        barrier = Barrier(THREADS)
+
+        def job(args):
+            name, mode = args
+            return parse(self.sources[name], mode)
+
+        def start(_):
+            # start all workers at once
+            barrier.wait()
+
+        with ThreadPoolExecutor(THREADS) as executor:
+            list(executor.map(start, range(THREADS)))
+            results = list(executor.map(job, jobs))
+        for args, result in zip(jobs, results):
+            self.assertEqual(result, expected[args], args)
+
+    def test_parse(self) -> None:
+        self.run_concurrently(['default'])
+
+    def test_parse_modes(self) -> None:
+        self.run_concurrently(['default', 'lazy', 'selective', 'recovering', 'packrat'], rounds=1)
+
+    def test_shared_grammar_not_modified(self) -> None:
+        from pydbml.parser.parser import table
+
+        def snapshot(root):
+            result = {}
+            stack = [root]
+            while stack:
+                element = stack.pop()
+                if id(element) in result:
+                    continue
+                children = list(getattr(element, 'exprs', []))
+                if getattr(element, 'expr', None) is not None:
+                    children.append(element.expr)
+                result[id(element)] = (element.streamlined, [id(c) for c in children])
+                stack.extend(children)
+            return result
+
+        before = snapshot(table)
+        PyDBML(self.sources['general.dbml'])
+        self.assertEqual(snapshot(table), before)
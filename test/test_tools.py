@@ -3,7 +3,7 @@ from unittest import TestCase
 import pytest
 
 from pydbml.classes import Note
-from pydbml.tools import remove_indentation, doublequote_string
+from pydbml.tools import remove_indentation, doublequote_string, intern_str
 from pydbml.renderer.sql.default.utils import comment_to_sql
 from pydbml.tools import indent
 from pydbml.renderer.dbml.default.utils import note_option_to_dbml, comment_to_dbml
@@ -129,3 +129,14 @@ class TestDoublequoteString:
     def test_multiline() -> None:
         with pytest.raises(ValueError):
             doublequote_string('line1\nline2')
+
+
+class TestInternStr(TestCase):
+    def test_str(self) -> None:
+        val = ''.join(['var', 'char'])
+        self.assertIs(intern_str(val), intern_str('varchar'))
+
+    def test_other(self) -> None:
+        self.assertIsNone(intern_str(None))
+        val = Note('varchar')
+        self.assertIs(intern_str(val), val)